@@ -6,3 +6,17 @@ from .podcast import Podcast
 from .playlist import Playlist
 from .usuario import Usuario
 from .analises import Analises
+from .catalogo import CatalogoDeMidia
+from .placar import Placar
+from .contadores import Contadores
+from .analises_vetoriais import AnalisesVetoriais
+from .reproducao_em_lote import ReproducaoEmLote
+from .historico import HistoricoDeReproducao
+from .contadores import ContadorFragmentado
+from .reproducao_concorrente import ReproducaoConcorrente
+from .relatorio import RelatorioIncremental
+from .instrumentacao import Instrumentacao
+from .busca import IndiceDeBusca
+from .recomendacao import Recomendador
+from .vigia import VigiaDeDados
+from .sessao import SessaoDeComandos
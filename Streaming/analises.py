@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+
 # Importações apenas para tipos/atributos usados nas análises
 from .musica import Musica
 from .playlist import Playlist
@@ -22,14 +24,15 @@ class Analises:
         Retorna as 'top_n' músicas com mais reproduções.
         - Se 'top_n' <= 0 ou 'musicas' vazia/None, retorna [].
         - Empates: desempata por título (case-insensitive).
+        - Usa heap: O(n log top_n), sem ordenar a lista inteira.
         """
         if not musicas or top_n <= 0:
             return []
-        ordenadas = sorted(
+        return heapq.nsmallest(
+            top_n,
             musicas,
             key=lambda m: (-getattr(m, "reproducoes", 0), getattr(m, "titulo", "").lower())
         )
-        return ordenadas[:top_n]
 
     @staticmethod
     def playlist_mais_popular(playlists: list[Playlist]) -> Playlist | None:
@@ -59,6 +62,18 @@ class Analises:
             key=lambda u: (len(getattr(u, "historico", [])), getattr(u, "nome", "").lower())
         )
 
+    @staticmethod
+    def playlists_duplicadas(playlists: list[Playlist]) -> list[list[Playlist]]:
+        """
+        Grupos de playlists iguais (mesmo usuário, nome e títulos; ver Playlist.__eq__).
+        - Agrupa pelo hash (impressão digital) e só compara dentro de cada grupo: O(n) esperado.
+        - Retorna só grupos com 2 ou mais playlists, na ordem da primeira ocorrência.
+        """
+        grupos: dict[Playlist, list[Playlist]] = {}
+        for p in playlists or []:
+            grupos.setdefault(p, []).append(p)
+        return [g for g in grupos.values() if len(g) > 1]
+
     @staticmethod
     def media_avaliacoes(musicas: list[Musica]) -> dict[str, float]:
         """
@@ -66,12 +81,19 @@ class Analises:
         - Retorna dict: {titulo: media}.
         - Ignora músicas sem avaliações válidas.
         - Considera somente notas inteiras no intervalo [0, 5].
+        - Usa os agregados mantidos por Musica.avaliar (O(1) por música) quando existem.
         """
         resultados: dict[str, float] = {}
         if not musicas:
             return resultados
 
         for m in musicas:
+            qtd = getattr(m, "qtd_avaliacoes", None)
+            if qtd is not None:
+                if qtd:
+                    resultados[getattr(m, "titulo", "")] = m.soma_avaliacoes / qtd
+                continue
+
             avals = getattr(m, "avaliacoes", [])
             # Filtra apenas inteiros entre 0 e 5
             vals: list[int] = []
@@ -93,12 +115,12 @@ class Analises:
     def total_reproducoes(usuarios: list[Usuario]) -> int:
         """
         Total de reproduções do sistema.
-        - Estratégia principal: somar reproduções das mídias registradas em
-          'ArquivoDeMidia.registroMidia' (fonte única e consistente quando mantida).
+        - Estratégia principal: total mantido em 'ArquivoDeMidia.contadores' (O(1)),
+          igual à soma das reproduções das mídias registradas em 'registroMidia'.
         - Fallback: se ocorrer problema (ex.: atributo ausente), soma o tamanho
           dos históricos dos usuários (estimativa simples para não falhar).
         """
         try:
-            return sum(getattr(m, "reproducoes", 0) for m in getattr(ArquivoDeMidia, "registroMidia", []))
+            return ArquivoDeMidia.contadores.reproducoes
         except Exception:
             return sum(len(getattr(u, "historico", [])) for u in (usuarios or []))
@@ -0,0 +1,267 @@
+# Streaming/analises_vetoriais.py
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from operator import is_
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .colunas import MusicaColunar
+
+try:  # NumPy é opcional: sem ele, os mesmos cálculos rodam em laços sobre 'array'
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ColunasDeMusicas:
+    """
+    Colunas de uma lista de músicas (uma posição por música), extraídas sob demanda:
+    cada análise lê só as colunas de que precisa.
+    - Músicas comuns: cada coluna é lida dos objetos no primeiro uso e guardada
+      (instantâneo; reaproveitar a instância reaproveita os valores).
+    - Só MusicaColunar: guarda apenas as linhas da loja; cada coluna é copiada direto
+      da loja a cada uso (valores sempre atuais, sem passar pelas propriedades).
+    - Números em array('q'); artista/gênero como códigos na ordem de aparição.
+    """
+
+    def __init__(self, musicas: list):
+        """Reconhece o tipo das músicas; nenhuma coluna é lida aqui."""
+        self.musicas = list(musicas)         # posição -> objeto original
+        self._colunas: dict[str, object] = {}
+        self.linhas = None                   # linhas na loja (só MusicaColunar)
+        if self.musicas and set(map(type, self.musicas)) == {MusicaColunar}:
+            self.linhas = array("q", [m._linha for m in self.musicas])
+
+    def _numerica(self, nome: str, padrao: int = 0) -> array:
+        if self.linhas is not None:
+            return array("q", map(MusicaColunar._loja.numericas[nome].__getitem__, self.linhas))
+        col = self._colunas.get(nome)
+        if col is None:
+            try:
+                col = array("q", [getattr(m, nome) for m in self.musicas])
+            except AttributeError:
+                col = array("q", [getattr(m, nome, padrao) for m in self.musicas])
+            self._colunas[nome] = col
+        return col
+
+    def _textos(self, nome: str) -> list[str]:
+        if self.linhas is not None:
+            loja = MusicaColunar._loja
+            if nome == "titulo":
+                return list(map(loja.titulos.__getitem__, self.linhas))
+            col = loja.codificadas[nome]
+            return list(map(col.valores.__getitem__, map(col.codigos.__getitem__, self.linhas)))
+        col = self._colunas.get(nome)
+        if col is None:
+            col = self._colunas[nome] = [getattr(m, nome, "") for m in self.musicas]
+        return col
+
+    def _codificar(self, nome: str) -> tuple[array, list[str]]:
+        """(código por posição, rótulos na ordem de aparição) da coluna de texto."""
+        textos = self._textos(nome)
+        rotulos = list(dict.fromkeys(textos))
+        codigos = dict(zip(rotulos, range(len(rotulos))))
+        return array("q", map(codigos.__getitem__, textos)), rotulos
+
+    @property
+    def titulos(self) -> list[str]:
+        return self._textos("titulo")
+
+    @property
+    def reproducoes(self) -> array:
+        return self._numerica("reproducoes")
+
+    @property
+    def duracao(self) -> array:
+        return self._numerica("duracao")
+
+    @property
+    def qtd_avaliacoes(self) -> array:
+        return self._numerica("qtd_avaliacoes")
+
+    @property
+    def soma_avaliacoes(self) -> array:
+        return self._numerica("soma_avaliacoes")
+
+    @property
+    def histograma(self) -> list[array]:
+        """Seis colunas: quantidade de notas 0..5 de cada música."""
+        if self.linhas is not None:
+            return [self._numerica(f"hist{n}") for n in range(6)]
+        col = self._colunas.get("histograma")
+        if col is None:
+            hists = [getattr(m, "histograma", None) or (0,) * 6 for m in self.musicas]
+            col = self._colunas["histograma"] = [array("q", [h[n] for h in hists]) for n in range(6)]
+        return col
+
+    @property
+    def generos(self) -> tuple[array, list[str]]:
+        """(código do gênero por posição, gêneros na ordem de aparição)."""
+        return self._codificar("genero")
+
+    @property
+    def artistas(self) -> tuple[array, list[str]]:
+        """(código do artista por posição, artistas na ordem de aparição)."""
+        return self._codificar("artista")
+
+    def __len__(self) -> int:
+        """Quantidade de músicas."""
+        return len(self.musicas)
+
+
+class AnalisesVetoriais:
+    """
+    Versão em lote de Analises: calcula sobre colunas em vez de getattr por objeto.
+    - Mesmos resultados de Analises para top-N, médias e totais.
+    - Relatórios extras: reproduções por gênero/artista, percentis de duração
+      e distribuição das notas.
+    - usar_numpy: True usa NumPy (se instalado); False força os laços em Python.
+    - Listas só de MusicaColunar: as linhas da loja ficam guardadas entre chamadas
+      (ver colunas()).
+    """
+
+    usar_numpy = np is not None
+    _ultima: tuple[int, ColunasDeMusicas] | None = None   # (versão da loja, colunas) da última lista colunar
+
+    @staticmethod
+    def _np() -> bool:
+        return AnalisesVetoriais.usar_numpy and np is not None
+
+    @staticmethod
+    def colunas(musicas) -> ColunasDeMusicas:
+        """
+        Aceita uma lista de músicas ou colunas já extraídas (para reaproveitar).
+        Se a lista tiver as mesmas MusicaColunar da chamada anterior (mesmos objetos, na
+        mesma ordem, e a loja não foi limpa), as linhas já conhecidas são reaproveitadas.
+        """
+        if isinstance(musicas, ColunasDeMusicas):
+            return musicas
+        musicas = musicas or []
+        ultima = AnalisesVetoriais._ultima
+        if ultima is not None and ultima[0] == MusicaColunar._loja.versao:
+            anteriores = ultima[1].musicas
+            if len(anteriores) == len(musicas) and all(map(is_, anteriores, musicas)):
+                return ultima[1]
+        col = ColunasDeMusicas(musicas)
+        AnalisesVetoriais._ultima = (MusicaColunar._loja.versao, col) if col.linhas is not None else None
+        return col
+
+    @staticmethod
+    def top_musicas_reproduzidas(musicas, top_n: int) -> list:
+        """
+        Retorna as 'top_n' músicas com mais reproduções.
+        - Empates: desempata por título (case-insensitive) e depois pela posição, como Analises.
+        - Com NumPy: partition encontra o corte e só os candidatos são ordenados.
+        """
+        col = AnalisesVetoriais.colunas(musicas)
+        n = len(col)
+        if not n or top_n <= 0:
+            return []
+        rep, titulos = col.reproducoes, col.titulos
+
+        if AnalisesVetoriais._np() and top_n < n:
+            valores = np.frombuffer(rep, dtype=np.int64)
+            corte = np.partition(valores, n - top_n)[n - top_n]   # k-ésimo maior valor
+            candidatos = np.flatnonzero(valores >= corte).tolist()
+            posicoes = sorted(candidatos, key=lambda i: (-rep[i], titulos[i].lower()))[:top_n]
+        else:
+            # tuplas (-reproduções, título, posição) comparadas em C, sem função de chave
+            negativos = map(int.__neg__, rep)
+            melhores = heapq.nsmallest(top_n, zip(negativos, map(str.lower, titulos), range(n)))
+            posicoes = [i for _, _, i in melhores]
+        return [col.musicas[i] for i in posicoes]
+
+    @staticmethod
+    def media_avaliacoes(musicas) -> dict[str, float]:
+        """Média das notas por título, ignorando músicas sem avaliações."""
+        col = AnalisesVetoriais.colunas(musicas)
+        if not len(col):
+            return {}
+        qtd, soma, titulos = col.qtd_avaliacoes, col.soma_avaliacoes, col.titulos
+        if AnalisesVetoriais._np():
+            q = np.frombuffer(qtd, dtype=np.int64)
+            idx = np.flatnonzero(q)
+            medias = (np.frombuffer(soma, dtype=np.int64)[idx] / q[idx]).tolist()
+            return {titulos[i]: m for i, m in zip(idx.tolist(), medias)}
+        return {titulos[i]: soma[i] / q for i, q in enumerate(qtd) if q}
+
+    @staticmethod
+    def total_reproducoes(midias=None) -> int:
+        """Soma das reproduções (padrão: todas as mídias de ArquivoDeMidia.registroMidia)."""
+        if midias is None:
+            midias = ArquivoDeMidia.registroMidia
+        if isinstance(midias, ColunasDeMusicas) or (midias and type(midias[0]) is MusicaColunar):
+            rep = AnalisesVetoriais.colunas(midias).reproducoes
+        else:
+            rep = array("q", (getattr(m, "reproducoes", 0) for m in midias))
+        if AnalisesVetoriais._np() and len(rep):
+            return int(np.frombuffer(rep, dtype=np.int64).sum())
+        return sum(rep)
+
+    @staticmethod
+    def _somar_por_codigo(codigos: array, valores: array, rotulos: list[str]) -> dict[str, int]:
+        if AnalisesVetoriais._np() and len(codigos):
+            somas = np.bincount(np.frombuffer(codigos, dtype=np.int64),
+                                weights=np.frombuffer(valores, dtype=np.int64),
+                                minlength=len(rotulos))
+            return {r: int(s) for r, s in zip(rotulos, somas.tolist())}
+        somas = [0] * len(rotulos)
+        for c, v in zip(codigos, valores):
+            somas[c] += v
+        return dict(zip(rotulos, somas))
+
+    @staticmethod
+    def reproducoes_por_genero(musicas) -> dict[str, int]:
+        """Total de reproduções por gênero (na ordem em que os gêneros aparecem)."""
+        col = AnalisesVetoriais.colunas(musicas)
+        codigos, generos = col.generos
+        return AnalisesVetoriais._somar_por_codigo(codigos, col.reproducoes, generos)
+
+    @staticmethod
+    def reproducoes_por_artista(musicas) -> dict[str, int]:
+        """Total de reproduções por artista (na ordem em que os artistas aparecem)."""
+        col = AnalisesVetoriais.colunas(musicas)
+        codigos, artistas = col.artistas
+        return AnalisesVetoriais._somar_por_codigo(codigos, col.reproducoes, artistas)
+
+    @staticmethod
+    def percentis_duracao(musicas, percentis=(50, 90, 99)) -> dict[float, float]:
+        """
+        Percentis da duração (s), com interpolação linear entre posições vizinhas.
+        O caminho em Python repete as contas de numpy.percentile (método 'linear')
+        para dar exatamente os mesmos valores. Lista vazia -> {}.
+        """
+        col = AnalisesVetoriais.colunas(musicas)
+        n = len(col)
+        if not n:
+            return {}
+        duracao = col.duracao
+        if AnalisesVetoriais._np():
+            valores = np.percentile(np.frombuffer(duracao, dtype=np.int64), list(percentis)).tolist()
+            return {p: float(v) for p, v in zip(percentis, valores)}
+        ordenadas = sorted(duracao)
+        resultado = {}
+        for p in percentis:
+            q = p / 100
+            pos = n * q + (1 - q) - 1          # índice virtual do método 'linear'
+            baixo = min(max(int(pos), 0), n - 1)
+            alto = min(baixo + 1, n - 1)
+            t = pos - baixo
+            a, b = float(ordenadas[baixo]), float(ordenadas[alto])
+            valor = a + (b - a) * t
+            if t >= 0.5:
+                valor = b - (b - a) * (1 - t)
+            resultado[p] = valor
+        return resultado
+
+    @staticmethod
+    def distribuicao_avaliacoes(musicas) -> list[int]:
+        """Quantidade de notas 0, 1, ..., 5 somando todas as músicas."""
+        col = AnalisesVetoriais.colunas(musicas)
+        if not len(col):
+            return [0] * 6
+        if AnalisesVetoriais._np():
+            return [int(np.frombuffer(h, dtype=np.int64).sum()) for h in col.histograma]
+        return [sum(h) for h in col.histograma]
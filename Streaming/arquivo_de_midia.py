@@ -1,4 +1,9 @@
 # Streaming/arquivo_de_midia.py
+import sys
+
+from .catalogo import CatalogoDeMidia
+from .contadores import Contadores
+from .historico import HistoricoDeReproducao
 
 class ArquivoDeMidia:
     """
@@ -6,8 +11,17 @@ class ArquivoDeMidia:
     Define atributos e comportamentos comuns.
     """
 
-    """Lista com todas as mídias registradas (usada para buscas)."""
-    registroMidia = []  # todas as mídias criadas
+    # __slots__ vazio: os campos (titulo, artista, duracao, reproducoes, _chave) são
+    # slots de Musica/Podcast; as visões colunares (Streaming/colunas.py) herdam só o
+    # comportamento e guardam apenas o número da linha
+    __slots__ = ()
+
+    """Catálogo indexado com todas as mídias registradas (usado para buscas)."""
+    catalogo = CatalogoDeMidia()
+    registroMidia = catalogo.itens  # todas as mídias criadas (mesma lista do catálogo)
+    placares = []  # placares ao vivo avisados a cada reprodução (ver Streaming/placar.py)
+    contadores = Contadores()  # totais do sistema (reproduções e avaliações)
+    fragmentos = None  # ContadorFragmentado no modo concorrente (ver ReproducaoConcorrente)
 
     @staticmethod
     def _norm(s: str) -> str:
@@ -27,30 +41,95 @@ class ArquivoDeMidia:
             raise ValueError("Reproduções inválidas: deve ser um inteiro >= 0.")
         self.reproducoes = reproducoes
 
-        ArquivoDeMidia.registroMidia.append(self)
+        ArquivoDeMidia.catalogo.registrar(self)
+        ArquivoDeMidia.contadores.reproducoes += reproducoes
+
+    @classmethod
+    def limpar_registro(cls) -> None:
+        """Esvazia o registro de mídias, os índices do catálogo e os totais."""
+        ArquivoDeMidia.catalogo.limpar()
+        ArquivoDeMidia.contadores.zerar()
+
+    @classmethod
+    def remover_do_registro(cls, midias) -> None:
+        """Tira as mídias do catálogo e desconta as suas reproduções e notas dos totais."""
+        midias = list(midias)
+        ArquivoDeMidia.catalogo.remover(midias)
+        for midia in midias:
+            ArquivoDeMidia.contadores.descontar(midia.reproducoes, getattr(midia, "histograma", None))
 
     @classmethod
     def buscar_por_titulo(cls, titulo: str):
         """Busca mídia pelo título (case-insensitive; normaliza espaços)."""
-        t = cls._norm(titulo)
-        for m in cls.registroMidia:
-            if cls._norm(m.titulo) == t:
-                return m
-        return None
+        return ArquivoDeMidia.catalogo.buscar_por_titulo(titulo)
 
-    def reproduzir(self):
-        self.reproducoes += 1
-        print(f"Reproduzindo: '{self.titulo}' - {self.artista} ({self.duracao}s)")
+    @classmethod
+    def sugerir(cls, consulta: str, limite: int = 5) -> list:
+        """Mídias parecidas com 'consulta' (prefixo de título/artista ou erro de digitação)."""
+        return ArquivoDeMidia.catalogo.sugerir(consulta, limite)
 
+    def reproduzir(self, saida=print):
+        """
+        Soma 1 reprodução e mostra a linha "Reproduzindo: ...".
+        saida: função que recebe a linha (padrão: print); None não mostra nada.
+        No modo concorrente a reprodução vai para o fragmento da thread e só
+        aparece em 'reproducoes' na consolidação.
+        """
+        fragmentos = ArquivoDeMidia.fragmentos
+        if fragmentos is not None:
+            fragmentos.incrementar(self)
+        else:
+            self.reproducoes += 1
+            ArquivoDeMidia.contadores.reproducoes += 1
+            for placar in ArquivoDeMidia.placares:
+                placar.atualizar(self)
+        if saida is not None:
+            saida(self.linha_reproducao())
+
+    def linha_reproducao(self) -> str:
+        """Texto mostrado a cada reprodução."""
+        return f"Reproduzindo: '{self.titulo}' - {self.artista} ({self.duracao}s)"
+
+
+    def renomear(self, titulo: str, artista: str) -> None:
+        """
+        Troca título e artista (e, portanto, a chave). O código nos históricos acompanha
+        a troca; os demais índices pela chave (catálogo, playlists) devem retirar a mídia
+        antes e recolocá-la depois.
+        """
+        with HistoricoDeReproducao.trocando_chave(self):
+            self.titulo = (titulo or "").strip()
+            self.artista = (artista or "").strip()
+            self._chave = self._nova_chave()
+
+    def _nova_chave(self) -> tuple[str, str]:
+        """
+        (titulo, artista) normalizados. O artista é internado: as mídias de um mesmo
+        artista dividem uma string, e o catálogo indexa pelas strings da própria chave.
+        """
+        return (self._norm(self.titulo), sys.intern(self._norm(self.artista)))
+
+    @property
+    def chave(self) -> tuple[str, str]:
+        """
+        Identidade da mídia: (titulo, artista) normalizados.
+        Calculada uma única vez (no primeiro uso); só muda por renomear().
+        """
+        try:
+            return self._chave
+        except AttributeError:
+            self._chave = self._nova_chave()
+            return self._chave
 
     def __eq__(self, other) -> bool:
         """Compara por (titulo, artista) com normalização case-insensitive."""
         if not isinstance(other, ArquivoDeMidia):
             return NotImplemented
-        return (
-            self._norm(self.titulo) == self._norm(other.titulo)
-            and self._norm(self.artista) == self._norm(other.artista)
-        )
+        return self.chave == other.chave
+
+    def __hash__(self) -> int:
+        """Hash coerente com __eq__ (usa a chave de identidade)."""
+        return hash(self.chave)
 
     def __str__(self) -> str:
         """Resumo textual da mídia."""
@@ -0,0 +1,371 @@
+# Streaming/busca.py
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from heapq import nlargest
+
+
+def _ngramas(palavra: str, n: int = 3) -> set[str]:
+    """Trigramas de caracteres da palavra com bordas ('abc' -> ' ab', 'abc', 'bc ')."""
+    t = f" {palavra} "
+    return {t[i:i + n] for i in range(max(1, len(t) - n + 1))}
+
+
+def _contem(ids: array, i: int) -> bool:
+    """Busca binária em um array de ids crescentes."""
+    k = bisect_left(ids, i)
+    return k < len(ids) and ids[k] == i
+
+
+class _IndiceDeTextos:
+    """
+    Textos normalizados numerados (id = ordem de inserção), com:
+    - prefixo: array de ids ordenado pelo texto; os novos ficam em '_recentes' (append)
+      e só são ordenados/fundidos na próxima consulta;
+    - palavras: palavra -> ids dos textos que a contêm (a maioria das palavras aparece
+      em um texto só: o id fica em '_unicas', sem um array por palavra);
+    - vocabulário: trigrama -> array de ids de palavras, para achar as palavras
+      parecidas com uma palavra digitada errado (o vocabulário é bem menor que os textos).
+    Os textos são guardados como recebidos (o catálogo passa as suas próprias chaves).
+    """
+
+    ORCAMENTO = 4000         # ids de textos lidos dos índices invertidos por consulta
+    ORCAMENTO_VOCABULARIO = 4000   # ids de palavras lidos por palavra da consulta
+    SIMILARES = 3            # palavras do vocabulário aceitas para cada palavra da consulta
+    SIMILARIDADE_MINIMA = 0.3
+
+    def __init__(self):
+        self._textos: list[str] = []            # id de texto -> texto
+        self._ordenado = array("i")             # ids ordenados por (texto, id)
+        self._recentes = array("i")             # ids ainda fora de '_ordenado'
+        self._recentes_em_ordem = True
+        self._id_palavra: dict[str, int] = {}
+        self._palavras: list[str] = []
+        self._unicas = array("i")               # id de palavra -> id do texto (palavra em um só)
+        self._varias: dict[int, array] = {}     # id de palavra -> ids de textos (em mais de um)
+        self._ngramas: dict[str, array] = {}    # trigrama -> ids de palavras
+        self._tamanhos = array("H")             # id de texto -> quantidade de palavras
+
+    def __len__(self) -> int:
+        return len(self._tamanhos)
+
+    def adicionar(self, texto: str) -> int:
+        """Indexa o texto (já normalizado) e retorna o seu id."""
+        return self.estender([texto])
+
+    def estender(self, textos: list[str]) -> int:
+        """Indexa vários textos de uma vez; retorna o id do primeiro."""
+        inicio = len(self._tamanhos)
+        self._textos += textos
+        self._recentes.extend(range(inicio, inicio + len(textos)))
+        self._recentes_em_ordem = False
+        id_palavra, unicas, varias = self._id_palavra, self._unicas, self._varias
+        tamanhos = self._tamanhos
+        for i, t in enumerate(textos, inicio):
+            palavras = set(t.split())
+            tamanhos.append(min(len(palavras), 0xFFFF))
+            for p in palavras:
+                w = id_palavra.get(p)
+                if w is None:
+                    self._novo_vocabulo(p)
+                    unicas.append(i)
+                elif (ids := varias.get(w)) is not None:
+                    ids.append(i)
+                else:
+                    varias[w] = array("i", (unicas[w], i))
+        return inicio
+
+    def _novo_vocabulo(self, palavra: str) -> int:
+        w = self._id_palavra[palavra] = len(self._palavras)
+        self._palavras.append(palavra)
+        for g in _ngramas(palavra):
+            ids = self._ngramas.get(g)
+            if ids is None:
+                ids = self._ngramas[g] = array("i")
+            ids.append(w)
+        return w
+
+    def _postagens(self, w: int):
+        """Ids (crescentes) dos textos que contêm a palavra 'w'."""
+        ids = self._varias.get(w)
+        return (self._unicas[w],) if ids is None else ids
+
+    def _organizar(self) -> None:
+        """Ordena os recentes; funde-os à lista principal quando passam de 1/8 dela."""
+        texto = self._textos.__getitem__
+        if len(self._recentes) > max(4096, len(self._ordenado) // 8):
+            # sort estável: ids iguais no texto ficam em ordem crescente
+            self._ordenado = array("i", sorted(self._ordenado + self._recentes, key=texto))
+            self._recentes = array("i")
+        elif not self._recentes_em_ordem:
+            self._recentes = array("i", sorted(self._recentes, key=texto))
+        self._recentes_em_ordem = True
+
+    def prefixo(self, p: str, limite: int) -> list[int]:
+        """Ids dos textos que começam com 'p', em ordem alfabética (no máximo 'limite')."""
+        self._organizar()
+        textos = self._textos
+        achados = []
+        for lista in (self._ordenado, self._recentes):
+            pos = bisect_left(lista, p, key=textos.__getitem__)
+            fim = min(len(lista), pos + limite)
+            while pos < fim and textos[lista[pos]].startswith(p):
+                achados.append(lista[pos])
+                pos += 1
+        achados.sort(key=lambda i: (textos[i], i))
+        return achados[:limite]
+
+    def exatos(self, texto: str) -> list[int]:
+        """Ids de todos os textos iguais a 'texto'."""
+        self._organizar()
+        textos = self._textos
+        ids = []
+        for lista in (self._ordenado, self._recentes):
+            pos = bisect_left(lista, texto, key=textos.__getitem__)
+            while pos < len(lista) and textos[lista[pos]] == texto:
+                ids.append(lista[pos])
+                pos += 1
+        return ids
+
+    def _similares(self, palavra: str) -> list[tuple[float, int]]:
+        """[(similaridade, id de palavra)]: a própria palavra ou as mais parecidas (Dice de trigramas)."""
+        w = self._id_palavra.get(palavra)
+        if w is not None:
+            return [(1.0, w)]
+        gq = _ngramas(palavra)
+        contagem = Counter()
+        lidos = 0
+        for ids in sorted((self._ngramas[g] for g in gq if g in self._ngramas), key=len):
+            if lidos and lidos + len(ids) > self.ORCAMENTO_VOCABULARIO:
+                break
+            contagem.update(ids)
+            lidos += len(ids)
+        similares = []
+        for w, _ in contagem.most_common(4 * self.SIMILARES):
+            gw = _ngramas(self._palavras[w])
+            sim = 2 * len(gq & gw) / (len(gq) + len(gw))
+            if sim >= self.SIMILARIDADE_MINIMA:
+                similares.append((sim, w))
+        similares.sort(reverse=True)
+        return similares[:self.SIMILARES]
+
+    def aproximados(self, q: str, limite: int) -> list[tuple[float, int]]:
+        """
+        [(similaridade 0..1, id)] dos textos mais parecidos com 'q'.
+        Cada palavra da consulta vale a similaridade da melhor palavra parecida que o
+        texto contém; a soma é dividida pelo número de palavras da consulta (palavras
+        a mais no texto não penalizam). Empates: o texto com menos palavras primeiro.
+        Candidatos: textos do grupo de palavras mais raro, refinados pela interseção
+        (em C, com sets) com os demais grupos enquanto ela não ficar vazia.
+        """
+        palavras = list(dict.fromkeys(q.split()))
+        postagens = self._postagens
+        grupos = []      # (postagens somadas, [(sim, id de palavra)], set de textos ou None)
+        for p in palavras:
+            similares = self._similares(p)
+            if similares:
+                tamanho = sum(len(postagens(w)) for _, w in similares)
+                textos = None
+                if tamanho <= self.ORCAMENTO:
+                    textos = set().union(*(postagens(w) for _, w in similares))
+                grupos.append((tamanho, similares, textos))
+        if not grupos:
+            return []
+        grupos.sort(key=lambda g: g[0])
+
+        candidatos = grupos[0][2]
+        if candidatos is None:        # até a palavra mais rara é comum demais
+            candidatos = set(postagens(grupos[0][1][0][1])[:self.ORCAMENTO])
+        for _, similares, textos in grupos[1:]:
+            if textos is not None:
+                comum = candidatos & textos
+            elif len(candidatos) <= self.SIMILARES * 64:
+                comum = {i for i in candidatos if any(_contem(postagens(w), i) for _, w in similares)}
+            else:
+                continue
+            if comum:
+                candidatos = comum
+
+        if len(candidatos) > 8 * limite:   # prefere os que têm a palavra mais parecida do grupo raro
+            escolhidos = []
+            for _, w in grupos[0][1]:
+                escolhidos += [i for i in postagens(w)[:self.ORCAMENTO] if i in candidatos]
+                if len(escolhidos) >= 8 * limite:
+                    break
+            candidatos = set(escolhidos[:8 * limite])
+
+        n = len(palavras)
+        tamanhos = self._tamanhos
+        resultado = []
+        for i in candidatos:
+            soma = 0.0
+            for _, similares, textos in grupos:
+                if textos is None or i in textos:
+                    soma += max((sim for sim, w in similares if _contem(postagens(w), i)), default=0.0)
+            resultado.append((soma / n, -tamanhos[i], -i))
+        return [(sim, -i) for sim, _, i in nlargest(limite, resultado)]
+
+
+class IndiceDeBusca:
+    """
+    Busca por prefixo e aproximada (erros de digitação) em títulos e artistas/hosts.
+    - Atualização incremental: as mídias registradas entram numa fila e são indexadas
+      (só elas) por preparar() ou na próxima busca; carregar o catálogo não paga pela
+      indexação, e preparar_em_segundo_plano() a faz numa thread logo depois da carga.
+    - sugerir() devolve candidatos ordenados: título exato, prefixo de título,
+      prefixo de artista e, por fim, títulos/artistas parecidos.
+    - remover() marca a posição da mídia como None (pulada nas buscas); quando as
+      posições removidas passam de COMPACTAR_ACIMA do índice, ele é refeito só com as
+      mídias que restam (custo amortizado O(1) por remoção).
+    - Os métodos públicos podem ser chamados de threads diferentes (uma trava).
+    """
+
+    SIMILARIDADE_MINIMA = 0.3
+    COMPACTAR_ACIMA = 0.25     # fração de posições removidas que dispara a reconstrução
+    COMPACTAR_MINIMO = 1024    # abaixo disso as posições removidas não compensam refazer
+
+    def __init__(self, normalizar):
+        """normalizar: a mesma função de normalização das chaves do catálogo."""
+        self._norm = normalizar
+        self._trava = threading.Lock()
+        self.limpar()
+
+    def limpar(self) -> None:
+        """Esquece todas as mídias."""
+        with self._trava:
+            self._zerar()
+
+    def _zerar(self) -> None:
+        self._midias = []                 # id de título -> mídia (None = removida)
+        self._fila = []                   # mídias registradas e ainda não indexadas
+        self._fila_titulos = []           # título normalizado de cada mídia da fila
+        self._titulos = _IndiceDeTextos()
+        self._artistas = _IndiceDeTextos()
+        self._por_artista = []            # id de artista -> array de ids de títulos
+        self._id_artista = {}             # artista normalizado -> id
+        self._id_artista_bruto = {}       # artista como digitado -> id (evita normalizar de novo)
+        self._removidas = 0
+        self._fora_da_fila = []           # mídias removidas antes de serem indexadas
+
+    def adicionar(self, midia, titulo: str | None = None) -> None:
+        """
+        Enfileira a mídia para indexação (O(1)). titulo: o título já normalizado (o catálogo
+        passa a sua chave, e o índice guarda a mesma string em vez de uma cópia).
+        """
+        with self._trava:
+            self._fila.append(midia)
+            self._fila_titulos.append(self._norm(midia.titulo) if titulo is None else titulo)
+
+    def remover(self, midias) -> None:
+        """Esquece as mídias (por identidade); as que ainda estão na fila saem dela na indexação."""
+        with self._trava:
+            for m in midias:
+                achou = False
+                for i in self._titulos.exatos(self._norm(m.titulo)):
+                    if self._midias[i] is m:
+                        self._midias[i] = None
+                        self._removidas += 1
+                        achou = True
+                if not achou and self._fila:
+                    self._fora_da_fila.append(m)   # a referência mantém o id(m) único até lá
+            if self._removidas > max(self.COMPACTAR_MINIMO, self.COMPACTAR_ACIMA * len(self._midias)):
+                self._compactar()
+
+    def _compactar(self) -> None:
+        """Descarta o índice e põe as mídias que restam de volta na fila (antes das pendentes)."""
+        vivas = [i for i, m in enumerate(self._midias) if m is not None]
+        midias, textos = self._midias, self._titulos._textos
+        fila, titulos, fora_da_fila = self._fila, self._fila_titulos, self._fora_da_fila
+        self._zerar()
+        self._fila = [midias[i] for i in vivas] + fila
+        self._fila_titulos = [textos[i] for i in vivas] + titulos
+        self._fora_da_fila = fora_da_fila
+
+    def preparar(self) -> None:
+        """Indexa agora as mídias pendentes (em vez de na próxima busca)."""
+        with self._trava:
+            if self._fila:
+                self._indexar_pendentes()
+
+    def preparar_em_segundo_plano(self) -> threading.Thread | None:
+        """Roda preparar() numa thread daemon; buscas feitas antes do fim esperam por ela."""
+        if not self._fila:
+            return None
+        thread = threading.Thread(target=self.preparar, name="indice-de-busca", daemon=True)
+        thread.start()
+        return thread
+
+    def _indexar_pendentes(self) -> None:
+        fila, self._fila = self._fila, []
+        titulos, self._fila_titulos = self._fila_titulos, []
+        if self._fora_da_fila:
+            # uma ocorrência por remoção: a mídia pode ter voltado depois (renomeada)
+            restantes = Counter(map(id, self._fora_da_fila))
+            self._fora_da_fila = []
+            manter = []
+            for m, t in zip(fila, titulos):
+                if restantes[id(m)] > 0:
+                    restantes[id(m)] -= 1
+                else:
+                    manter.append((m, t))
+            fila = [m for m, _ in manter]
+            titulos = [t for _, t in manter]
+        norm = self._norm
+        inicio = self._titulos.estender(titulos)
+        self._midias += fila
+        por_artista, id_artista, id_bruto = self._por_artista, self._id_artista, self._id_artista_bruto
+        for i, midia in enumerate(fila, inicio):
+            a = id_bruto.get(midia.artista)
+            if a is None:
+                artista = norm(midia.artista)
+                a = id_artista.get(artista)
+                if a is None:
+                    a = id_artista[artista] = self._artistas.adicionar(artista)
+                    por_artista.append(array("i"))
+                id_bruto[midia.artista] = a
+            por_artista[a].append(i)
+
+    def sugerir(self, consulta: str, limite: int = 5) -> list[tuple[object, float]]:
+        """[(mídia, pontuação)] mais prováveis para 'consulta', da melhor para a pior."""
+        q = self._norm(consulta)
+        if not q or limite <= 0:
+            return []
+        with self._trava:
+            if self._fila:
+                self._indexar_pendentes()
+            return self._sugerir(q, limite)
+
+    def _sugerir(self, q: str, limite: int) -> list[tuple[object, float]]:
+        pontos = {}   # id de título -> pontuação
+
+        def marcar(i: int, p: float) -> None:
+            if midias[i] is not None and p > pontos.get(i, -1.0):
+                pontos[i] = p
+
+        midias, norm = self._midias, self._norm
+        for i in self._titulos.prefixo(q, limite):
+            if midias[i] is not None:
+                titulo = norm(midias[i].titulo)
+                marcar(i, 3.0 if titulo == q else 2.0 + len(q) / len(titulo))
+        for a in self._artistas.prefixo(q, limite):
+            for i in self._por_artista[a][:limite]:
+                if midias[i] is not None:
+                    marcar(i, 1.5 + len(q) / len(norm(midias[i].artista)))
+        if len(pontos) < limite:
+            for sim, i in self._titulos.aproximados(q, limite):
+                if sim >= self.SIMILARIDADE_MINIMA:
+                    marcar(i, sim)
+            for sim, a in self._artistas.aproximados(q, limite):
+                if sim >= self.SIMILARIDADE_MINIMA:
+                    for i in self._por_artista[a][:limite]:
+                        marcar(i, 0.9 * sim)
+
+        melhores = sorted(pontos.items(),
+                          key=lambda x: (-x[1], -midias[x[0]].reproducoes, norm(midias[x[0]].titulo)))
+        return [(midias[i], p) for i, p in melhores[:limite]]
+
+    def __len__(self) -> int:
+        """Quantidade de mídias (indexadas ou na fila)."""
+        with self._trava:
+            return len(self._midias) - self._removidas + len(self._fila) - len(self._fora_da_fila)
@@ -0,0 +1,96 @@
+# Streaming/carga_paralela.py
+"""
+Carga paralela de arquivos de dados grandes: o processo principal só localiza seções e
+cortes de bloco (via mmap); cada bloco é lido, interpretado e validado por um processo
+do pool. Os resultados são consumidos na ordem do arquivo, então a mesclagem é determinística.
+"""
+import itertools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .leitor import SECOES_CARGA, iter_itens_md, secoes, validar_item
+
+
+LIMITE_CARGA_PARALELA = 64 * 1024 * 1024   # bytes; abaixo disso a carga é sequencial
+TAM_BLOCO_PARALELO = 4 * 1024 * 1024       # bytes por tarefa
+
+
+def _inicio_de_linha(mm, pos, fim):
+    """Primeira posição >= pos que começa uma linha (ou 'fim')."""
+    if pos <= 0:
+        return 0
+    if mm[pos - 1:pos] == b"\n":
+        return pos
+    nl = mm.find(b"\n", pos, fim)
+    return fim if nl == -1 else nl + 1
+
+
+def _proximo_item(mm, pos, fim):
+    """Início da primeira linha de item ('- ...') a partir de 'pos' (ou 'fim')."""
+    pos = _inicio_de_linha(mm, pos, fim)
+    while pos < fim:
+        nl = mm.find(b"\n", pos, fim)
+        fim_linha = fim if nl == -1 else nl + 1
+        if mm[pos:fim_linha].lstrip().startswith(b"- "):
+            return pos
+        pos = fim_linha
+    return fim
+
+
+def planejar_blocos(caminho, tam_bloco):
+    """Divide o corpo de cada seção (ver leitor.secoes) em tarefas (tipo, ini, fim) que começam em um item."""
+    tarefas = []
+    if os.path.getsize(caminho) == 0:
+        return tarefas
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for tipo, corpo, fim in secoes(mm):
+            while corpo < fim:
+                corte = _proximo_item(mm, min(corpo + tam_bloco, fim), fim)
+                tarefas.append((tipo, corpo, corte))
+                corpo = corte
+    return tarefas
+
+
+def _processar_bloco(caminho, tipo, ini, fim):
+    """Executado no pool: lê o trecho [ini, fim) do arquivo e devolve os registros validados."""
+    with open(caminho, "rb") as f:
+        f.seek(ini)
+        texto = f.read(fim - ini).decode("utf-8")
+    registros = []
+    for _, item in iter_itens_md(itertools.chain(["# bloco"], texto.splitlines())):
+        reg = validar_item(tipo, item)
+        if reg is not None:
+            registros.append(reg)
+    return registros
+
+
+def registros_paralelos(caminho, processos, tam_bloco=None):
+    """
+    Valida todos os blocos em um ProcessPoolExecutor e devolve, por tipo,
+    um gerador que percorre os registros na ordem original do arquivo.
+    """
+    tarefas = planejar_blocos(caminho, tam_bloco or TAM_BLOCO_PARALELO)
+    executor = ProcessPoolExecutor(max_workers=processos)
+    futuros = {tipo: [] for tipo in SECOES_CARGA}
+    for tipo, ini, fim in tarefas:
+        futuros[tipo].append(executor.submit(_processar_bloco, str(caminho), tipo, ini, fim))
+    executor.shutdown(wait=False)
+
+    def em_ordem(lista):
+        for fut in lista:
+            yield from fut.result()
+
+    return {tipo: em_ordem(lista) for tipo, lista in futuros.items()}
+
+
+def processos_para(caminho, processos):
+    """Quantidade de processos da carga: automático pelo tamanho do arquivo quando None."""
+    if processos is not None:
+        return max(1, processos)
+    try:
+        if os.path.getsize(caminho) < LIMITE_CARGA_PARALELA:
+            return 1
+    except OSError:
+        return 1
+    return os.cpu_count() or 1
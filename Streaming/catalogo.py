@@ -0,0 +1,108 @@
+# Streaming/catalogo.py
+from .busca import IndiceDeBusca
+
+def _norm(s: str) -> str:
+    """Normaliza textos: strip, compacta espaços e lowercase."""
+    return " ".join((s or "").strip().split()).lower()
+
+
+class CatalogoDeMidia:
+    """
+    Catálogo de mídias com índices por chave normalizada.
+    - Índice primário: título normalizado -> mídia (a primeira registrada vence;
+      ao remover a vencedora, a próxima com o mesmo título assume).
+    - Índices secundários: artista e gênero normalizados -> lista de mídias.
+    - 'itens' guarda todas as mídias na ordem de registro.
+    - 'busca': índice de prefixo/aproximado de títulos e artistas (ver sugerir()).
+    """
+
+    def __init__(self):
+        """Cria um catálogo vazio."""
+        self.itens = []          # todas as mídias, na ordem de criação
+        self._por_titulo = {}    # titulo normalizado -> mídia
+        self._por_artista = {}   # artista normalizado -> [mídias]
+        self._por_genero = {}    # gênero normalizado -> [mídias]
+        self._repetidos = set()  # títulos normalizados registrados mais de uma vez
+        self.busca = IndiceDeBusca(_norm)
+
+    def registrar(self, midia) -> None:
+        """Adiciona a mídia ao catálogo e atualiza todos os índices (a busca guarda a mesma chave de título)."""
+        self.itens.append(midia)
+        titulo = _norm(midia.titulo)
+        if self._por_titulo.setdefault(titulo, midia) is not midia:
+            self._repetidos.add(titulo)
+        self._por_artista.setdefault(_norm(midia.artista), []).append(midia)
+        genero = getattr(midia, "genero", "")
+        if genero:
+            self._por_genero.setdefault(_norm(genero), []).append(midia)
+        self.busca.adicionar(midia, titulo)
+
+    def remover(self, midias) -> None:
+        """Tira as mídias (por identidade) de 'itens' e de todos os índices, em lote."""
+        midias = list(midias)
+        ids = {id(m) for m in midias}
+        if not ids:
+            return
+        self.itens[:] = [m for m in self.itens if id(m) not in ids]
+        orfaos = set()   # títulos que perderam a mídia do índice primário
+        listas = set()   # (índice, chave) de listas secundárias a filtrar
+        for m in midias:
+            titulo = _norm(m.titulo)
+            if self._por_titulo.get(titulo) is m:
+                del self._por_titulo[titulo]
+                if titulo in self._repetidos:
+                    orfaos.add(titulo)
+            listas.add(("artista", _norm(m.artista)))
+            genero = getattr(m, "genero", "")
+            if genero:
+                listas.add(("genero", _norm(genero)))
+        for nome, chave in listas:
+            indice = self._por_artista if nome == "artista" else self._por_genero
+            restantes = [m for m in indice.get(chave, ()) if id(m) not in ids]
+            if restantes:
+                indice[chave] = restantes
+            else:
+                indice.pop(chave, None)
+        if orfaos:
+            for m in self.itens:
+                titulo = _norm(m.titulo)
+                if titulo in orfaos:
+                    self._por_titulo.setdefault(titulo, m)
+        self.busca.remover(midias)
+
+    def limpar(self) -> None:
+        """Remove todas as mídias (mantém a mesma lista 'itens')."""
+        self.itens[:] = []
+        self._por_titulo.clear()
+        self._por_artista.clear()
+        self._por_genero.clear()
+        self._repetidos.clear()
+        self.busca.limpar()
+
+    def buscar_por_titulo(self, titulo: str):
+        """Busca O(1) pelo título normalizado; retorna None se não existir."""
+        return self._por_titulo.get(_norm(titulo))
+
+    def buscar_por_artista(self, artista: str) -> list:
+        """Retorna as mídias do artista/host informado (lista vazia se não houver)."""
+        return list(self._por_artista.get(_norm(artista), []))
+
+    def buscar_por_genero(self, genero: str) -> list:
+        """Retorna as músicas do gênero informado (lista vazia se não houver)."""
+        return list(self._por_genero.get(_norm(genero), []))
+
+    def sugerir(self, consulta: str, limite: int = 5) -> list:
+        """Mídias mais prováveis para 'consulta' (prefixo ou com erros de digitação), da melhor para a pior."""
+        return [midia for midia, _ in self.busca.sugerir(consulta, limite)]
+
+    def __len__(self) -> int:
+        """Quantidade de mídias registradas."""
+        return len(self.itens)
+
+    def __iter__(self):
+        """Itera sobre as mídias na ordem de registro."""
+        return iter(self.itens)
+
+    def __contains__(self, titulo: str) -> bool:
+        """Permite 'titulo in catalogo' (comparação normalizada)."""
+        return _norm(titulo) in self._por_titulo
@@ -0,0 +1,287 @@
+# Streaming/colunas.py
+"""
+Armazenamento colunar (modo compacto) para catálogos muito grandes.
+- Os dados de cada mídia ficam em colunas 'array' (números) e em colunas
+  codificadas por dicionário (artista, gênero, temporada).
+- MusicaColunar / PodcastColunar são visões leves sobre um número de linha: o único
+  slot da instância é '_linha'. Herdam o comportamento de ArquivoDeMidia e estão
+  registradas como Musica / Podcast (mesma interface, catálogo, placares e contadores).
+- A linha de uma visão que deixa de existir volta para a loja e é reaproveitada.
+- O ganho é modesto: com 1M de músicas e o índice de busca montado, ~615 bytes por
+  música contra ~760 com Musica (benchmarks/bench_memoria_midias). A visão (~70 bytes
+  com o número da linha) e as colunas (~70) são a menor parte; o título, a chave
+  normalizada e as entradas nos índices (catálogo, busca, placares) existem em
+  qualquer modo.
+"""
+from array import array
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .musica import Musica
+from .podcast import Podcast
+
+
+class ColunaCodificada:
+    """Coluna de textos repetidos: cada valor distinto é guardado uma vez."""
+
+    def __init__(self):
+        """Cria a coluna vazia."""
+        self.valores: list[str] = []   # código -> texto
+        self._codigos: dict[str, int] = {}
+        self.codigos = array("l")      # linha -> código
+
+    def codificar(self, texto: str) -> int:
+        """Código do texto (cria um novo se ainda não existir)."""
+        cod = self._codigos.get(texto)
+        if cod is None:
+            cod = len(self.valores)
+            self.valores.append(texto)
+            self._codigos[texto] = cod
+        return cod
+
+    def __getitem__(self, linha: int) -> str:
+        """Texto da linha."""
+        return self.valores[self.codigos[linha]]
+
+    def __setitem__(self, linha: int, texto: str) -> None:
+        """Troca o texto da linha."""
+        self.codigos[linha] = self.codificar(texto)
+
+    def limpar(self) -> None:
+        """Remove todas as linhas e valores."""
+        self.valores.clear()
+        self._codigos.clear()
+        del self.codigos[:]
+
+
+class LojaColunar:
+    """
+    Conjunto de colunas de mesmo tamanho (uma linha por mídia).
+    numericas: {nome: typecode do array}; codificadas: nomes das colunas de texto repetido.
+    - titulos e chaves (título/artista normalizados) ficam em listas.
+    - donos: id da visão dona de cada linha; linhas liberadas vão para uma lista de
+      livres e são reaproveitadas por nova_linha().
+    - versao: muda sempre que a loja é limpa (as linhas antigas deixam de valer).
+    """
+
+    def __init__(self, numericas: dict[str, str], codificadas: tuple[str, ...]):
+        """Cria as colunas vazias."""
+        self.titulos: list[str] = []
+        self.chaves: list = []
+        self.numericas = {nome: array(tipo) for nome, tipo in numericas.items()}
+        self.codificadas = {nome: ColunaCodificada() for nome in codificadas}
+        self.donos = array("Q")
+        self._livres: list[int] = []
+        self.versao = 0
+        self._vazia = {nome: array(tipo, [0]) for nome, tipo in numericas.items()}
+
+    def nova_linha(self, dono) -> int:
+        """Reserva uma linha zerada para a visão 'dono' (reaproveita uma livre) e retorna o número."""
+        if self._livres:
+            linha = self._livres.pop()
+            self.titulos[linha] = ""
+            self.chaves[linha] = None
+            for col in self.numericas.values():
+                col[linha] = 0
+            for col in self.codificadas.values():
+                col.codigos[linha] = col.codificar("")
+            self.donos[linha] = id(dono)
+            return linha
+        self.titulos.append("")
+        self.chaves.append(None)
+        for nome, col in self.numericas.items():
+            col.extend(self._vazia[nome])
+        for col in self.codificadas.values():
+            col.codigos.append(col.codificar(""))
+        self.donos.append(id(dono))
+        return len(self.titulos) - 1
+
+    def liberar(self, linha: int, dono) -> None:
+        """Devolve a linha de 'dono' (ignora linhas de outra visão, ex.: após limpar())."""
+        if linha < len(self.donos) and self.donos[linha] == id(dono):
+            self.donos[linha] = 0
+            self.titulos[linha] = ""
+            self.chaves[linha] = None
+            self._livres.append(linha)
+
+    def limpar(self) -> None:
+        """Remove todas as linhas."""
+        self.titulos.clear()
+        self.chaves.clear()
+        for col in self.numericas.values():
+            del col[:]
+        for col in self.codificadas.values():
+            col.limpar()
+        del self.donos[:]
+        self._livres.clear()
+        self.versao += 1
+
+    def __len__(self) -> int:
+        """Quantidade de linhas em uso."""
+        return len(self.titulos) - len(self._livres)
+
+
+def _numerica(nome: str):
+    """Propriedade ligada a uma coluna numérica da loja da classe."""
+    def get(self):
+        return self._loja.numericas[nome][self._linha]
+
+    def set(self, valor):
+        self._loja.numericas[nome][self._linha] = valor
+    return property(get, set)
+
+
+def _codificada(nome: str):
+    """Propriedade ligada a uma coluna codificada da loja da classe."""
+    def get(self):
+        return self._loja.codificadas[nome][self._linha]
+
+    def set(self, valor):
+        self._loja.codificadas[nome][self._linha] = valor
+    return property(get, set)
+
+
+def _lista(nome: str):
+    """Propriedade ligada a uma coluna em lista da loja da classe (titulos, chaves)."""
+    def get(self):
+        return getattr(self._loja, nome)[self._linha]
+
+    def set(self, valor):
+        getattr(self._loja, nome)[self._linha] = valor
+    return property(get, set)
+
+
+def _nota(nome: str):
+    """Nota mínima/máxima: -1 na coluna representa 'sem notas' (None)."""
+    def get(self):
+        v = self._loja.numericas[nome][self._linha]
+        return None if v < 0 else v
+    return property(get)
+
+
+class _VisaoColunar(ArquivoDeMidia):
+    """Base das visões: a instância guarda só o número da linha em '_loja'."""
+
+    __slots__ = ("_linha",)
+
+    _loja: LojaColunar   # definida em cada subclasse
+    titulo = _lista("titulos")
+    _chave = _lista("chaves")
+    artista = _codificada("artista")
+    duracao = _numerica("duracao")
+    reproducoes = _numerica("reproducoes")
+
+    @property
+    def chave(self) -> tuple[str, str]:
+        """Identidade da mídia (ver ArquivoDeMidia.chave), guardada na coluna de chaves."""
+        chave = self._loja.chaves[self._linha]
+        if chave is None:
+            chave = self._loja.chaves[self._linha] = self._nova_chave()
+        return chave
+
+    def __new__(cls, *args, **kwargs):
+        """Reserva a linha na loja antes do __init__ (que valida e preenche)."""
+        self = super().__new__(cls)
+        self._linha = cls._loja.nova_linha(self)
+        return self
+
+    def __del__(self):
+        """A linha volta para a loja quando a visão deixa de existir (inclusive se o __init__ falhar)."""
+        self._loja.liberar(self._linha, self)
+
+
+class MusicaColunar(_VisaoColunar):
+    """Música cujos dados ficam em MusicaColunar._loja; a instância guarda só a linha."""
+
+    __slots__ = ()
+
+    _loja = LojaColunar(
+        {"duracao": "l", "reproducoes": "q", "qtd_avaliacoes": "I", "soma_avaliacoes": "Q",
+         "nota_min": "b", "nota_max": "b",
+         **{f"hist{n}": "I" for n in range(6)}},
+        ("artista", "genero"),
+    )
+    guardar_avaliacoes = False  # só os agregados (ver Musica.guardar_avaliacoes)
+
+    genero = _codificada("genero")
+    qtd_avaliacoes = _numerica("qtd_avaliacoes")
+    soma_avaliacoes = _numerica("soma_avaliacoes")
+    nota_min = _nota("nota_min")
+    nota_max = _nota("nota_max")
+
+    media_avaliacoes = Musica.media_avaliacoes
+    __str__ = Musica.__str__
+    __repr__ = Musica.__repr__
+
+    def __init__(self, titulo: str, duracao: int, artista: str,
+                 genero: str, reproducoes: int = 0):
+        """Preenche a linha reservada pelas mesmas validações de Musica."""
+        cols = self._loja.numericas
+        cols["nota_min"][self._linha] = -1
+        cols["nota_max"][self._linha] = -1
+        self.genero = (genero or "").strip()
+        ArquivoDeMidia.__init__(self, titulo, duracao, artista, reproducoes)
+
+    @property
+    def avaliacoes(self) -> list[int]:
+        """A lista de notas não é guardada no modo colunar."""
+        return []
+
+    @property
+    def histograma(self) -> list[int] | None:
+        """Quantidade de notas 0..5 (None se não houver notas)."""
+        if not self.qtd_avaliacoes:
+            return None
+        cols = self._loja.numericas
+        return [cols[f"hist{n}"][self._linha] for n in range(6)]
+
+    def avaliar(self, nota: int) -> None:
+        """Adiciona uma avaliação de 0 a 5 atualizando as colunas de agregados."""
+        if not isinstance(nota, int) or nota < 0 or nota > 5:
+            raise ValueError("A nota deve estar entre 0 e 5 (inteiro).")
+        cols, i = self._loja.numericas, self._linha
+        cols["qtd_avaliacoes"][i] += 1
+        cols["soma_avaliacoes"][i] += nota
+        if cols["nota_min"][i] < 0 or nota < cols["nota_min"][i]:
+            cols["nota_min"][i] = nota
+        if nota > cols["nota_max"][i]:
+            cols["nota_max"][i] = nota
+        cols[f"hist{nota}"][i] += 1
+        ArquivoDeMidia.contadores.registrar_avaliacao(nota)
+
+
+class PodcastColunar(_VisaoColunar):
+    """Podcast cujos dados ficam em PodcastColunar._loja; a instância guarda só a linha."""
+
+    __slots__ = ()
+
+    _loja = LojaColunar(
+        {"duracao": "l", "reproducoes": "q", "episodio": "l"},
+        ("artista", "temporada"),
+    )
+
+    temporada = _codificada("temporada")
+    episodio = _numerica("episodio")
+
+    __init__ = Podcast.__init__     # mesmas validações, preenchendo a linha reservada
+    renomear = Podcast.renomear
+    __str__ = Podcast.__str__
+    __repr__ = Podcast.__repr__
+
+    @property
+    def host(self) -> str:
+        """O host é o próprio 'artista' da base (mesma coluna)."""
+        return self.artista
+
+    @host.setter
+    def host(self, valor: str) -> None:
+        self.artista = valor
+
+
+Musica.register(MusicaColunar)
+Podcast.register(PodcastColunar)
+
+
+def limpar_lojas() -> None:
+    """Esvazia as lojas colunares (chamar junto com ArquivoDeMidia.limpar_registro)."""
+    MusicaColunar._loja.limpar()
+    PodcastColunar._loja.limpar()
@@ -0,0 +1,107 @@
+# Streaming/contadores.py
+import threading
+
+class Contadores:
+    """
+    Totais do sistema mantidos de forma incremental (leitura em O(1)).
+    Atualizados por ArquivoDeMidia (reproduções) e Musica (avaliações).
+    """
+
+    def __init__(self):
+        """Cria os contadores zerados."""
+        self.zerar()
+
+    def zerar(self) -> None:
+        """Volta todos os totais para zero."""
+        self.reproducoes = 0               # soma das reproduções de todas as mídias
+        self.avaliacoes = 0                # quantidade de notas registradas
+        self.soma_avaliacoes = 0           # soma das notas registradas
+        self.histograma = [0] * 6          # quantidade de notas 0..5
+
+    def registrar_avaliacao(self, nota: int) -> None:
+        """Conta uma nota (0 a 5) já validada."""
+        self.avaliacoes += 1
+        self.soma_avaliacoes += nota
+        self.histograma[nota] += 1
+
+    def descontar(self, reproducoes: int, histograma=None) -> None:
+        """Retira dos totais as reproduções e as notas (histograma 0..5) de uma mídia removida."""
+        self.reproducoes -= reproducoes
+        for nota, qtd in enumerate(histograma or ()):
+            self.avaliacoes -= qtd
+            self.soma_avaliacoes -= nota * qtd
+            self.histograma[nota] -= qtd
+
+    def media_avaliacoes(self) -> float:
+        """Média de todas as notas do sistema (0.0 se não houver)."""
+        if not self.avaliacoes:
+            return 0.0
+        return self.soma_avaliacoes / self.avaliacoes
+
+    def __repr__(self) -> str:
+        """Representação detalhada para depuração."""
+        return (f"Contadores(reproducoes={self.reproducoes}, avaliacoes={self.avaliacoes}, "
+                f"media={self.media_avaliacoes():.2f})")
+
+
+class ContadorFragmentado:
+    """
+    Contador por objeto seguro para várias threads, sem trava no incremento.
+    - Cada thread soma no seu próprio fragmento (id(obj) -> [obj, quantidade]);
+      só ela escreve nele, então threads ouvindo a mesma mídia não disputam nada.
+    - Leituras somam os fragmentos; pendentes() entrega o que ainda não foi
+      repassado aos objetos (consolidação incremental, sem zerar fragmentos).
+    """
+
+    def __init__(self):
+        """Cria o contador sem fragmentos (cada thread cria o seu no primeiro uso)."""
+        self._local = threading.local()
+        self._fragmentos = []     # um dicionário por thread
+        self._aplicado = []       # paralelo a _fragmentos: id -> quantidade já consolidada
+        self._trava = threading.Lock()   # só para registrar fragmentos e consolidar
+
+    def _fragmento(self) -> dict:
+        try:
+            return self._local.fragmento
+        except AttributeError:
+            frag = self._local.fragmento = {}
+            with self._trava:
+                self._fragmentos.append(frag)
+                self._aplicado.append({})
+            return frag
+
+    def incrementar(self, obj, n: int = 1) -> None:
+        """Soma 'n' ao contador de 'obj' no fragmento da thread atual."""
+        frag = self._fragmento()
+        item = frag.get(id(obj))
+        if item is None:
+            frag[id(obj)] = [obj, n]
+        else:
+            item[1] += n
+
+    def valor(self, obj) -> int:
+        """Total contado para 'obj' (somando todos os fragmentos)."""
+        return sum(frag[id(obj)][1] for frag in list(self._fragmentos) if id(obj) in frag)
+
+    def total(self) -> int:
+        """Total contado para todos os objetos."""
+        return sum(item[1] for frag in list(self._fragmentos) for item in frag.copy().values())
+
+    def pendentes(self) -> list[tuple[object, int]]:
+        """
+        [(obj, quantidade)] contados desde a última chamada (marca como consolidados).
+        Pode ser chamado com as threads ainda incrementando: o que chegar depois
+        fica para a próxima chamada.
+        """
+        somas = {}
+        with self._trava:
+            for frag, aplicado in zip(self._fragmentos, self._aplicado):
+                for chave, (obj, qtd) in frag.copy().items():
+                    delta = qtd - aplicado.get(chave, 0)
+                    if delta:
+                        aplicado[chave] = qtd
+                        if chave in somas:
+                            somas[chave][1] += delta
+                        else:
+                            somas[chave] = [obj, delta]
+        return [(obj, qtd) for obj, qtd in somas.values()]
@@ -0,0 +1,185 @@
+# Streaming/historico.py
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+
+class HistoricoDeReproducao:
+    """
+    Histórico de um usuário com memória limitada.
+    - 'total' (e len()) conta TODAS as reproduções, exatamente.
+    - Só as últimas 'capacidade' reproduções ficam guardadas (buffer circular), como
+      códigos de mídia em array('l') e instantes (time.time()) em array('d').
+    - Contagem exata por mídia (uma entrada por mídia distinta, não por evento).
+    - Iterar devolve as mídias guardadas, da mais antiga para a mais recente.
+    - append/extend podem ser chamados de várias threads (trava por histórico).
+    Mídias iguais (mesma chave título/artista) compartilham o mesmo código.
+    """
+
+    # tabela de códigos compartilhada por todos os históricos: código <-> mídia
+    _midias = []
+    _codigos = {}
+    _trava_codigos = threading.Lock()
+
+    def __init__(self, capacidade: int = 1000):
+        """Cria um histórico vazio que guarda até 'capacidade' reproduções recentes."""
+        if not isinstance(capacidade, int) or capacidade < 0:
+            raise ValueError("Capacidade do histórico deve ser um inteiro >= 0.")
+        self.capacidade = capacidade
+        self.total = 0
+        self._ids = array("l")
+        self._instantes = array("d")
+        self._inicio = 0         # posição da reprodução mais antiga quando o buffer está cheio
+        self._contagens = {}     # código -> reproduções
+        self._trava = threading.Lock()
+
+    @classmethod
+    def limpar_codigos(cls) -> None:
+        """Esvazia a tabela de códigos (chamar quando as mídias e usuários forem recriados)."""
+        cls._midias.clear()
+        cls._codigos.clear()
+
+    @classmethod
+    @contextmanager
+    def trocando_chave(cls, midia):
+        """
+        Bloco em que a chave (e o hash) da mídia muda: o código da mídia passa para a
+        chave nova, e as contagens e o recomendador continuam valendo.
+        """
+        with cls._trava_codigos:
+            cod = cls._codigos.get(midia)
+            if cod is not None and cls._midias[cod] is midia:
+                del cls._codigos[midia]
+            else:
+                cod = None       # sem código próprio (ou compartilhado com outra mídia igual)
+            try:
+                yield
+            finally:
+                if cod is not None:
+                    cls._codigos[midia] = cod
+
+    @classmethod
+    def codigo(cls, midia) -> int:
+        """Código da mídia na tabela compartilhada (criado na primeira vez)."""
+        cod = cls._codigos.get(midia)
+        if cod is None:
+            with cls._trava_codigos:
+                cod = cls._codigos.get(midia)
+                if cod is None:
+                    cod = len(cls._midias)
+                    cls._midias.append(midia)
+                    cls._codigos[midia] = cod
+        return cod
+
+    def append(self, midia, instante: float | None = None) -> None:
+        """Registra uma reprodução (instante padrão: agora)."""
+        if instante is None:
+            instante = time.time()
+        cod = self.codigo(midia)
+        with self._trava:
+            self.total += 1
+            self._contagens[cod] = self._contagens.get(cod, 0) + 1
+            if len(self._ids) < self.capacidade:
+                self._ids.append(cod)
+                self._instantes.append(instante)
+            elif self.capacidade:
+                self._ids[self._inicio] = cod
+                self._instantes[self._inicio] = instante
+                self._inicio = (self._inicio + 1) % self.capacidade
+
+    def extend(self, midias, instante: float | None = None) -> None:
+        """Registra várias reproduções com o mesmo instante (padrão: agora)."""
+        if instante is None:
+            instante = time.time()
+        codigo, contagens = self.codigo, self._contagens
+        cods = [codigo(m) for m in midias]
+        with self._trava:
+            for cod in cods:
+                contagens[cod] = contagens.get(cod, 0) + 1
+            self.total += len(cods)
+            if not self.capacidade:
+                return
+            cods = cods[-self.capacidade:]           # só as últimas cabem no buffer
+            livres = self.capacidade - len(self._ids)
+            if livres > 0:
+                self._ids.extend(array("l", cods[:livres]))
+                self._instantes.extend(array("d", [instante]) * len(cods[:livres]))
+                cods = cods[livres:]
+            for cod in cods:
+                self._ids[self._inicio] = cod
+                self._instantes[self._inicio] = instante
+                self._inicio = (self._inicio + 1) % self.capacidade
+
+    def _posicoes(self):
+        """Posições do buffer da reprodução mais recente para a mais antiga."""
+        n = len(self._ids)
+        for k in range(n - 1, -1, -1):
+            yield (self._inicio + k) % n
+
+    def reproducoes_desde(self, instante: float) -> int:
+        """
+        Reproduções guardadas com instante >= 'instante' (O(resultado)).
+        Se a janela for mais antiga que o buffer, conta só o que ainda está guardado.
+        """
+        qtd = 0
+        for i in self._posicoes():
+            if self._instantes[i] < instante:
+                break
+            qtd += 1
+        return qtd
+
+    def reproducoes_ultimos_minutos(self, minutos: float) -> int:
+        """Reproduções nos últimos 'minutos' minutos (ver reproducoes_desde)."""
+        return self.reproducoes_desde(time.time() - minutos * 60)
+
+    def contagem(self, midia) -> int:
+        """Quantas vezes o usuário ouviu a mídia (exato, desde o início)."""
+        cod = self._codigos.get(midia)
+        return 0 if cod is None else self._contagens.get(cod, 0)
+
+    def contagens(self) -> dict:
+        """Mídia -> reproduções, para todas as mídias já ouvidas."""
+        return {self._midias[cod]: qtd for cod, qtd in self._contagens.items()}
+
+    def recentes(self, n: int | None = None) -> list:
+        """As 'n' reproduções guardadas mais recentes (todas se None), da mais recente para a mais antiga."""
+        lim = len(self._ids) if n is None else max(0, min(n, len(self._ids)))
+        pos = self._posicoes()
+        return [self._midias[self._ids[next(pos)]] for _ in range(lim)]
+
+    @classmethod
+    def midia(cls, codigo: int):
+        """Mídia de um código da tabela compartilhada."""
+        return cls._midias[codigo]
+
+    def codigos_recentes(self, n: int) -> list[int]:
+        """Códigos das 'n' reproduções guardadas mais recentes, da mais antiga para a mais recente."""
+        ids = self._ids
+        lim = max(0, min(n, len(ids)))
+        fim = self._inicio or len(ids)        # posição logo depois da mais recente
+        if lim <= fim:
+            return ids[fim - lim:fim].tolist()
+        return ids[len(ids) - (lim - fim):].tolist() + ids[:fim].tolist()
+
+    def limpar(self) -> None:
+        """Esquece todas as reproduções."""
+        with self._trava:
+            self.total = 0
+            del self._ids[:]
+            del self._instantes[:]
+            self._inicio = 0
+            self._contagens.clear()
+
+    def __len__(self) -> int:
+        """Total exato de reproduções (inclusive as que já saíram do buffer)."""
+        return self.total
+
+    def __iter__(self):
+        """Mídias guardadas, da mais antiga para a mais recente."""
+        return reversed(self.recentes())
+
+    def __repr__(self) -> str:
+        """Representação detalhada para depuração."""
+        return (f"{self.__class__.__name__}(total={self.total}, "
+                f"guardadas={len(self._ids)}, capacidade={self.capacidade})")
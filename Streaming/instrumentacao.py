@@ -0,0 +1,240 @@
+# Streaming/instrumentacao.py
+import functools
+import json
+import time
+from array import array
+from pathlib import Path
+
+from .analises import Analises
+from .arquivo_de_midia import ArquivoDeMidia
+from .playlist import Playlist
+from .usuario import Usuario
+
+
+class _Medida:
+    """Contagem, tempo acumulado, máximo e as últimas 'capacidade' durações de um ponto."""
+
+    __slots__ = ("chamadas", "total", "maximo", "amostras", "_pos", "_capacidade")
+
+    def __init__(self, capacidade: int):
+        self.chamadas = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.amostras = array("d")
+        self._pos = 0
+        self._capacidade = capacidade
+
+    def registrar(self, segundos: float) -> None:
+        self.chamadas += 1
+        self.total += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+        if len(self.amostras) < self._capacidade:
+            self.amostras.append(segundos)
+        else:
+            self.amostras[self._pos] = segundos
+            self._pos = (self._pos + 1) % self._capacidade
+
+    def p99(self) -> float:
+        if not self.amostras:
+            return 0.0
+        ordenadas = sorted(self.amostras)
+        return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.99))]
+
+
+class _Trecho:
+    """Contexto de Instrumentacao.medir() quando ativa."""
+
+    __slots__ = ("medida", "ini")
+
+    def __init__(self, medida: _Medida):
+        self.medida = medida
+
+    def __enter__(self):
+        self.ini = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.medida.registrar(time.perf_counter() - self.ini)
+
+
+class _TrechoNulo:
+    """Contexto de Instrumentacao.medir() quando desligada: não faz nada."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+
+_NULO = _TrechoNulo()
+
+
+class Instrumentacao:
+    """
+    Medição de tempo dos caminhos quentes, ligada e desligada em tempo de execução.
+    - Pontos registrados com ponto() (métodos de classes) são trocados por versões
+      cronometradas em ativar() e restaurados em desativar(): desligada, o custo é zero.
+    - Trechos internos (fases de carregar_dados) usam medir()/iterar()/envolver(),
+      que só checam 'ativa' quando desligados.
+    - Por ponto: chamadas, tempo acumulado, média, máximo e p99 das últimas
+      'amostras' chamadas.
+    """
+
+    ativa = False
+    amostras = 4096
+    _medidas = {}      # nome -> _Medida
+    _pontos = []       # (classe, atributo, nome)
+    _originais = {}    # (classe, atributo) -> valor original em classe.__dict__
+
+    @classmethod
+    def _medida(cls, nome: str) -> _Medida:
+        medida = cls._medidas.get(nome)
+        if medida is None:
+            medida = cls._medidas[nome] = _Medida(cls.amostras)
+        return medida
+
+    @classmethod
+    def ponto(cls, classe, atributo: str, nome: str | None = None) -> None:
+        """Registra um método (comum, static ou classmethod) para ser cronometrado."""
+        cls._pontos.append((classe, atributo, nome or f"{classe.__name__}.{atributo}"))
+        if cls.ativa:
+            cls._instalar(classe, atributo, cls._pontos[-1][2])
+
+    @classmethod
+    def _cronometrada(cls, nome: str, funcao):
+        medida = cls._medida(nome)
+        relogio = time.perf_counter
+
+        @functools.wraps(funcao)
+        def cronometrada(*args, **kwargs):
+            ini = relogio()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                medida.registrar(relogio() - ini)
+        return cronometrada
+
+    @classmethod
+    def _instalar(cls, classe, atributo: str, nome: str) -> None:
+        original = classe.__dict__[atributo]
+        cls._originais[(classe, atributo)] = original
+        if isinstance(original, (staticmethod, classmethod)):
+            novo = type(original)(cls._cronometrada(nome, original.__func__))
+        else:
+            novo = cls._cronometrada(nome, original)
+        setattr(classe, atributo, novo)
+
+    @classmethod
+    def ativar(cls) -> None:
+        """Liga a medição (instala as versões cronometradas dos pontos)."""
+        if cls.ativa:
+            return
+        for classe, atributo, nome in cls._pontos:
+            cls._instalar(classe, atributo, nome)
+        cls.ativa = True
+
+    @classmethod
+    def desativar(cls) -> None:
+        """Desliga a medição (restaura os métodos originais; mantém os dados coletados)."""
+        for (classe, atributo), original in cls._originais.items():
+            setattr(classe, atributo, original)
+        cls._originais.clear()
+        cls.ativa = False
+
+    @classmethod
+    def zerar(cls) -> None:
+        """Descarta todos os dados coletados."""
+        for medida in cls._medidas.values():
+            medida.__init__(cls.amostras)
+
+    @classmethod
+    def registrar(cls, nome: str, segundos: float) -> None:
+        """Registra uma duração medida por fora (ignorado se desligada)."""
+        if cls.ativa:
+            cls._medida(nome).registrar(segundos)
+
+    @classmethod
+    def medir(cls, nome: str):
+        """Contexto que cronometra o bloco: with Instrumentacao.medir("fase"): ..."""
+        if not cls.ativa:
+            return _NULO
+        return _Trecho(cls._medida(nome))
+
+    @classmethod
+    def envolver(cls, nome: str, funcao):
+        """'funcao' cronometrada se ligada; a própria 'funcao' se desligada."""
+        return cls._cronometrada(nome, funcao) if cls.ativa else funcao
+
+    @classmethod
+    def iterar(cls, nome: str, iteravel):
+        """Cronometra cada next() do iterável (ex.: leitura preguiçosa do arquivo)."""
+        if not cls.ativa:
+            return iteravel
+        medida = cls._medida(nome)
+        relogio = time.perf_counter
+
+        def cronometrado():
+            it = iter(iteravel)
+            while True:
+                ini = relogio()
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+                medida.registrar(relogio() - ini)
+                yield item
+        return cronometrado()
+
+    @classmethod
+    def estatisticas(cls) -> dict[str, dict]:
+        """nome -> {chamadas, total_s, media_us, p99_us, max_us}, pontos sem chamadas omitidos."""
+        resultado = {}
+        for nome, m in sorted(cls._medidas.items()):
+            if not m.chamadas:
+                continue
+            resultado[nome] = {"chamadas": m.chamadas, "total_s": m.total,
+                               "media_us": m.total / m.chamadas * 1e6,
+                               "p99_us": m.p99() * 1e6, "max_us": m.maximo * 1e6}
+        return resultado
+
+    @classmethod
+    def tabela(cls) -> list[str]:
+        """Estatísticas formatadas para o terminal."""
+        stats = cls.estatisticas()
+        if not stats:
+            return ["Nenhuma medição registrada" + ("." if cls.ativa else " (instrumentação desligada).")]
+        linhas = [f"{'ponto':<45} {'chamadas':>10} {'total(s)':>10} {'média(us)':>10} "
+                  f"{'p99(us)':>10} {'máx(us)':>10}"]
+        for nome, s in stats.items():
+            linhas.append(f"{nome:<45} {s['chamadas']:>10} {s['total_s']:>10.4f} {s['media_us']:>10.1f} "
+                          f"{s['p99_us']:>10.1f} {s['max_us']:>10.1f}")
+        return linhas
+
+    @classmethod
+    def json(cls) -> str:
+        """Estatísticas em JSON."""
+        return json.dumps({"ativa": cls.ativa, "pontos": cls.estatisticas()},
+                          indent=2, ensure_ascii=False)
+
+    @classmethod
+    def salvar_json(cls, caminho) -> None:
+        """Grava json() em 'caminho'."""
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_text(cls.json(), encoding="utf-8")
+
+
+# Pontos padrão: busca, reprodução e análises
+Instrumentacao.ponto(ArquivoDeMidia, "buscar_por_titulo")
+Instrumentacao.ponto(ArquivoDeMidia, "sugerir")
+Instrumentacao.ponto(ArquivoDeMidia, "reproduzir")
+Instrumentacao.ponto(Playlist, "reproduzir")
+Instrumentacao.ponto(Usuario, "ouvir_midia")
+for _nome, _valor in list(vars(Analises).items()):
+    if isinstance(_valor, staticmethod):
+        Instrumentacao.ponto(Analises, _nome)
+del _nome, _valor
@@ -0,0 +1,261 @@
+# Streaming/leitor.py
+"""
+Leitura do arquivo de dados (config/dados.md): divisão em seções e itens, nos formatos
+chave/valor e em linha, e validação de cada item.
+Cada item lido vira um registro: ("erro", mensagem) ou ("ok", chave, campos, ...).
+A validação é independente do restante da carga (pode rodar em outro processo);
+deduplicação e criação dos objetos ficam com quem carrega, na ordem do arquivo.
+"""
+import itertools
+import re
+from pathlib import Path
+
+from .instrumentacao import Instrumentacao
+
+
+def normalizar(s):
+    """Normaliza textos: strip, compacta espaços e lowercase (chaves de títulos e nomes)."""
+    return " ".join((s or "").strip().split()).lower()
+
+
+def _parse_inline_list(value):
+    v = (value or "").strip()
+    if v.startswith("[") and v.endswith("]"):
+        inner = v[1:-1]
+        return [x.strip() for x in inner.split(",") if x.strip()]
+    return []
+
+
+# primeiro item de uma seção no formato chave/valor ("- titulo: ..."); senão a seção é em linha
+_ITEM_CHAVE_VALOR = re.compile(r"\w+\s*:")
+
+
+def iter_itens_md(linhas, alvos=None):
+    """
+    Lê linha a linha os formatos:
+      ---
+      # Título da seção
+      - chave: valor
+        outra: valor
+    e, em linha (um item por linha, colunas separadas por '|'):
+      # Título da seção
+      - valor | valor | valor
+    Gera tuplas (titulo_da_secao, item) sem guardar o arquivo em memória: item é um dict
+    no formato chave/valor e a lista de colunas (sem strip) no formato em linha.
+    - Uma seção começa em uma linha '# Título' e vai até o próximo '---' ou '# Título';
+      linhas fora de seções são ignoradas.
+    - O formato é escolhido por seção, pelo primeiro item ('chave: valor' ou não).
+    - 'alvos' (títulos normalizados) restringe as seções lidas; as demais são puladas.
+    """
+    titulo = None        # seção atual (None = fora de seção ou fora dos alvos)
+    em_linha = None      # formato da seção atual (None = nenhum item ainda)
+    current = None
+    for raw in linhas:
+        line = raw.rstrip()
+        if not line:
+            continue
+        if line == "---" or line.startswith("# "):
+            if current and titulo is not None:
+                yield titulo, current
+            titulo, em_linha, current = None, None, None
+            if line != "---":
+                titulo = line[2:].strip()
+                if alvos is not None and normalizar(titulo) not in alvos:
+                    titulo = None
+            continue
+        if titulo is None:
+            continue
+        if em_linha:
+            body = line.lstrip()
+            if body.startswith("- "):
+                yield titulo, body[2:].split("|")
+            continue
+        if line.lstrip().startswith("- "):
+            body = line.strip()[2:]
+            if em_linha is None:
+                em_linha = not _ITEM_CHAVE_VALOR.match(body)
+                if em_linha:
+                    yield titulo, body.split("|")
+                    continue
+            if current:
+                yield titulo, current
+            current = {}
+            if body and ":" in body:
+                k, v = body.split(":", 1)
+                current[k.strip()] = v.strip()
+        elif line.startswith("  "):
+            ln = line.strip()
+            if ":" in ln and current is not None:
+                k, v = ln.split(":", 1)
+                current[k.strip()] = v.strip()
+    if current and titulo is not None:
+        yield titulo, current
+
+
+def itens_da_secao(caminho, *nomes):
+    """
+    Gera os itens das seções cujo título (normalizado) está em 'nomes'.
+    Cada chamada faz uma passada pelo arquivo; a memória usada não depende do tamanho dele.
+    """
+    alvos = {normalizar(n) for n in nomes}
+    with Path(caminho).open(encoding="utf-8") as f:
+        for _, item in iter_itens_md(f, alvos):
+            yield item
+
+
+# --------------------------------- Validação ----------------------------------
+def _validar_musica(m):
+    return _registro_musica(m.get("titulo", ""), m.get("duracao", "0"), m.get("artista", ""),
+                            m.get("genero", ""), m)
+
+
+def _registro_musica(titulo, duracao, artista, genero, origem):
+    try:
+        titulo  = titulo.strip()
+        artista = artista.strip()
+        genero  = genero.strip()
+        duracao = int(duracao)
+    except Exception as e:
+        return ("erro", f"Erro ao criar música {origem}: {e}")
+    if duracao <= 0:
+        return ("erro", f"Música '{titulo}': duração inválida ({duracao}).")
+    return ("ok", normalizar(titulo), (titulo, duracao, artista, genero))
+
+
+def _validar_podcast(p):
+    msg_invalido = f"Podcast '{p.get('titulo','')}': episódio inválido '{p.get('episodio','')}'."
+    return _registro_podcast(p.get("titulo", ""), p.get("duracao", "0"), p.get("host", ""),
+                             p.get("temporada", ""), p.get("episodio", "0"), p, msg_invalido)
+
+
+def _registro_podcast(titulo, duracao, host, temporada, episodio, origem, msg_invalido):
+    try:
+        titulo    = titulo.strip()
+        temporada = temporada.strip()
+        host      = host.strip()
+        duracao   = int(duracao)
+        episodio  = int(episodio)
+    except ValueError:
+        return ("erro", msg_invalido)
+    except Exception as e:
+        return ("erro", f"Erro ao criar podcast {origem}: {e}")
+    if duracao <= 0 or episodio <= 0:
+        return ("erro", f"Podcast '{titulo}': duração/episódio inválido (dur={duracao}, ep={episodio}).")
+    return ("ok", normalizar(titulo), (titulo, duracao, host, temporada, episodio), msg_invalido)
+
+
+def _validar_usuario(u):
+    return _registro_usuario(u.get("nome", ""))
+
+
+def _registro_usuario(nome):
+    nome = nome.strip()
+    if not nome:
+        return None
+    return ("ok", normalizar(nome), nome)
+
+
+def _validar_playlist(pl):
+    nome  = (pl.get("nome", "")).strip()
+    dono  = (pl.get("usuario", "")).strip()
+    itens = _parse_inline_list(pl.get("itens", "[]"))
+    if not nome:
+        return ("erro", "Playlist sem nome ignorada.")
+    return ("ok", normalizar(nome), (nome, dono, normalizar(dono), [(t, normalizar(t)) for t in itens]))
+
+
+# Formato em linha: as colunas de um item vêm de um único split('|') (ver iter_itens_md)
+def _validar_musica_linha(c):
+    if len(c) != 4:
+        return ("erro", f"Música '{'|'.join(c).strip()}': esperadas 4 colunas "
+                        "(título | duração | artista | gênero).")
+    return _registro_musica(c[0], c[1], c[2], c[3], f"'{'|'.join(c).strip()}'")
+
+
+def _validar_podcast_linha(c):
+    # título | duração | host | temporada | episódio, ou com o canal na 3ª coluna e o host na 6ª
+    if len(c) not in (5, 6):
+        return ("erro", f"Podcast '{'|'.join(c).strip()}': esperadas 5 ou 6 colunas "
+                        "(título | duração | host | temporada | episódio [| host]).")
+    titulo, duracao, host, temporada, episodio = c[:5]
+    if len(c) == 6:
+        host = c[5]
+    msg_invalido = f"Podcast '{titulo.strip()}': episódio inválido '{episodio.strip()}'."
+    return _registro_podcast(titulo, duracao, host, temporada, episodio,
+                             f"'{'|'.join(c).strip()}'", msg_invalido)
+
+
+def _validar_usuario_linha(c):
+    if len(c) != 1:
+        return ("erro", f"Usuário '{'|'.join(c).strip()}': esperada 1 coluna (nome).")
+    return _registro_usuario(c[0])
+
+
+def _validar_sem_linha(c):
+    return ("erro", f"Item '{'|'.join(c).strip()}': seção sem formato em linha (use 'chave: valor').")
+
+
+# tipo -> (títulos aceitos da seção, validador chave/valor, validador em linha)
+SECOES_CARGA = {
+    "musicas":   (("Músicas", "Musicas"), _validar_musica, _validar_musica_linha),
+    "podcasts":  (("Podcasts",), _validar_podcast, _validar_podcast_linha),
+    "usuarios":  (("Usuários", "Usuarios"), _validar_usuario, _validar_usuario_linha),
+    "playlists": (("Playlists",), _validar_playlist, _validar_sem_linha),
+}
+
+
+def validar_item(tipo, item):
+    """Registro do item com o validador do seu formato (dict = chave/valor, lista = em linha)."""
+    _, validar, validar_linha = SECOES_CARGA[tipo]
+    return validar_linha(item) if type(item) is list else validar(item)
+
+
+def registros_sequenciais(caminho, tipo):
+    """Valida os itens de uma seção no próprio processo, lendo o arquivo em streaming."""
+    nomes, validar, validar_linha = SECOES_CARGA[tipo]
+    itens = Instrumentacao.iterar("carregar_dados.divisao", itens_da_secao(caminho, *nomes))
+    validar = Instrumentacao.envolver("carregar_dados.validacao", validar)
+    validar_linha = Instrumentacao.envolver("carregar_dados.validacao", validar_linha)
+    for item in itens:
+        registro = validar_linha(item) if type(item) is list else validar(item)
+        if registro is not None:
+            yield registro
+
+
+# ------------------------- Seções nos bytes do arquivo -------------------------
+def _linhas_com_prefixo(mm, prefixo):
+    """Gera (ini, fim) de cada linha de 'mm' que começa com 'prefixo' (fim inclui a quebra de linha)."""
+    total = len(mm)
+    marca = b"\n" + prefixo
+    ini = 0 if mm[:len(prefixo)] == prefixo else None
+    busca = 0
+    while True:
+        if ini is None:
+            pos = mm.find(marca, busca)
+            if pos == -1:
+                return
+            ini = pos + 1
+        nl = mm.find(b"\n", ini)
+        fim = total if nl == -1 else nl + 1
+        yield ini, fim
+        ini, busca = None, fim - 1
+
+
+def secoes(mm):
+    """
+    Gera (tipo, ini, fim) do corpo de cada seção conhecida: da linha '# Título' até a
+    próxima linha '---' ou '# Título' (como em iter_itens_md). 'mm': mmap ou bytes do arquivo.
+    """
+    tipos = {normalizar(n): tipo for tipo, (nomes, *_) in SECOES_CARGA.items() for n in nomes}
+    total = len(mm)
+    # linhas que delimitam seções, em ordem de posição
+    limites = sorted(itertools.chain(
+        ((ini, fim) for ini, fim in _linhas_com_prefixo(mm, b"---") if not mm[ini + 3:fim].strip()),
+        _linhas_com_prefixo(mm, b"# ")))
+    limites.append((total, total))
+    for (ini, fim_titulo), (prox, _) in zip(limites, limites[1:]):
+        if mm[ini:ini + 2] != b"# ":
+            continue
+        tipo = tipos.get(normalizar(mm[ini + 2:fim_titulo].decode("utf-8").strip()))
+        if tipo is not None:
+            yield tipo, fim_titulo, prox
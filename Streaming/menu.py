@@ -21,7 +21,9 @@ class Menu:
             "6": "Criar nova playlist",
             "7": "Concatenar playlists",
             "8": "Gerar relatório",
-            "9": "Sair"
+            "9": "Sair",
+            "10": "Estatísticas de desempenho (stats)",
+            "11": "Recomendações para você"
         }
 
     def exibir_menu_inicial(self) -> str:
@@ -1,27 +1,57 @@
 # Streaming/musica.py
+from abc import ABCMeta
+
 from .arquivo_de_midia import ArquivoDeMidia
 
-class Musica(ArquivoDeMidia):
-    """Subclasse de ArquivoDeMidia que representa uma música."""
+class Musica(ArquivoDeMidia, metaclass=ABCMeta):
+    """
+    Subclasse de ArquivoDeMidia que representa uma música.
+    ABCMeta só para Musica.register(): MusicaColunar tem a mesma interface sem os slots.
+    """
+
+    __slots__ = ("titulo", "artista", "duracao", "reproducoes", "_chave",
+                 "genero", "avaliacoes", "qtd_avaliacoes", "soma_avaliacoes",
+                 "nota_min", "nota_max", "histograma")
+
+    # False -> não guarda a lista de notas, só os agregados (economiza memória)
+    guardar_avaliacoes = True
 
     def __init__(self, titulo: str, duracao: int, artista: str,
                  genero: str, reproducoes: int = 0):
         """Inicializa uma música com título, duração (s), artista e gênero."""
-        super().__init__(titulo, duracao, artista, reproducoes)
+        # gênero definido antes da base para entrar no índice do catálogo
         self.genero = (genero or "").strip()
+        super().__init__(titulo, duracao, artista, reproducoes)
         self.avaliacoes: list[int] = []
+        # agregados das notas, atualizados em avaliar()
+        self.qtd_avaliacoes = 0
+        self.soma_avaliacoes = 0
+        self.nota_min: int | None = None
+        self.nota_max: int | None = None
+        self.histograma: list[int] | None = None  # criado na primeira nota (notas 0..5)
 
     def avaliar(self, nota: int) -> None:
         """Adiciona uma avaliação de 0 a 5 (inclusive)."""
         if not isinstance(nota, int) or nota < 0 or nota > 5:
             raise ValueError("A nota deve estar entre 0 e 5 (inteiro).")
-        self.avaliacoes.append(nota)
+        if self.guardar_avaliacoes:
+            self.avaliacoes.append(nota)
+        self.qtd_avaliacoes += 1
+        self.soma_avaliacoes += nota
+        if self.nota_min is None or nota < self.nota_min:
+            self.nota_min = nota
+        if self.nota_max is None or nota > self.nota_max:
+            self.nota_max = nota
+        if self.histograma is None:
+            self.histograma = [0] * 6
+        self.histograma[nota] += 1
+        ArquivoDeMidia.contadores.registrar_avaliacao(nota)
 
     def media_avaliacoes(self) -> float:
-        """Calcula e retorna a média das avaliações (0.0 se não houver)."""
-        if not self.avaliacoes:
+        """Retorna a média das avaliações em O(1) (0.0 se não houver)."""
+        if not self.qtd_avaliacoes:
             return 0.0
-        return sum(self.avaliacoes) / len(self.avaliacoes)
+        return self.soma_avaliacoes / self.qtd_avaliacoes
 
     def __str__(self) -> str:
         """Mostra informações principais da música."""
@@ -32,4 +62,4 @@ class Musica(ArquivoDeMidia):
         """Representação detalhada para depuração."""
         return (f"Musica(titulo='{self.titulo}', duracao={self.duracao}, "
                 f"artista='{self.artista}', genero='{self.genero}', "
-                f"reproducoes={self.reproducoes}, avaliacoes={len(self.avaliacoes)})")
+                f"reproducoes={self.reproducoes}, avaliacoes={self.qtd_avaliacoes})")
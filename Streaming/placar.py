@@ -0,0 +1,97 @@
+# Streaming/placar.py
+from bisect import bisect_left, bisect_right
+
+
+class Placar:
+    """
+    Ranking "ao vivo" dos melhores objetos segundo uma chave.
+    - Guarda só os 'capacidade' melhores, ordenados; consulta em O(k).
+    - Atualização em O(capacidade) a cada incremento notificado.
+    - Exato enquanto a chave dos objetos acompanhados só melhora (contadores que só
+      crescem) e toda melhora é notificada por atualizar().
+    """
+
+    def __init__(self, chave, capacidade: int = 10, maior_melhor: bool = False):
+        """
+        chave: função obj -> valor comparável.
+        maior_melhor: False -> menores chaves primeiro (ex.: (-reproducoes, titulo));
+                      True  -> maiores chaves primeiro (mesmo critério de max()).
+        """
+        if capacidade <= 0:
+            raise ValueError("Capacidade do placar deve ser positiva.")
+        self.chave = chave
+        self.capacidade = capacidade
+        self.maior_melhor = maior_melhor
+        self._membros = set()   # ids dos objetos acompanhados
+        self._chaves = []       # chaves do topo, em ordem crescente
+        self._itens = []        # objetos do topo, paralelos a _chaves
+
+    def acompanhar(self, obj) -> None:
+        """Passa a considerar 'obj' no ranking (pode entrar direto no topo)."""
+        self._membros.add(id(obj))
+        self.atualizar(obj)
+
+    def atualizar(self, obj) -> None:
+        """Reposiciona 'obj' após a melhora da sua chave; ignora objetos não acompanhados."""
+        if id(obj) not in self._membros:
+            return
+        self._retirar(obj)
+        k = self.chave(obj)
+        if len(self._chaves) >= self.capacidade:
+            # pior do topo: início (maior_melhor) ou fim (menor_melhor) da lista
+            pior = 0 if self.maior_melhor else -1
+            if (k <= self._chaves[pior]) if self.maior_melhor else (k >= self._chaves[pior]):
+                return
+            del self._chaves[pior]
+            del self._itens[pior]
+        # empates: mantém a ordem de chegada, como sorted()/max() fariam
+        pos = bisect_left(self._chaves, k) if self.maior_melhor else bisect_right(self._chaves, k)
+        self._chaves.insert(pos, k)
+        self._itens.insert(pos, obj)
+
+    def _retirar(self, obj) -> None:
+        """Remove 'obj' do topo, se estiver lá (busca por identidade)."""
+        for i, x in enumerate(self._itens):
+            if x is obj:
+                del self._chaves[i]
+                del self._itens[i]
+                return
+
+    def remover(self, obj) -> bool:
+        """
+        Deixa de acompanhar 'obj'. Retorna True se ele estava no topo: a vaga só é
+        preenchida de novo recomeçando o placar com a coleção (ver remontar).
+        """
+        self._membros.discard(id(obj))
+        tamanho = len(self._itens)
+        self._retirar(obj)
+        return len(self._itens) != tamanho
+
+    def limpar(self) -> None:
+        """Esquece todos os objetos acompanhados."""
+        self._membros.clear()
+        self._chaves.clear()
+        self._itens.clear()
+
+    def remontar(self, colecao) -> None:
+        """Recomeça o placar acompanhando cada objeto de 'colecao'."""
+        self.limpar()
+        for obj in colecao:
+            self.acompanhar(obj)
+
+    def top(self, n: int) -> list:
+        """Os 'n' melhores (no máximo 'capacidade'), do melhor para o pior."""
+        if n <= 0:
+            return []
+        if self.maior_melhor:
+            return self._itens[::-1][:n]
+        return self._itens[:n]
+
+    def melhor(self):
+        """O melhor objeto acompanhado, ou None se não houver."""
+        topo = self.top(1)
+        return topo[0] if topo else None
+
+    def __len__(self) -> int:
+        """Quantidade de objetos acompanhados."""
+        return len(self._membros)
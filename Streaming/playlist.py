@@ -1,12 +1,60 @@
 # Streaming/playlist.py
+from collections import Counter
+from itertools import islice
+
 from .arquivo_de_midia import ArquivoDeMidia
 
+_MASCARA = (1 << 64) - 1
+
+
+def _descartar(linha: str) -> None:
+    """Saída que não mostra nada (reprodução silenciosa)."""
+
+
+class _Concatenacao:
+    """
+    Nó imutável de uma concatenação preguiçosa (estilo rope).
+    Cada lado é outro nó ou o dicionário de itens congelado de uma playlist.
+    """
+
+    __slots__ = ("esq", "dir", "tamanho")
+
+    def __init__(self, esq, dir):
+        self.esq = esq
+        self.dir = dir
+        self.tamanho = len(esq) if isinstance(esq, dict) else esq.tamanho
+        self.tamanho += len(dir) if isinstance(dir, dict) else dir.tamanho
+
+    def __iter__(self):
+        """Percorre as mídias da esquerda para a direita (pilha explícita, sem recursão)."""
+        pilha = [self]
+        while pilha:
+            no = pilha.pop()
+            if isinstance(no, dict):
+                yield from no.values()
+            else:
+                pilha.append(no.dir)
+                pilha.append(no.esq)
+
+
 class Playlist:
     """
     Representa uma playlist do sistema.
-    Atributos: nome (str), usuario (Usuario), itens (list[ArquivoDeMidia]), reproducoes (int).
+    Atributos: nome (str), usuario (Usuario), itens (sequência de ArquivoDeMidia), reproducoes (int).
+    Os itens ficam em um dicionário ordenado com índice pela chave da mídia:
+    pertinência, remoção e detecção de duplicatas em O(1).
+    Concatenar (+) é O(1): a nova playlist é uma visão sobre os itens das originais,
+    que só vira uma cópia própria quando alguma delas é editada (copy-on-write).
+    Uma impressão digital do multiconjunto de títulos é mantida a cada alteração:
+    __eq__ descarta playlists diferentes em O(1) e o hash (impressao()) permite
+    guardar playlists em sets/dicts e juntar as iguais. O hash muda quando a playlist
+    é editada: não editar uma playlist enquanto ela for chave de um set/dict.
     """
 
+    placares = []  # placares ao vivo avisados a cada reprodução da playlist
+    fragmentos = None  # ContadorFragmentado no modo concorrente (ver ReproducaoConcorrente)
+    recomendador = None  # Recomendador avisado a cada mídia adicionada (ver Streaming/recomendacao.py)
+
     def __init__(self, nome: str, usuario):
         """Cria uma playlist vazia para um usuário (usuario deve ser um objeto Usuario)."""
         nome_limpo = nome.strip()
@@ -15,53 +63,169 @@ class Playlist:
 
         self.nome = nome_limpo                    # nome da playlist
         self.usuario = usuario                    # dono/criador da playlist (objeto Usuario)
-        self.itens: list[ArquivoDeMidia] = []     # lista de mídias (músicas/podcasts)
+        self._itens: dict[int, ArquivoDeMidia] = {}   # seq -> mídia, na ordem de inserção
+        self._indice: dict[tuple, list[int]] = {}     # chave da mídia -> seqs (ordem de inserção)
+        self._seq = 0                             # próximo número de sequência
+        self._lista = None                        # cache de 'itens' (refeito após alterações)
+        self._rope = None                         # concatenação preguiçosa (None = itens próprios)
+        self._contagem = None                     # chave -> ocorrências na concatenação (leituras)
+        self._compartilhado = False               # _itens referenciado por alguma concatenação
+        self._impressao = (0, 0)                  # somas de hashes dos títulos (ver _hashes_titulo)
         self.reproducoes = 0                      # contador de execuções da playlist
 
+    @property
+    def itens(self) -> tuple:
+        """Mídias na ordem da playlist (somente leitura: use adicionar_midia/remover_midia)."""
+        if self._lista is None:
+            self._lista = tuple(self)
+        return self._lista
+
+    @itens.setter
+    def itens(self, midias) -> None:
+        """Substitui todos os itens (reconstrói o índice)."""
+        self._rope = None
+        self._contagem = None
+        self._compartilhado = False
+        self._itens = {}
+        self._indice = {}
+        self._lista = None
+        self._impressao = (0, 0)
+        for midia in midias:
+            self._inserir(midia)
+
+    @staticmethod
+    def _hashes_titulo(midia: ArquivoDeMidia) -> tuple[int, int]:
+        """Dois hashes de 64 bits do título em minúsculas (o segundo não linear no primeiro)."""
+        h = hash(midia.titulo.strip().lower()) & _MASCARA
+        return h, (h * h) & _MASCARA
+
+    def _congelar(self):
+        """Conteúdo atual como parte imutável de uma concatenação."""
+        if self._rope is not None:
+            return self._rope
+        self._compartilhado = True
+        return self._itens
+
+    def _preparar_edicao(self) -> None:
+        """Copy-on-write: garante itens próprios antes de qualquer alteração."""
+        if self._rope is not None:
+            midias = self._rope
+            self._rope = None
+            self._contagem = None
+            self._itens = {}
+            self._indice = {}
+            self._impressao = (0, 0)
+            for midia in midias:
+                self._inserir(midia)
+        elif self._compartilhado:
+            self._itens = dict(self._itens)
+            self._compartilhado = False
+
+    def _inserir(self, midia: ArquivoDeMidia) -> None:
+        self._itens[self._seq] = midia
+        self._indice.setdefault(midia.chave, []).append(self._seq)
+        self._seq += 1
+        self._lista = None
+        h1, h2 = self._hashes_titulo(midia)
+        self._impressao = ((self._impressao[0] + h1) & _MASCARA,
+                           (self._impressao[1] + h2) & _MASCARA)
+
     def adicionar_midia(self, midia: ArquivoDeMidia) -> None:
         """Adiciona uma mídia (música/podcast) à playlist."""
         if not isinstance(midia, ArquivoDeMidia):
             raise ValueError("Apenas objetos de mídia podem ser adicionados.")
-        self.itens.append(midia)
+        self._preparar_edicao()
+        if Playlist.recomendador is not None:
+            Playlist.recomendador.adicionada(self, midia)
+        self._inserir(midia)
+
+    def ultimas(self, n: int) -> list:
+        """As 'n' últimas mídias da playlist, da mais recente para a mais antiga."""
+        if self._rope is not None:
+            return list(self.itens[::-1][:n])
+        return list(islice(reversed(self._itens.values()), n))
 
     def remover_midia(self, midia: ArquivoDeMidia) -> None:
-        """Remove uma mídia da playlist."""
-        if midia in self.itens:
-            self.itens.remove(midia)
-        else:
+        """Remove uma mídia da playlist (a primeira igual a 'midia')."""
+        self._preparar_edicao()
+        seqs = self._indice.get(midia.chave) if isinstance(midia, ArquivoDeMidia) else None
+        if not seqs:
             raise ValueError("Mídia não encontrada na playlist.")
+        removida = self._itens.pop(seqs.pop(0))
+        if not seqs:
+            del self._indice[midia.chave]
+        self._lista = None
+        h1, h2 = self._hashes_titulo(removida)
+        self._impressao = ((self._impressao[0] - h1) & _MASCARA,
+                           (self._impressao[1] - h2) & _MASCARA)
+
+    def contar(self, midia: ArquivoDeMidia) -> int:
+        """Quantas vezes a mídia (ou uma igual a ela) aparece na playlist."""
+        if not isinstance(midia, ArquivoDeMidia):
+            return 0
+        if self._rope is not None:
+            # leitura não copia a concatenação: conta as chaves uma vez e guarda
+            if self._contagem is None:
+                self._contagem = Counter(m.chave for m in self._rope)
+            return self._contagem[midia.chave]
+        # itens compartilhados com uma concatenação continuam valendo para leitura
+        return len(self._indice.get(midia.chave, ()))
+
+    def __contains__(self, midia) -> bool:
+        """Permite 'midia in playlist' em O(1)."""
+        return self.contar(midia) > 0
 
-    def reproduzir(self) -> None:
+    def __iter__(self):
+        """Itera sobre as mídias sem montar a lista (nem a concatenação)."""
+        if self._rope is not None:
+            return iter(self._rope)
+        return iter(self._itens.values())
+
+    def reproduzir(self, saida=print) -> None:
         """
         Reproduz todos os itens da playlist.
         Soma 1 nas reproduções da playlist e em cada mídia contida.
+        saida: função que recebe cada linha (padrão: print); None não mostra nada.
         """
-        if len(self.itens) == 0:
-            print(f"Playlist '{self.nome}' está vazia.")
+        if saida is None:
+            saida = _descartar
+        if len(self) == 0:
+            saida(f"Playlist '{self.nome}' está vazia.")
             return
 
-        print(f"Reproduzindo playlist: {self.nome} (itens: {len(self.itens)})")
+        saida(f"Reproduzindo playlist: {self.nome} (itens: {len(self)})")
         for midia in self.itens:
-            midia.reproduzir()
-        self.reproducoes += 1
-        print(f"Fim da playlist '{self.nome}'. Reproduções: {self.reproducoes}")
+            midia.reproduzir(saida)
+        if Playlist.fragmentos is not None:
+            Playlist.fragmentos.incrementar(self)
+        else:
+            self.reproducoes += 1
+            for placar in Playlist.placares:
+                placar.atualizar(self)
+        saida(f"Fim da playlist '{self.nome}'. Reproduções: {self.reproducoes}")
 
     def __add__(self, outra):
         """
-        Concatena duas playlists.
+        Concatena duas playlists em O(1).
         Mantém o nome da primeira, concatena itens e soma as reproduções.
+        Os itens não são copiados: editar qualquer uma das playlists depois
+        não altera as demais (copy-on-write).
         """
         if not isinstance(outra, Playlist):
             return NotImplemented
 
         nova = Playlist(self.nome, self.usuario)          # mesmo nome e mesmo usuário da primeira
-        nova.itens = list(self.itens) + list(outra.itens) # concatena itens
+        nova._rope = _Concatenacao(self._congelar(), outra._congelar())
+        nova._impressao = ((self._impressao[0] + outra._impressao[0]) & _MASCARA,
+                           (self._impressao[1] + outra._impressao[1]) & _MASCARA)
         nova.reproducoes = self.reproducoes + outra.reproducoes
         return nova
 
     def __len__(self) -> int:
         """Retorna a quantidade de itens da playlist."""
-        return len(self.itens)
+        if self._rope is not None:
+            return self._rope.tamanho
+        return len(self._itens)
 
     def __getitem__(self, index: int) -> ArquivoDeMidia:
         """Permite acessar itens por índice: playlist[0]."""
@@ -73,6 +237,8 @@ class Playlist:
         - tiverem o mesmo nome (ignora maiúsculas/minúsculas);
         - tiverem o mesmo usuário (mesma instância);
         - tiverem os mesmos títulos de mídias (ignora ordem).
+        Tamanho ou impressão digital diferentes decidem em O(1); só impressões
+        iguais levam à comparação completa dos títulos.
         """
         if not isinstance(outra, Playlist):
             return NotImplemented
@@ -83,18 +249,32 @@ class Playlist:
         if self.nome.strip().lower() != outra.nome.strip().lower():
             return False
 
+        if len(self) != len(outra) or self._impressao != outra._impressao:
+            return False
+
         def titulos(pl):
-            return [m.titulo.strip().lower() for m in pl.itens]
+            return [m.titulo.strip().lower() for m in pl]
 
         return sorted(titulos(self)) == sorted(titulos(outra))
 
+    def impressao(self) -> tuple:
+        """
+        Impressão digital do conteúdo: usuário, nome e títulos (mesma em playlists iguais
+        por __eq__). Muda quando a playlist é editada.
+        """
+        return (id(self.usuario), self.nome.strip().lower(), len(self), self._impressao)
+
+    def __hash__(self) -> int:
+        """Hash coerente com __eq__ (ver impressao()); não editar a playlist enquanto for chave."""
+        return hash(self.impressao())
+
     def __str__(self) -> str:
         """Resumo da playlist."""
         return (f"Playlist: {self.nome} | Usuário: {self.usuario.nome} | "
-                f"Itens: {len(self.itens)} | Reproduções: {self.reproducoes}")
+                f"Itens: {len(self)} | Reproduções: {self.reproducoes}")
 
     def __repr__(self) -> str:
         """Representação detalhada para depuração."""
         cls = self.__class__.__name__
         return (f"{cls}(nome='{self.nome}', usuario='{self.usuario.nome}', "
-                f"itens={len(self.itens)}, reproducoes={self.reproducoes})")
+                f"itens={len(self)}, reproducoes={self.reproducoes})")
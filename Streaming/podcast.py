@@ -1,8 +1,16 @@
 # Streaming/podcast.py
+from abc import ABCMeta
+
 from .arquivo_de_midia import ArquivoDeMidia
 
-class Podcast(ArquivoDeMidia):
-    """Subclasse de ArquivoDeMidia que representa um podcast."""
+class Podcast(ArquivoDeMidia, metaclass=ABCMeta):
+    """
+    Subclasse de ArquivoDeMidia que representa um podcast.
+    ABCMeta só para Podcast.register(): PodcastColunar tem a mesma interface sem os slots.
+    """
+
+    __slots__ = ("titulo", "artista", "duracao", "reproducoes", "_chave",
+                 "temporada", "episodio", "host")
 
     def __init__(self, titulo: str, duracao: int, host: str,
                  temporada: str, episodio: int, reproducoes: int = 0):
@@ -23,12 +31,18 @@ class Podcast(ArquivoDeMidia):
 
         # Em ArquivoDeMidia, 'artista' representa quem apresenta/assina o conteúdo.
         # Para Podcast, usamos o 'host' como 'artista' na base.
-        super().__init__(titulo, duracao, host_limpo, reproducoes)
+        # (chamada explícita, sem super(): PodcastColunar reaproveita este __init__)
+        ArquivoDeMidia.__init__(self, titulo, duracao, host_limpo, reproducoes)
 
         self.temporada = temporada_limpa
         self.episodio = episodio
         self.host = host_limpo
 
+    def renomear(self, titulo: str, artista: str) -> None:
+        """Troca título e host (o 'artista' da base)."""
+        ArquivoDeMidia.renomear(self, titulo, artista)
+        self.host = self.artista
+
     def __str__(self) -> str:
         """Mostra informações principais do podcast."""
         return (f"Podcast: {self.titulo} | Temporada: {self.temporada} | "
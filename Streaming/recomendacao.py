@@ -0,0 +1,143 @@
+# Streaming/recomendacao.py
+import threading
+from heapq import nlargest
+from operator import itemgetter
+
+from .historico import HistoricoDeReproducao
+
+
+class Recomendador:
+    """
+    Recomendações item a item ("porque você ouviu X") por co-ocorrência de mídias,
+    atualizadas a cada evento, sem reconstruir o modelo:
+    - Playlist.adicionar_midia: a mídia co-ocorre com as 'janela_playlist' últimas
+      mídias da playlist (peso 'peso_playlist');
+    - Usuario.ouvir_midia: a mídia co-ocorre com as 'janela_historico' mídias que o
+      usuário ouviu antes dela (peso 1).
+    - Modelo esparso e simétrico: código -> {código vizinho: peso}, com os códigos
+      de mídia de HistoricoDeReproducao (chaves int: sem o __hash__ em Python das mídias).
+    - Memória: cada mídia guarda até 'max_vizinhos' vizinhos (ao passar do dobro, ficam
+      só os de maior peso) e o modelo até 'max_pares' pares; acima disso, os pares de
+      peso <= 'corte' são podados e o corte sobe até o modelo voltar a 3/4 do orçamento.
+    - Remover uma mídia de uma playlist não desfaz os pesos já somados.
+    """
+
+    def __init__(self, max_pares: int = 2_000_000, max_vizinhos: int = 50,
+                 janela_historico: int = 5, janela_playlist: int = 10, peso_playlist: int = 2):
+        """Cria um modelo vazio com o orçamento de memória informado."""
+        if max_pares <= 0 or max_vizinhos <= 0:
+            raise ValueError("Orçamento do recomendador deve ser positivo.")
+        self.max_pares = max_pares
+        self.max_vizinhos = max_vizinhos
+        self.janela_historico = janela_historico
+        self.janela_playlist = janela_playlist
+        self.peso_playlist = peso_playlist
+        self._trava = threading.Lock()
+        self.limpar()
+
+    def limpar(self) -> None:
+        """Esquece o modelo inteiro (ex.: após recarregar os dados)."""
+        self._vizinhos = {}     # código -> {código: peso}
+        self.pares = 0          # entradas somadas de todos os dicionários de vizinhos
+        self.corte = 0          # pares com peso <= corte já foram podados
+        self.podas = 0
+
+    # ------------------------------ atualização ------------------------------
+    def _somar(self, a, b, peso: int) -> None:
+        for x, y in ((a, b), (b, a)):
+            viz = self._vizinhos.get(x)
+            if viz is None:
+                viz = self._vizinhos[x] = {}
+            anterior = viz.get(y)
+            if anterior is None:
+                viz[y] = peso
+                self.pares += 1
+                if len(viz) > 2 * self.max_vizinhos:
+                    self._podar_vizinhos(x, viz)
+            else:
+                viz[y] = anterior + peso
+
+    def _podar_vizinhos(self, cod: int, viz: dict) -> None:
+        mantidos = dict(nlargest(self.max_vizinhos, viz.items(), key=itemgetter(1)))
+        self.pares -= len(viz) - len(mantidos)
+        self._vizinhos[cod] = mantidos
+
+    def _podar(self) -> None:
+        """Poda global: sobe o corte até o modelo caber em 3/4 de max_pares."""
+        alvo = self.max_pares * 3 // 4
+        while self.pares > alvo:
+            self.corte += 1
+            for cod in list(self._vizinhos):
+                viz = self._vizinhos[cod]
+                mantidos = {c: p for c, p in viz.items() if p > self.corte}
+                self.pares -= len(viz) - len(mantidos)
+                if mantidos:
+                    self._vizinhos[cod] = mantidos
+                else:
+                    del self._vizinhos[cod]
+        self.podas += 1
+
+    def _coocorrer(self, cod: int, anteriores, peso: int) -> None:
+        for outro in anteriores:
+            if outro != cod:
+                self._somar(cod, outro, peso)
+        if self.pares > self.max_pares:
+            self._podar()
+
+    def adicionada(self, playlist, midia) -> None:
+        """Aviso de Playlist.adicionar_midia (antes de a mídia entrar na playlist)."""
+        codigo = HistoricoDeReproducao.codigo
+        anteriores = [codigo(m) for m in playlist.ultimas(self.janela_playlist)]
+        cod = codigo(midia)
+        with self._trava:
+            self._coocorrer(cod, anteriores, self.peso_playlist)
+
+    def ouvidas(self, usuario, midias) -> None:
+        """Aviso de reproduções do usuário, na ordem (antes de entrarem no histórico)."""
+        janela, codigo = self.janela_historico, HistoricoDeReproducao.codigo
+        anteriores = usuario.historico.codigos_recentes(janela)
+        with self._trava:
+            for midia in midias:
+                cod = codigo(midia)
+                self._coocorrer(cod, anteriores[-janela:], 1)
+                anteriores.append(cod)
+
+    def ouvida(self, usuario, midia) -> None:
+        """Aviso de Usuario.ouvir_midia (antes de a mídia entrar no histórico)."""
+        self.ouvidas(usuario, (midia,))
+
+    # -------------------------------- consulta --------------------------------
+    def similares(self, midia, k: int = 5) -> list[tuple[object, int]]:
+        """[(mídia, peso)] das 'k' mídias que mais co-ocorrem com 'midia'."""
+        cod = HistoricoDeReproducao.codigo(midia)
+        with self._trava:
+            viz = self._vizinhos.get(cod)
+            melhores = nlargest(k, viz.items(), key=itemgetter(1)) if viz else []
+        return [(HistoricoDeReproducao.midia(c), peso) for c, peso in melhores]
+
+    def para_usuario(self, usuario, k: int = 5) -> list[tuple[object, object]]:
+        """
+        [(sugestão, motivo)]: "porque você ouviu <motivo>", a partir das últimas
+        'janela_historico' mídias ouvidas (mais recentes pesam mais); não sugere
+        mídias que estão entre as recentes.
+        """
+        recentes = usuario.historico.codigos_recentes(self.janela_historico)[::-1]
+        pontos, motivos, melhor = {}, {}, {}
+        with self._trava:
+            for posicao, ouvida in enumerate(recentes):
+                fator = 1.0 / (posicao + 1)
+                for sugestao, peso in self._vizinhos.get(ouvida, {}).items():
+                    contribuicao = peso * fator
+                    pontos[sugestao] = pontos.get(sugestao, 0.0) + contribuicao
+                    if contribuicao > melhor.get(sugestao, 0.0):
+                        melhor[sugestao] = contribuicao
+                        motivos[sugestao] = ouvida
+        for ouvida in recentes:
+            pontos.pop(ouvida, None)
+        escolhidas = nlargest(k, pontos.items(), key=itemgetter(1))
+        midia = HistoricoDeReproducao.midia
+        return [(midia(sugestao), midia(motivos[sugestao])) for sugestao, _ in escolhidas]
+
+    def __len__(self) -> int:
+        """Quantidade de mídias com vizinhos no modelo."""
+        return len(self._vizinhos)
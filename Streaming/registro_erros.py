@@ -0,0 +1,143 @@
+# Streaming/registro_erros.py
+import atexit
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+class RegistroDeErros:
+    """
+    Log de erros com buffer em memória e gravação em segundo plano.
+    - registrar() só enfileira a linha (com o horário da chamada); uma thread grava
+      em lote quando o buffer atinge 'limite_lote' ou a cada 'intervalo' segundos,
+      e o que restar é gravado ao encerrar o programa (atexit).
+    - Rotação por tamanho: erros.log -> erros.log.1 -> ... -> erros.log.<backups>.
+    - Mensagens idênticas repetidas dentro de 'janela_duplicadas' segundos são
+      suprimidas; ao fim da janela grava-se uma linha com a quantidade suprimida.
+    Formato de cada linha: [dd/mm/aaaa hh:mm:ss] mensagem
+    """
+
+    def __init__(self, caminho, limite_lote: int = 256, intervalo: float = 1.0,
+                 max_bytes: int = 5 * 1024 * 1024, backups: int = 3,
+                 janela_duplicadas: float = 60.0):
+        """Configura o registro; a thread só é criada na primeira mensagem."""
+        self.caminho = Path(caminho)
+        self.limite_lote = limite_lote
+        self.intervalo = intervalo
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.janela_duplicadas = janela_duplicadas
+
+        self.suprimidas = 0          # total de mensagens repetidas não gravadas
+        self._buffer: list[str] = []
+        self._repetidas = {}         # mensagem -> [fim da janela, quantidade suprimida]
+        self._cond = threading.Condition()
+        self._gravacao = threading.Lock()   # uma gravação por vez (thread ou descarregar())
+        self._thread = None
+        self._parar = False
+
+    @staticmethod
+    def _linha(msg: str) -> str:
+        return f"[{datetime.now().strftime('%d/%m/%Y %H:%M:%S')}] {msg}\n"
+
+    def registrar(self, msg: str) -> None:
+        """Enfileira a mensagem (ou conta como suprimida, se for repetida)."""
+        agora = time.monotonic()
+        with self._cond:
+            janela = self._repetidas.get(msg)
+            if janela is not None and agora < janela[0]:
+                janela[1] += 1
+                self.suprimidas += 1
+                return
+            if janela is not None and janela[1]:
+                self._buffer.append(self._linha(f"(mensagem repetida {janela[1]}x) {msg}"))
+            if self.janela_duplicadas > 0:
+                self._repetidas[msg] = [agora + self.janela_duplicadas, 0]
+            self._buffer.append(self._linha(msg))
+            if self._thread is None:
+                self._iniciar()
+            if len(self._buffer) >= self.limite_lote:
+                self._cond.notify()
+
+    def _iniciar(self) -> None:
+        self._parar = False
+        self._thread = threading.Thread(target=self._laco, name="registro-erros", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def _laco(self) -> None:
+        while True:
+            with self._cond:
+                if not self._parar and len(self._buffer) < self.limite_lote:
+                    self._cond.wait(self.intervalo)
+                parar = self._parar
+            self.descarregar()
+            if parar:
+                return
+
+    def _fechar_janelas(self, todas: bool) -> None:
+        """Gera as linhas de resumo das janelas de repetição encerradas (chamar com o lock)."""
+        agora = time.monotonic()
+        for msg, (fim, qtd) in list(self._repetidas.items()):
+            if todas or agora >= fim:
+                if qtd:
+                    self._buffer.append(self._linha(f"(mensagem repetida {qtd}x) {msg}"))
+                del self._repetidas[msg]
+
+    def descarregar(self, encerrar_janelas: bool = False) -> None:
+        """Grava agora tudo o que está no buffer (pode ser chamado de qualquer thread)."""
+        with self._gravacao:
+            with self._cond:
+                self._fechar_janelas(encerrar_janelas)
+                lote, self._buffer = self._buffer, []
+            if not lote:
+                return
+            texto = "".join(lote)
+            try:
+                self.caminho.parent.mkdir(parents=True, exist_ok=True)
+                self._rotacionar(len(texto.encode("utf-8")))
+                with self.caminho.open("a", encoding="utf-8") as f:
+                    f.write(texto)
+            except OSError:
+                # sem onde registrar: devolve ao buffer para a próxima tentativa
+                with self._cond:
+                    self._buffer[:0] = lote
+
+    def _rotacionar(self, novos_bytes: int) -> None:
+        """Renomeia os arquivos antigos se a gravação passaria de 'max_bytes'."""
+        if self.max_bytes <= 0 or not self.caminho.exists():
+            return
+        if self.caminho.stat().st_size + novos_bytes <= self.max_bytes:
+            return
+        if self.backups <= 0:
+            self.caminho.unlink()
+            return
+        for i in range(self.backups - 1, 0, -1):
+            antigo = self.caminho.with_name(f"{self.caminho.name}.{i}")
+            if antigo.exists():
+                os.replace(antigo, self.caminho.with_name(f"{self.caminho.name}.{i + 1}"))
+        os.replace(self.caminho, self.caminho.with_name(f"{self.caminho.name}.1"))
+
+    def redirecionar(self, caminho) -> None:
+        """Grava o que está pendente e passa a usar outro arquivo."""
+        if caminho is self.caminho:
+            return
+        caminho = Path(caminho)
+        if caminho == self.caminho:
+            self.caminho = caminho   # mesmo arquivo: a próxima chamada cai no teste 'is'
+            return
+        self.descarregar(encerrar_janelas=True)
+        self.caminho = caminho
+
+    def fechar(self) -> None:
+        """Encerra a thread e grava tudo, inclusive os resumos de repetições."""
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._parar = True
+            self._cond.notify()
+        if thread is not None:
+            thread.join()
+            atexit.unregister(self.fechar)
+        self.descarregar(encerrar_janelas=True)
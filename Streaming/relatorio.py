@@ -0,0 +1,92 @@
+# Streaming/relatorio.py
+from itertools import islice
+from pathlib import Path
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .playlist import Playlist
+from .usuario import Usuario
+
+
+class RelatorioIncremental:
+    """
+    Relatório em seções, cada uma refeita só quando algum evento do qual depende ocorre.
+    - secao(nome, calcular, eventos, formatar): 'calcular()' produz os dados da seção
+      (guardados até a seção ficar suja); 'formatar(dados)' gera as linhas sob demanda.
+    - Eventos: "reproducao", "playlist" e "usuario" chegam por atualizar(obj), que tem
+      a mesma interface dos placares (basta pôr o relatório nas listas 'placares');
+      "avaliacao" e "colecoes" são detectados pelos totais em sincronizar().
+    - escrever() grava as linhas uma a uma no arquivo, sem montar o texto inteiro.
+    """
+
+    def __init__(self, colecoes=()):
+        """colecoes: listas cujo tamanho, ao mudar, dispara o evento "colecoes"."""
+        self.colecoes = list(colecoes)
+        self._secoes = []       # [nome, calcular, formatar, eventos, suja, dados], na ordem do texto
+        self._por_evento = {}   # evento -> seções que dependem dele
+        self._marca = None      # totais vistos na última sincronização
+        self.recalculos = 0     # seções refeitas (para testes/benchmarks)
+        self.linhas_por_bloco = 8192   # linhas por write() em escrever()
+
+    def secao(self, nome: str, calcular, eventos, formatar=None) -> None:
+        """Acrescenta uma seção (começa suja); 'formatar' padrão: os dados já são as linhas."""
+        s = [nome, calcular, formatar, frozenset(eventos), True, None]
+        self._secoes.append(s)
+        for evento in s[3]:
+            self._por_evento.setdefault(evento, []).append(s)
+
+    def marcar(self, evento: str) -> None:
+        """Marca como sujas as seções que dependem de 'evento'."""
+        for s in self._por_evento.get(evento, ()):
+            s[4] = True
+
+    def invalidar(self) -> None:
+        """Marca todas as seções como sujas (ex.: após recarregar os dados)."""
+        for s in self._secoes:
+            s[4] = True
+        self._marca = None
+
+    def atualizar(self, obj) -> None:
+        """Aviso de reprodução vindo das listas 'placares' das classes."""
+        if isinstance(obj, ArquivoDeMidia):
+            self.marcar("reproducao")
+        elif isinstance(obj, Playlist):
+            self.marcar("playlist")
+        elif isinstance(obj, Usuario):
+            self.marcar("usuario")
+
+    def sincronizar(self) -> None:
+        """Detecta novas avaliações e mudanças no tamanho das coleções."""
+        marca = (ArquivoDeMidia.contadores.avaliacoes, tuple(len(c) for c in self.colecoes))
+        if self._marca is None or marca[0] != self._marca[0]:
+            self.marcar("avaliacao")
+        if self._marca is None or marca[1] != self._marca[1]:
+            self.marcar("colecoes")
+        self._marca = marca
+
+    def linhas(self):
+        """Gera as linhas do relatório, refazendo só as seções sujas."""
+        self.sincronizar()
+        for s in self._secoes:
+            if s[4]:
+                s[4] = False          # desmarca antes: um aviso durante o cálculo não se perde
+                s[5] = s[1]()
+                self.recalculos += 1
+            yield from (s[5] if s[2] is None else s[2](s[5]))
+
+    def texto(self) -> str:
+        """O relatório inteiro como uma string."""
+        return "\n".join(self.linhas())
+
+    def escrever(self, caminho, linhas=None) -> None:
+        """
+        Grava o relatório em 'caminho' em blocos de linhas (mesmo conteúdo de texto()).
+        linhas: as já geradas por linhas(), para gravar de outra thread sem ler os objetos.
+        """
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        linhas = self.linhas() if linhas is None else iter(linhas)
+        with caminho.open("w", encoding="utf-8") as f:
+            separador = ""
+            while bloco := list(islice(linhas, self.linhas_por_bloco)):
+                f.write(separador + "\n".join(bloco))
+                separador = "\n"
@@ -0,0 +1,78 @@
+# Streaming/reproducao_concorrente.py
+import threading
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .contadores import ContadorFragmentado
+from .playlist import Playlist
+from .usuario import Usuario
+
+
+class ReproducaoConcorrente:
+    """
+    Modo concorrente: reproduzir()/ouvir_midia() podem ser chamados de várias threads.
+    - Enquanto ativo, as reproduções de mídias e playlists vão para contadores
+      fragmentados por thread (sem trava no caminho quente) em vez de 'reproducoes'.
+    - consolidar() repassa o acumulado a 'reproducoes', aos totais do sistema e
+      aos placares; reproducoes(obj) consolida e lê (soma na leitura).
+    - Ao sair do 'with' (ou em desativar()) tudo é consolidado e o modo normal volta.
+    Uso:
+        with ReproducaoConcorrente() as rc:
+            pool.map(lambda ev: ev[0].ouvir_midia(ev[1], None), eventos)
+    Editar playlists enquanto outras threads as reproduzem não é suportado.
+    """
+
+    def __init__(self):
+        """Cria o modo (ainda inativo)."""
+        self._midias = None
+        self._playlists = None
+        self._usuarios = None
+        self._trava = threading.Lock()   # uma consolidação por vez
+
+    def ativar(self) -> "ReproducaoConcorrente":
+        """Liga os contadores fragmentados nas classes."""
+        if ArquivoDeMidia.fragmentos is not None:
+            raise ValueError("O modo concorrente já está ativo.")
+        self._midias = ArquivoDeMidia.fragmentos = ContadorFragmentado()
+        self._playlists = Playlist.fragmentos = ContadorFragmentado()
+        self._usuarios = Usuario.fragmentos = ContadorFragmentado()
+        return self
+
+    def consolidar(self) -> int:
+        """Repassa as reproduções pendentes aos objetos; retorna quantas eram."""
+        if self._midias is None:
+            return 0
+        with self._trava:
+            total = 0
+            for midia, qtd in self._midias.pendentes():
+                midia.reproducoes += qtd
+                total += qtd
+                for placar in ArquivoDeMidia.placares:
+                    placar.atualizar(midia)
+            ArquivoDeMidia.contadores.reproducoes += total
+            for playlist, qtd in self._playlists.pendentes():
+                playlist.reproducoes += qtd
+                for placar in Playlist.placares:
+                    placar.atualizar(playlist)
+            for usuario, _ in self._usuarios.pendentes():
+                for placar in Usuario.placares:
+                    placar.atualizar(usuario)
+            return total
+
+    def reproducoes(self, obj) -> int:
+        """Reproduções atuais de uma mídia ou playlist (consolida antes de ler)."""
+        self.consolidar()
+        return obj.reproducoes
+
+    def desativar(self) -> None:
+        """Consolida tudo e volta ao modo normal (chamar depois que as threads terminarem)."""
+        self.consolidar()
+        ArquivoDeMidia.fragmentos = None
+        Playlist.fragmentos = None
+        Usuario.fragmentos = None
+        self._midias = self._playlists = self._usuarios = None
+
+    def __enter__(self) -> "ReproducaoConcorrente":
+        return self.ativar()
+
+    def __exit__(self, *exc) -> None:
+        self.desativar()
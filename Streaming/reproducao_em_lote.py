@@ -0,0 +1,94 @@
+# Streaming/reproducao_em_lote.py
+import time
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .usuario import Usuario
+
+
+class ReproducaoEmLote:
+    """
+    Reprodução de muitos eventos (usuario, midia) de uma vez, sem uma linha no terminal por item.
+    - Mesmo efeito de chamar usuario.ouvir_midia(midia) para cada evento, na ordem:
+      reproduções das mídias, totais do sistema, históricos, recomendador e placares.
+    - As reproduções são somadas por mídia e aplicadas uma vez; os placares são
+      avisados uma vez por mídia/usuário (os contadores só crescem, o resultado é o mesmo).
+    - No modo concorrente (ReproducaoConcorrente) as reproduções vão para os contadores
+      fragmentados da thread, como em reproduzir(), e só aparecem na consolidação.
+    - usuario None: reprodução sem histórico (ex.: tráfego anônimo).
+    - saida: None (padrão) não mostra nada; uma função recebe as linhas "Reproduzindo: ...".
+    """
+
+    def __init__(self, saida=None):
+        """Cria o executor; 'saida' é usada em todas as chamadas de executar()."""
+        self.saida = saida
+        self.reproducoes = 0     # eventos aplicados na última execução
+        self.segundos = 0.0      # duração da última execução
+
+    def executar(self, eventos) -> int:
+        """
+        Aplica todos os eventos e retorna quantos foram reproduzidos.
+        Valida o lote inteiro antes de alterar qualquer objeto (ValueError se houver inválidos).
+        """
+        ini = time.perf_counter()
+        eventos = list(eventos)
+        for usuario, midia in eventos:
+            if not isinstance(midia, ArquivoDeMidia):
+                raise ValueError("A mídia informada é inválida.")
+            if usuario is not None and not isinstance(usuario, Usuario):
+                raise ValueError("O usuário informado é inválido.")
+
+        deltas = {}    # id(mídia) -> [mídia, quantidade]
+        ouvidas = {}   # id(usuário) -> [usuário, mídias na ordem]
+        for usuario, midia in eventos:
+            d = deltas.get(id(midia))
+            if d is None:
+                deltas[id(midia)] = [midia, 1]
+            else:
+                d[1] += 1
+            if usuario is not None:
+                o = ouvidas.get(id(usuario))
+                if o is None:
+                    ouvidas[id(usuario)] = [usuario, [midia]]
+                else:
+                    o[1].append(midia)
+
+        fragmentos = ArquivoDeMidia.fragmentos
+        if fragmentos is not None:
+            for midia, qtd in deltas.values():
+                fragmentos.incrementar(midia, qtd)
+        else:
+            for midia, qtd in deltas.values():
+                midia.reproducoes += qtd
+                for placar in ArquivoDeMidia.placares:
+                    placar.atualizar(midia)
+            ArquivoDeMidia.contadores.reproducoes += len(eventos)
+
+        for usuario, midias in ouvidas.values():
+            if Usuario.recomendador is not None:
+                Usuario.recomendador.ouvidas(usuario, midias)
+            usuario.historico.extend(midias)
+            if Usuario.fragmentos is not None:
+                Usuario.fragmentos.incrementar(usuario, len(midias))
+            else:
+                for placar in Usuario.placares:
+                    placar.atualizar(usuario)
+
+        if self.saida is not None:
+            for _, midia in eventos:
+                self.saida(midia.linha_reproducao())
+
+        self.reproducoes = len(eventos)
+        self.segundos = time.perf_counter() - ini
+        return self.reproducoes
+
+    @property
+    def por_segundo(self) -> float:
+        """Vazão da última execução (reproduções por segundo)."""
+        if self.segundos <= 0:
+            return 0.0
+        return self.reproducoes / self.segundos
+
+    def __str__(self) -> str:
+        """Resumo da última execução."""
+        return (f"{self.reproducoes} reproduções em {self.segundos:.3f}s "
+                f"({self.por_segundo:,.0f} reproduções/s)")
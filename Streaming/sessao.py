@@ -0,0 +1,287 @@
+# Streaming/sessao.py
+"""
+Comandos de texto (modo script e servidor TCP): uma SessaoDeComandos por cliente.
+"""
+import inspect
+import threading
+import time
+from functools import partial
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .instrumentacao import Instrumentacao
+from .leitor import normalizar
+from .usuario import Usuario
+
+
+class SessaoDeComandos:
+    """
+    Estado de uma sessão (usuário logado) e execução dos comandos de texto,
+    usada pelo modo script (--script) e pelo servidor TCP (servidor.py).
+    Linha: "COMANDO argumentos", vários argumentos separados por '|'.
+    Resposta: ["OK <n>", n linhas] ou ["ERRO <mensagem>"].
+        ENTRAR <usuário>                      CRIAR_USUARIO <usuário>
+        LISTAR musicas | podcasts | playlists | usuarios
+        REPRODUZIR <título>                   REPRODUZIR_PLAYLIST <playlist>
+        BUSCAR <texto>                        (até 5 mídias parecidas, da mais provável)
+        RECOMENDAR [título]                   (para o usuário logado ou parecidas com o título)
+        CRIAR_MUSICA <título> | <minutos> | <artista> | <gênero>
+        CRIAR_PLAYLIST <nome> | <título> | ...   (títulos já cadastrados; pelo menos 1)
+        CONCATENAR <playlist A> | <playlist B>
+        AVALIAR <título> | <nota 0-5>
+        ESTATISTICAS [ligar | desligar | zerar]
+        RELATORIO                             AJUDA        SAIR
+    """
+
+    app = None                           # módulo da aplicação (main): coleções, placares e caminhos
+    COMANDOS_LENTOS = {"RELATORIO"}     # gravação de arquivo feita fora do laço de eventos
+    _trava_relatorio = threading.Lock()  # um relatório gravado por vez
+    _aridades = {}                       # comando -> (mín., máx. ou None) de argumentos
+
+    def __init__(self):
+        """Cria a sessão sem usuário logado."""
+        self.usuario = None
+        self.encerrada = False
+        self._gravacoes = None   # gravações adiadas dentro de preparar()
+
+    @staticmethod
+    def _separar(linha: str) -> tuple[str, list[str]]:
+        cmd, _, resto = linha.strip().partition(" ")
+        args = [a.strip() for a in resto.split("|")] if resto.strip() else []
+        return cmd.upper(), args
+
+    def lento(self, linha: str) -> bool:
+        """True se o comando deve rodar em uma thread."""
+        return self._separar(linha)[0] in self.COMANDOS_LENTOS
+
+    def preparar(self, linha: str):
+        """
+        Executa 'linha' na thread atual (a única que lê o estado compartilhado) e devolve
+        uma função sem argumentos que faz as gravações de arquivo adiadas, a partir de dados
+        já copiados, e retorna a resposta; essa função pode rodar em outra thread.
+        """
+        self._gravacoes = []
+        try:
+            resposta = self.executar(linha)
+            gravacoes = self._gravacoes
+        finally:
+            self._gravacoes = None
+
+        def concluir() -> list[str]:
+            try:
+                for gravar in gravacoes:
+                    gravar()
+            except OSError as e:
+                self.app.log_erro(f"Servidor ({self._separar(linha)[0]}): {e}")
+                return ["ERRO Falha ao gravar o arquivo."]
+            return resposta
+        return concluir
+
+    def _gravar(self, funcao, *args) -> None:
+        """Chama funcao(*args) agora ou, dentro de preparar(), na função que ele devolve."""
+        if self._gravacoes is None:
+            funcao(*args)
+        else:
+            self._gravacoes.append(partial(funcao, *args))
+
+    def executar(self, linha: str) -> list[str]:
+        """Executa um comando; erros de uso viram 'ERRO ...' (e vão para o log)."""
+        cmd, args = self._separar(linha)
+        aridade = self._aridades.get(cmd)
+        if aridade is None:
+            funcao = getattr(type(self), f"_cmd_{cmd.lower()}", None)
+            if not cmd or funcao is None:
+                return [f"ERRO Comando desconhecido: {cmd}"]
+            params = list(inspect.signature(funcao).parameters.values())[1:]
+            variavel = any(p.kind is p.VAR_POSITIONAL for p in params)
+            fixos = [p for p in params if p.kind is not p.VAR_POSITIONAL]
+            obrigatorios = sum(1 for p in fixos if p.default is p.empty)
+            aridade = self._aridades[cmd] = (obrigatorios, None if variavel else len(fixos))
+        minimo, maximo = aridade
+        if len(args) < minimo or (maximo is not None and len(args) > maximo):
+            return [f"ERRO Argumentos inválidos para {cmd}."]
+        metodo = getattr(self, f"_cmd_{cmd.lower()}")
+        try:
+            linhas = metodo(*args)
+        except ValueError as e:
+            self.app.log_erro(f"Servidor ({cmd}): {e}")
+            return [f"ERRO {e}"]
+        except Exception as e:
+            self.app.log_erro(f"Erro crítico no servidor ({cmd}): {e}")
+            return ["ERRO Falha interna."]
+        return [f"OK {len(linhas)}", *linhas]
+
+    def _logado(self) -> Usuario:
+        if self.usuario is None:
+            raise ValueError("Entre como usuário primeiro (ENTRAR <nome>).")
+        return self.usuario
+
+    def _cmd_ajuda(self) -> list[str]:
+        return [l.strip() for l in self.__doc__.splitlines() if l.startswith("        ")]
+
+    def _cmd_sair(self) -> list[str]:
+        self.encerrada = True
+        return []
+
+    def _cmd_entrar(self, nome: str) -> list[str]:
+        u = self.app.encontrar_usuario(nome)
+        if u is None:
+            raise ValueError("Usuário não encontrado.")
+        self.usuario = u
+        return [f"Bem-vindo, {u.nome}."]
+
+    def _cmd_criar_usuario(self, nome: str) -> list[str]:
+        if self.app.encontrar_usuario(nome):
+            raise ValueError(f"Tentativa de criar usuário duplicado: {nome}")
+        novo = Usuario(nome)
+        self.app.USUARIOS.append(novo)
+        self.app.PLACAR_USUARIOS.acompanhar(novo)
+        return ["Usuário criado com sucesso."]
+
+    def _cmd_listar(self, tipo: str) -> list[str]:
+        colecoes = {"musicas": self.app.MUSICAS, "podcasts": self.app.PODCASTS,
+                    "playlists": self.app.PLAYLISTS, "usuarios": self.app.USUARIOS}
+        colecao = colecoes.get(normalizar(tipo))
+        if colecao is None:
+            raise ValueError(f"Tipo de listagem inválido: {tipo}")
+        return [str(x) for x in colecao]
+
+    def _cmd_reproduzir(self, titulo: str) -> list[str]:
+        u = self._logado()
+        midia = ArquivoDeMidia.buscar_por_titulo(titulo)
+        if midia is None:
+            raise ValueError(f"Tentativa de reprodução inválida: {titulo}")
+        linhas = []
+        u.ouvir_midia(midia, linhas.append)
+        return linhas
+
+    def _cmd_buscar(self, texto: str) -> list[str]:
+        return [str(m) for m in ArquivoDeMidia.sugerir(texto)]
+
+    def _cmd_recomendar(self, titulo: str = "") -> list[str]:
+        if titulo:
+            midia = ArquivoDeMidia.buscar_por_titulo(titulo)
+            if midia is None:
+                raise ValueError(f"Mídia não encontrada: {titulo}")
+            return [f"{m} (peso {peso})" for m, peso in self.app.RECOMENDADOR.similares(midia)]
+        return [f"{m} (porque você ouviu '{motivo.titulo}')"
+                for m, motivo in self.app.RECOMENDADOR.para_usuario(self._logado())]
+
+    def _cmd_reproduzir_playlist(self, nome: str) -> list[str]:
+        u = self._logado()
+        alvo = self.app.encontrar_playlist(u, nome)
+        if alvo is None:
+            raise ValueError(f"Playlist inexistente para {u.nome}: {nome}")
+        linhas = []
+        alvo.reproduzir(linhas.append)
+        return linhas
+
+    def _cmd_criar_musica(self, titulo: str, minutos: str, artista: str, genero: str) -> list[str]:
+        try:
+            minutos = int(minutos)
+        except ValueError:
+            raise ValueError(f"Valor inválido para minutos ao criar música '{titulo}'.") from None
+        if minutos <= 0:
+            raise ValueError(f"Duração inválida (min) ao criar música '{titulo}'.")
+        ClasseMusica, _ = self.app.classes_midia()
+        nova = ClasseMusica(titulo, minutos * 60, artista, genero)
+        self.app.MUSICAS.append(nova)
+        self.app.PLACAR_MUSICAS.acompanhar(nova)
+        return [f"Música '{nova.titulo}' criada."]
+
+    def _cmd_criar_playlist(self, nome: str, *titulos: str) -> list[str]:
+        u = self._logado()
+        midias = [ArquivoDeMidia.buscar_por_titulo(t) for t in titulos]
+        if not midias:
+            raise ValueError("A playlist precisa de pelo menos uma mídia.")
+        faltando = [t for t, m in zip(titulos, midias) if m is None]
+        if faltando:
+            raise ValueError(f"Mídias não encontradas: {', '.join(faltando)}")
+        pl = u.criar_playlist(nome)
+        for m in midias:
+            pl.adicionar_midia(m)
+        self.app.PLAYLISTS.append(pl)
+        self.app.PLACAR_PLAYLISTS.acompanhar(pl)
+        return [f"Playlist '{pl.nome}' criada."]
+
+    def _cmd_concatenar(self, a: str, b: str) -> list[str]:
+        u = self._logado()
+        pa = self.app.encontrar_playlist(u, a)
+        pb = self.app.encontrar_playlist(u, b)
+        if not pa or not pb:
+            raise ValueError(f"Concatenação inválida para {u.nome}: A='{a}' B='{b}'")
+        nova = self.app.concatenar_playlists(u, pa, pb)
+        return [f"Playlist concatenada criada: {nova.nome}"]
+
+    def _cmd_avaliar(self, titulo: str, nota: str) -> list[str]:
+        midia = ArquivoDeMidia.buscar_por_titulo(titulo)
+        if midia is None or not hasattr(midia, "avaliar"):
+            raise ValueError(f"Música não encontrada para avaliação: {titulo}")
+        try:
+            nota = int(nota)
+        except ValueError:
+            raise ValueError("A nota deve estar entre 0 e 5 (inteiro).") from None
+        midia.avaliar(nota)
+        return [f"Nota {nota} registrada para '{midia.titulo}'."]
+
+    def _cmd_estatisticas(self, acao: str = "") -> list[str]:
+        acao = normalizar(acao)
+        if acao == "ligar":
+            Instrumentacao.ativar()
+        elif acao == "desligar":
+            Instrumentacao.desativar()
+        elif acao == "zerar":
+            Instrumentacao.zerar()
+        elif acao:
+            raise ValueError(f"Ação inválida para ESTATISTICAS: {acao}")
+        if Instrumentacao.ativa:
+            Instrumentacao.salvar_json(self.app.ARQ_ESTATISTICAS)
+        return Instrumentacao.tabela()
+
+    def _cmd_relatorio(self) -> list[str]:
+        # seções sujas recalculadas aqui, na thread do chamador
+        linhas = list(self.app.RELATORIO.linhas())
+        self._gravar(self._escrever_relatorio, linhas)
+        return linhas
+
+    @classmethod
+    def _escrever_relatorio(cls, linhas: list[str]) -> None:
+        with cls._trava_relatorio:
+            cls.app.RELATORIO.escrever(cls.app.ARQ_REL, linhas)
+
+
+def executar_script(linhas, saida=None, antes=None):
+    """
+    Executa comandos de texto (um por linha) sem perguntas no terminal.
+    - Linhas vazias e iniciadas por '#' são ignoradas; SAIR encerra.
+    - saida: função que recebe cada linha de resposta (None descarta as respostas).
+    - antes: função sem argumentos chamada antes de cada comando (ex.: recarga --vigiar).
+    Retorna {comando: [quantidade, erros, segundos, maior tempo]}.
+    """
+    sessao = SessaoDeComandos()
+    tempos = {}
+    relogio = time.perf_counter
+    for linha in linhas:
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+        if antes is not None:
+            antes()
+        ini = relogio()
+        resposta = sessao.executar(linha)
+        dt = relogio() - ini
+        cmd = linha.partition(" ")[0].upper()
+        t = tempos.get(cmd)
+        if t is None:
+            t = tempos[cmd] = [0, 0, 0.0, 0.0]
+        t[0] += 1
+        t[2] += dt
+        if dt > t[3]:
+            t[3] = dt
+        if resposta[0].startswith("ERRO"):
+            t[1] += 1
+        if saida is not None:
+            for r in resposta:
+                saida(r)
+        if sessao.encerrada:
+            break
+    return tempos
@@ -0,0 +1,115 @@
+# Streaming/snapshot.py
+"""
+Snapshot compilado: catálogo já validado e deduplicado, salvo em binário (marshal) ao
+lado do arquivo de dados. A chave é (tamanho, mtime, sha256) do arquivo de origem.
+"""
+import hashlib
+import marshal
+import os
+from pathlib import Path
+
+from .playlist import Playlist
+from .usuario import Usuario
+
+
+# VERSAO_SNAPSHOT: suba sempre que o leitor do .md (formatos, validação, normalização)
+# ou o formato das linhas do snapshot mudar; snapshots de outra versão são ignorados.
+# 2: seções no formato em linha ('- a | b | c').
+VERSAO_SNAPSHOT = 2
+
+
+def caminho_snapshot(caminho):
+    """Arquivo do snapshot de 'caminho' ('dados.md' -> 'dados.md.snap')."""
+    return Path(caminho).with_name(Path(caminho).name + ".snap")
+
+
+def _hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with Path(caminho).open("rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def _origem_snapshot(caminho, com_hash=True):
+    st = os.stat(caminho)
+    return {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns,
+            "sha256": _hash_arquivo(caminho) if com_hash else ""}
+
+
+def gravar_snapshot(caminho, musicas, podcasts, usuarios, playlists):
+    """
+    Grava as coleções em um snapshot binário ao lado de 'caminho' (troca atômica).
+    Levanta OSError/ValueError se não conseguir gravar.
+    """
+    pos_musica = {id(m): i for i, m in enumerate(musicas)}
+    pos_podcast = {id(p): i for i, p in enumerate(podcasts)}
+    pos_usuario = {id(u): i for i, u in enumerate(usuarios)}
+
+    linhas_playlists = []
+    for pl in playlists:
+        itens = []
+        for m in pl.itens:
+            if id(m) in pos_musica:
+                itens.append((0, pos_musica[id(m)]))
+            elif id(m) in pos_podcast:
+                itens.append((1, pos_podcast[id(m)]))
+        linhas_playlists.append((pl.nome, pos_usuario[id(pl.usuario)], itens))
+
+    dados = {
+        "versao": VERSAO_SNAPSHOT,
+        "marshal": marshal.version,
+        "origem": _origem_snapshot(caminho),
+        "musicas": [(m.titulo, m.duracao, m.artista, m.genero) for m in musicas],
+        "podcasts": [(p.titulo, p.duracao, p.host, p.temporada, p.episodio) for p in podcasts],
+        "usuarios": [u.nome for u in usuarios],
+        "playlists": linhas_playlists,
+    }
+    destino = caminho_snapshot(caminho)
+    temp = destino.with_name(destino.name + ".tmp")
+    temp.write_bytes(marshal.dumps(dados))
+    os.replace(temp, destino)
+
+
+def _snapshot_valido(dados, caminho):
+    """Confere versão e chave de origem; se só o mtime mudou, decide pelo hash."""
+    if not isinstance(dados, dict) or dados.get("versao") != VERSAO_SNAPSHOT \
+            or dados.get("marshal") != marshal.version:
+        return False
+    salvo = dados.get("origem", {})
+    atual = _origem_snapshot(caminho, com_hash=False)
+    if atual["tamanho"] != salvo.get("tamanho"):
+        return False
+    if atual["mtime_ns"] == salvo.get("mtime_ns"):
+        return True
+    return _hash_arquivo(caminho) == salvo.get("sha256")
+
+
+def carregar_snapshot(caminho, musicas, podcasts, usuarios, playlists, ClasseMusica, ClassePodcast):
+    """
+    Preenche as coleções (vazias) a partir do snapshot, se existir e ainda for válido.
+    Retorna True se carregou; False se não há snapshot válido. Um snapshot corrompido
+    levanta a exceção da leitura, com as coleções possivelmente preenchidas pela metade.
+    """
+    arq = caminho_snapshot(caminho)
+    if not arq.exists():
+        return False
+    dados = marshal.loads(arq.read_bytes())  # loads em bytes é bem mais rápido que load(f)
+    if not _snapshot_valido(dados, caminho):
+        return False
+
+    for titulo, duracao, artista, genero in dados["musicas"]:
+        musicas.append(ClasseMusica(titulo, duracao, artista, genero))
+    for titulo, duracao, host, temporada, episodio in dados["podcasts"]:
+        podcasts.append(ClassePodcast(titulo, duracao, host, temporada, episodio))
+    for nome in dados["usuarios"]:
+        usuarios.append(Usuario(nome))
+    origem = (musicas, podcasts)
+    for nome, i_usuario, itens in dados["playlists"]:
+        u = usuarios[i_usuario]
+        playlist = Playlist(nome, u)
+        u.playlists.append(playlist)
+        playlists.append(playlist)
+        for tipo, i in itens:
+            playlist.adicionar_midia(origem[tipo][i])
+    return True
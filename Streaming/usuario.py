@@ -1,15 +1,26 @@
 # Streaming/usuario.py
+import threading
+
 from .arquivo_de_midia import ArquivoDeMidia
+from .historico import HistoricoDeReproducao
 
 class Usuario:
     """
     Representa um usuário do sistema de streaming.
-    Atributos: nome (str), playlists (list[Playlist]), historico (list[ArquivoDeMidia]).
+    Atributos: nome (str), playlists (list[Playlist]), historico (HistoricoDeReproducao).
+    len(historico) é o total exato de reproduções; só as últimas
+    'capacidade_historico' ficam guardadas.
     Contador de instâncias: qntd_instancias.
     """
 
     # contador de usuários criados (pedido no enunciado)
     qntd_instancias = 0
+    _trava_instancias = threading.Lock()
+
+    placares = []  # placares ao vivo avisados a cada mídia ouvida
+    capacidade_historico = 1000  # reproduções recentes guardadas por usuário
+    fragmentos = None  # ContadorFragmentado no modo concorrente (ver ReproducaoConcorrente)
+    recomendador = None  # Recomendador avisado a cada mídia ouvida (ver Streaming/recomendacao.py)
 
     def __init__(self, nome: str):
         """Inicializa o usuário com nome, listas vazias de playlists e histórico."""
@@ -18,19 +29,28 @@ class Usuario:
             raise ValueError("Nome de usuário inválido.")
         self.nome = nome_limpo
         self.playlists = []    # playlists criadas por este usuário
-        self.historico = []    # mídias reproduzidas por este usuário
+        self.historico = HistoricoDeReproducao(Usuario.capacidade_historico)
 
-        Usuario.qntd_instancias += 1
+        with Usuario._trava_instancias:
+            Usuario.qntd_instancias += 1
 
-    def ouvir_midia(self, midia: ArquivoDeMidia) -> None:
+    def ouvir_midia(self, midia: ArquivoDeMidia, saida=print) -> None:
         """
         Reproduz uma mídia (música ou podcast) e registra no histórico.
         Regra: usar o método reproduzir() da própria mídia.
+        saida: repassada a reproduzir() (None não mostra nada).
         """
         if not isinstance(midia, ArquivoDeMidia):
             raise ValueError("A mídia informada é inválida.")
-        midia.reproduzir()
+        midia.reproduzir(saida)
+        if Usuario.recomendador is not None:
+            Usuario.recomendador.ouvida(self, midia)
         self.historico.append(midia)
+        if Usuario.fragmentos is not None:
+            Usuario.fragmentos.incrementar(self)
+        else:
+            for placar in Usuario.placares:
+                placar.atualizar(self)
 
     def criar_playlist(self, nome: str):  # -> "Playlist" (hint opcional)
         """
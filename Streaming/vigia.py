@@ -0,0 +1,463 @@
+# Streaming/vigia.py
+"""
+Recarga incremental (modo --vigiar): alterações no arquivo de dados são aplicadas às
+coleções já carregadas, sem limpar nada (reproduções, notas, históricos e recomendações
+continuam valendo).
+Cada item do arquivo é identificado pelo hash dos seus bytes: só os itens novos são
+interpretados e validados, e só as chaves dos que sumiram são procuradas. O resto do
+arquivo custa a leitura e hashes feitos em C: um por seção e, nas seções que mudaram,
+um por item.
+"""
+import itertools
+import os
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+from .arquivo_de_midia import ArquivoDeMidia
+from .leitor import SECOES_CARGA, iter_itens_md, normalizar, secoes, validar_item
+from .musica import Musica
+from .playlist import Playlist
+from .podcast import Podcast
+from .usuario import Usuario
+
+
+_INICIO_ITEM = re.compile(rb"\n[ \t]*+- ")
+
+
+def _corpos_das_secoes(caminho):
+    """tipo -> bytes do corpo das seções do tipo (várias seções do mesmo tipo, em ordem)."""
+    dados = Path(caminho).read_bytes()
+    partes = {tipo: [] for tipo in SECOES_CARGA}
+    for tipo, ini, fim in secoes(dados):
+        partes[tipo].append(dados[ini:fim])
+    return {tipo: b"\n".join(p) for tipo, p in partes.items()}
+
+
+def _registro_bruto(tipo, bruto):
+    """Registro validado (como na carga) de um item bruto; None se o item não gera registro."""
+    linhas = ("- " + bruto.decode("utf-8", "replace")).splitlines()
+    for _, item in iter_itens_md(itertools.chain(["# item"], linhas)):
+        return validar_item(tipo, item)
+    return None
+
+
+def resumo_recarga(contagem):
+    """'musicas +1 ~0 -2, ...' (adicionados, alterados, removidos) dos tipos que mudaram."""
+    return ", ".join(f"{tipo} +{a} ~{m} -{r}" for tipo, (a, m, r) in contagem.items() if a or m or r)
+
+
+class VigiaDeDados:
+    """
+    Recarga incremental de app.ARQ_DADOS (modo --vigiar).
+    - iniciar(): guarda o hash de cada item do arquivo carregado -> chave do objeto;
+    - planejar(): lê o arquivo e valida só os itens novos (pode rodar em outra thread);
+    - aplicar(plano): edita as coleções no lugar e devolve a contagem por tipo;
+    - verificar(): no máximo a cada 'intervalo' segundos, recarrega se o tamanho ou o
+      mtime do arquivo mudaram.
+    Objetos alterados continuam sendo a mesma instância; removidos saem das coleções,
+    do catálogo, dos placares e das playlists. Uma chave repetida no arquivo fica com
+    o primeiro item do arquivo, como na carga completa; se ele sumir, o próximo assume.
+    Playlists com dono ou itens ausentes são refeitas quando usuários ou mídias novos chegam.
+    """
+
+    app = None   # módulo da aplicação (main): ARQ_DADOS, coleções, placares, RELATORIO e log_erro
+
+    def __init__(self, intervalo=2.0):
+        self.intervalo = intervalo
+        self._proxima = 0.0
+        self._origem = None       # (tamanho, mtime_ns) da última leitura
+        self._secoes = {}         # tipo -> hash do corpo das seções (seção igual não é dividida)
+        self._chaves = {tipo: {} for tipo in SECOES_CARGA}       # hash do item -> chave (None = inválido)
+        self._vencedores = {tipo: {} for tipo in SECOES_CARGA}   # chave -> hash do item aplicado
+        self._refs = {tipo: Counter() for tipo in SECOES_CARGA}   # chave -> itens distintos com ela
+        self._repetidas = {tipo: set() for tipo in SECOES_CARGA}  # chaves com mais de um item
+        self._objetos = {tipo: {} for tipo in SECOES_CARGA}      # chave -> objeto carregado
+        self._playlists = {}      # chave da playlist -> registro do item vencedor
+        self._incompletas = {}    # chave da playlist -> registro com dono ou itens ausentes
+
+    def iniciar(self):
+        """Tira a impressão do arquivo recém-carregado (valida todos os itens uma vez)."""
+        for tipo in SECOES_CARGA:
+            self._chaves[tipo].clear()
+            self._vencedores[tipo].clear()
+            self._refs[tipo].clear()
+            self._repetidas[tipo].clear()
+        self._secoes.clear()
+        self._playlists.clear()
+        self._incompletas.clear()
+        self._objetos = {
+            "musicas": {normalizar(m.titulo): m for m in self.app.MUSICAS},
+            "podcasts": {normalizar(p.titulo): p for p in self.app.PODCASTS},
+            "usuarios": {normalizar(u.nome): u for u in self.app.USUARIOS},
+            "playlists": {(normalizar(pl.usuario.nome), normalizar(pl.nome)): pl
+                          for pl in self.app.PLAYLISTS},
+        }
+        try:
+            plano = self.planejar()
+        except (OSError, UnicodeDecodeError) as e:
+            self.app.log_erro(f"Falha ao ler {self.app.ARQ_DADOS}: {e}")
+            return
+        for tipo in SECOES_CARGA:
+            vencedores = self._vencedores[tipo]
+            for h, reg in plano[tipo][0]:   # na ordem do arquivo: o primeiro de cada chave vence
+                chave = self._anotar(tipo, h, reg)
+                if chave is not None and chave not in vencedores:
+                    vencedores[chave] = h
+        midias = self._objetos["musicas"], self._objetos["podcasts"]
+        vencedores = self._vencedores["playlists"]
+        for h, reg in plano["playlists"][0]:
+            if reg is None or reg[0] != "ok" or vencedores.get((reg[2][2], reg[1])) != h:
+                continue
+            _, chave_nome, (_, _, chave_dono, itens) = reg
+            self._playlists[(chave_dono, chave_nome)] = reg
+            if chave_dono not in self._objetos["usuarios"] or \
+                    any(k not in midias[0] and k not in midias[1] for _, k in itens):
+                self._incompletas[(chave_dono, chave_nome)] = reg
+        self._origem, self._secoes = plano["origem"], plano["secoes"]
+
+    def _anotar(self, tipo, h, reg):
+        """Guarda hash do item -> chave; devolve a chave (None se o item é inválido)."""
+        chave = None
+        if reg is not None and reg[0] == "ok":
+            chave = (reg[2][2], reg[1]) if tipo == "playlists" else reg[1]
+            refs = self._refs[tipo]
+            refs[chave] += 1
+            if refs[chave] == 2:
+                self._repetidas[tipo].add(chave)
+        self._chaves[tipo][h] = chave
+        return chave
+
+    # ----------------------------- leitura e plano -----------------------------
+    def mudou(self):
+        """True se tamanho ou mtime do arquivo diferem dos da última leitura."""
+        try:
+            st = os.stat(self.app.ARQ_DADOS)
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) != self._origem
+
+    def planejar(self):
+        """
+        Lê o arquivo e compara os hashes das seções e dos itens com os conhecidos.
+        Retorna {"origem": (tamanho, mtime_ns), "secoes": {tipo: hash},
+                 tipo: ([(hash, registro)] dos itens novos, {hashes dos itens sumidos},
+                        [hash de cada item, em ordem], [bytes de cada item])}.
+        Seções iguais às da última leitura vêm como ([], set(), None, None).
+        """
+        st = os.stat(self.app.ARQ_DADOS)
+        plano = {"origem": (st.st_size, st.st_mtime_ns), "secoes": {}}
+        for tipo, corpo in _corpos_das_secoes(self.app.ARQ_DADOS).items():
+            plano["secoes"][tipo] = h_secao = hash(corpo)
+            if h_secao == self._secoes.get(tipo):
+                plano[tipo] = ([], set(), None, None)
+                continue
+            conhecidos = self._chaves[tipo]
+            itens = _INICIO_ITEM.split(b"\n" + corpo)[1:]
+            hashes = list(map(hash, itens))
+            atuais = set(hashes)
+            novos = atuais.difference(conhecidos)
+            registros = []
+            for h, bruto in itertools.compress(zip(hashes, itens), map(novos.__contains__, hashes)):
+                if h in novos:
+                    novos.discard(h)
+                    registros.append((h, _registro_bruto(tipo, bruto)))
+            plano[tipo] = (registros, conhecidos.keys() - atuais, hashes, itens)
+        return plano
+
+    def recarregar(self):
+        """Lê e aplica as alterações do arquivo; None se ele não pôde ser lido."""
+        try:
+            plano = self.planejar()
+        except (OSError, UnicodeDecodeError) as e:
+            self.app.log_erro(f"Falha ao ler {self.app.ARQ_DADOS}: {e}")
+            return None
+        return self.aplicar(plano)
+
+    def verificar(self):
+        """Recarrega se o arquivo mudou (no máximo a cada 'intervalo' segundos); None se nada foi lido."""
+        agora = time.monotonic()
+        if agora < self._proxima:
+            return None
+        self._proxima = agora + self.intervalo
+        return self.recarregar() if self.mudou() else None
+
+    # --------------------------------- aplicação --------------------------------
+    def aplicar(self, plano):
+        """Aplica o plano às coleções; devolve tipo -> [adicionados, alterados, removidos]."""
+        contagem = {tipo: [0, 0, 0] for tipo in SECOES_CARGA}
+        mudancas = {}   # tipo -> (chaves removidas, {chave: registro novo})
+        for tipo in SECOES_CARGA:
+            registros, sumidos, hashes, itens = plano[tipo]
+            chaves, refs, repetidas = self._chaves[tipo], self._refs[tipo], self._repetidas[tipo]
+            afetadas, novos = set(), {}
+            for h in sumidos:
+                chave = chaves.pop(h)
+                if chave is not None:
+                    afetadas.add(chave)
+                    refs[chave] -= 1
+                    if refs[chave] == 1:
+                        repetidas.discard(chave)
+                    elif not refs[chave]:
+                        del refs[chave]
+            for h, reg in registros:
+                if reg is not None and reg[0] == "erro":
+                    self.app.log_erro(reg[1])
+                chave = self._anotar(tipo, h, reg)
+                if chave is not None:
+                    afetadas.add(chave)
+                    novos[h] = reg
+            removidas, alteradas = set(), {}
+            if hashes is not None:
+                # o item de uma chave é o primeiro dela no arquivo (como na carga completa): só
+                # chaves com itens novos/sumidos ou repetidas (a ordem pode ter mudado) são vistas
+                afetadas |= repetidas
+            if afetadas:
+                ordem = list(map(chaves.__getitem__, hashes))
+                if len(afetadas) <= 64:
+                    primeira = {c: ordem.index(c) for c in afetadas if c in refs}
+                else:
+                    primeira = dict(zip(reversed(ordem), range(len(ordem) - 1, -1, -1)))
+                vencedores = self._vencedores[tipo]
+                for chave in afetadas:
+                    i = primeira.get(chave)
+                    if i is None:
+                        del vencedores[chave]
+                        removidas.add(chave)
+                    elif hashes[i] != vencedores.get(chave):
+                        h = vencedores[chave] = hashes[i]
+                        # item já conhecido que passou a vencer não tem registro no plano
+                        alteradas[chave] = novos[h] if h in novos else _registro_bruto(tipo, itens[i])
+            mudancas[tipo] = (removidas, alteradas)
+        for chave in mudancas["playlists"][0]:
+            del self._playlists[chave]
+        self._playlists.update(mudancas["playlists"][1])
+
+        self._aplicar_midias(mudancas, contagem)
+        self._aplicar_usuarios(*mudancas["usuarios"], contagem["usuarios"])
+        chegaram = any(contagem[tipo][0] for tipo in ("musicas", "podcasts", "usuarios"))
+        self._aplicar_playlists(*mudancas["playlists"], contagem["playlists"], chegaram)
+        self._origem, self._secoes = plano["origem"], plano["secoes"]
+        self.app.RELATORIO.invalidar()
+        ArquivoDeMidia.catalogo.busca.preparar_em_segundo_plano()
+        return contagem
+
+    def _aplicar_midias(self, mudancas, contagem):
+        ClasseMusica, ClassePodcast = self.app.classes_midia()
+        removidas, reindexar = [], []   # reindexar: (tipo, mídia, título, artista, gênero)
+        for tipo, colecao in (("musicas", self.app.MUSICAS), ("podcasts", self.app.PODCASTS)):
+            objetos = self._objetos[tipo]
+            chaves_removidas, alteradas = mudancas[tipo]
+            saem = [objetos.pop(c) for c in chaves_removidas if c in objetos]
+            if saem:
+                ids = {id(m) for m in saem}
+                colecao[:] = [m for m in colecao if id(m) not in ids]
+                removidas += saem
+            contagem[tipo][2] = len(saem)
+            for chave, reg in alteradas.items():
+                midia = objetos.get(chave) or self._avulsa(tipo, chave)
+                if midia is not None:
+                    objetos[chave] = midia
+                    contagem[tipo][1] += self._atualizar_midia(tipo, midia, reg[2], reindexar)
+                    continue
+                if tipo == "musicas":
+                    try:
+                        midia = ClasseMusica(*reg[2])
+                    except Exception as e:
+                        self.app.log_erro(f"Erro ao criar música {reg[2]}: {e}")
+                        continue
+                    self.app.PLACAR_MUSICAS.acompanhar(midia)
+                else:
+                    midia = self.app.criar_podcast(ClassePodcast, reg[2], reg[3])
+                    if midia is None:
+                        continue
+                colecao.append(midia)
+                objetos[chave] = midia
+                contagem[tipo][0] += 1
+
+        if removidas:
+            ArquivoDeMidia.remover_do_registro(removidas)
+        if reindexar:
+            ArquivoDeMidia.catalogo.remover([midia for _, midia, *_ in reindexar])
+            for _, midia, titulo, artista, genero in reindexar:
+                midia.renomear(titulo, artista)
+                if genero is not None:
+                    midia.genero = genero
+                ArquivoDeMidia.catalogo.registrar(midia)
+
+        # playlists: removidas saem; renomeadas precisam do índice refeito pela chave nova
+        afetadas = {id(m) for m in removidas} | {id(m) for _, m, *_ in reindexar}
+        if afetadas:
+            ids = {id(m) for m in removidas}
+            for pl in self.app.PLAYLISTS:
+                if not afetadas.isdisjoint(map(id, pl.itens)):
+                    restantes = [m for m in pl.itens if id(m) not in ids]
+                    if len(restantes) < len(pl.itens):
+                        self._pendente(pl)
+                    pl.itens = restantes
+        musicas = removidas + [m for tipo, m, *_ in reindexar if tipo == "musicas"]
+        if any([self.app.PLACAR_MUSICAS.remover(m) for m in musicas]):
+            self.app.PLACAR_MUSICAS.remontar(self.app.MUSICAS)
+        else:
+            for tipo, midia, *_ in reindexar:
+                if tipo == "musicas":
+                    self.app.PLACAR_MUSICAS.acompanhar(midia)
+
+    @staticmethod
+    def _avulsa(tipo, titulo):
+        """Mídia do tipo criada durante a execução (fora do arquivo) com esse título, se houver."""
+        midia = ArquivoDeMidia.buscar_por_titulo(titulo)
+        return midia if isinstance(midia, Musica if tipo == "musicas" else Podcast) else None
+
+    @classmethod
+    def _atualizar_midia(cls, tipo, midia, campos, reindexar):
+        """Edita a mídia no lugar; título/artista/gênero novos vão para 'reindexar'. True se mudou."""
+        if tipo == "musicas":
+            titulo, duracao, artista, genero = campos
+            outros = {"duracao": duracao}
+            mudou = (midia.titulo, midia.artista, midia.genero) != (titulo, artista, genero)
+        else:
+            titulo, duracao, artista, temporada, episodio = campos
+            if not artista or not temporada:
+                cls.app.log_erro(f"Podcast '{titulo}': host e temporada não podem ser vazios.")
+                return False
+            outros = {"duracao": duracao, "temporada": temporada, "episodio": episodio}
+            genero = None
+            mudou = (midia.titulo, midia.artista) != (titulo, artista)
+        if mudou:
+            reindexar.append((tipo, midia, titulo, artista, genero))
+        for atributo, valor in outros.items():
+            if getattr(midia, atributo) != valor:
+                setattr(midia, atributo, valor)
+                mudou = True
+        return mudou
+
+    def _aplicar_usuarios(self, removidas, alteradas, contagem):
+        objetos = self._objetos["usuarios"]
+        saem = [objetos.pop(c) for c in removidas if c in objetos]
+        if saem:
+            ids = {id(u) for u in saem}
+            self.app.USUARIOS[:] = [u for u in self.app.USUARIOS if id(u) not in ids]
+            playlists = [pl for u in saem for pl in u.playlists]
+            for pl in playlists:
+                self._pendente(pl)
+            self._remover_playlists(playlists)
+            if any([self.app.PLACAR_USUARIOS.remover(u) for u in saem]):
+                self.app.PLACAR_USUARIOS.remontar(self.app.USUARIOS)
+        contagem[2] = len(saem)
+        avulsos = None   # usuários criados durante a execução (fora do arquivo), por nome
+        for chave, (_, _, nome) in alteradas.items():
+            u = objetos.get(chave)
+            if u is not None:
+                if u.nome != nome:
+                    # o nome faz parte da chave do placar: retira antes, recoloca depois
+                    no_topo = self.app.PLACAR_USUARIOS.remover(u)
+                    u.nome = nome
+                    if no_topo:
+                        self.app.PLACAR_USUARIOS.remontar(self.app.USUARIOS)
+                    else:
+                        self.app.PLACAR_USUARIOS.acompanhar(u)
+                    contagem[1] += 1
+                continue
+            if avulsos is None:
+                usuarios = self.app.USUARIOS
+                avulsos = {normalizar(x.nome): x for x in usuarios} if len(usuarios) > len(objetos) else {}
+            u = avulsos.get(chave)
+            if u is None:
+                try:
+                    u = Usuario(nome)
+                except Exception as e:
+                    self.app.log_erro(f"Erro ao criar usuário {nome}: {e}")
+                    continue
+                self.app.USUARIOS.append(u)
+                self.app.PLACAR_USUARIOS.acompanhar(u)
+                contagem[0] += 1
+            objetos[chave] = u
+
+    def _pendente(self, pl):
+        """Playlist que perdeu o dono ou itens: é refeita quando eles voltarem ao arquivo."""
+        chave = (normalizar(pl.usuario.nome), normalizar(pl.nome))
+        if chave in self._playlists:
+            self._incompletas[chave] = self._playlists[chave]
+
+    def _remover_playlists(self, playlists):
+        if not playlists:
+            return
+        ids = {id(pl) for pl in playlists}
+        self.app.PLAYLISTS[:] = [pl for pl in self.app.PLAYLISTS if id(pl) not in ids]
+        objetos = self._objetos["playlists"]
+        for pl in playlists:
+            pl.usuario.playlists[:] = [x for x in pl.usuario.playlists if x is not pl]
+            chave = (normalizar(pl.usuario.nome), normalizar(pl.nome))
+            if objetos.get(chave) is pl:
+                del objetos[chave]
+        if any([self.app.PLACAR_PLAYLISTS.remover(pl) for pl in playlists]):
+            self.app.PLACAR_PLAYLISTS.remontar(self.app.PLAYLISTS)
+
+    def _aplicar_playlists(self, removidas, alteradas, contagem, retentar):
+        objetos = self._objetos["playlists"]
+        for chave in removidas:
+            self._incompletas.pop(chave, None)
+        saem = [objetos[c] for c in removidas if c in objetos]
+        self._remover_playlists(saem)
+        contagem[2] = len(saem)
+        if retentar and self._incompletas:
+            alteradas = {**self._incompletas, **alteradas}
+        for chave, reg in alteradas.items():
+            resultado = self._aplicar_playlist(chave, reg)
+            if resultado is not None:
+                contagem[resultado] += 1
+
+    def _aplicar_playlist(self, chave, reg):
+        """Cria ou atualiza a playlist do registro; 0 = criada, 1 = alterada, None = nada mudou."""
+        _, _, (nome, dono, chave_dono, itens) = reg
+        self._incompletas.pop(chave, None)
+        u = self._objetos["usuarios"].get(chave_dono)
+        if u is None:
+            self.app.log_erro(f"Playlist '{nome}': usuário inexistente '{dono}'.")
+            self._incompletas[chave] = reg
+            return None
+        musicas, podcasts = self._objetos["musicas"], self._objetos["podcasts"]
+        midias, vistos = [], set()
+        for titulo_item, key in itens:
+            if key in vistos:
+                self.app.log_erro(f"Item repetido na playlist '{nome}': '{titulo_item}'.")
+                continue
+            vistos.add(key)
+            midia = musicas.get(key) or podcasts.get(key)
+            if not midia:
+                self.app.log_erro(f"Item inexistente na playlist '{nome}': '{titulo_item}'.")
+                self._incompletas[chave] = reg
+                continue
+            midias.append(midia)
+
+        objetos = self._objetos["playlists"]
+        playlist = objetos.get(chave) or self.app.encontrar_playlist(u, nome)
+        if playlist is None:
+            playlist = Playlist(nome, u)
+            u.playlists.append(playlist)
+            self.app.PLAYLISTS.append(playlist)
+            for midia in midias:
+                playlist.adicionar_midia(midia)
+            self.app.PLACAR_PLAYLISTS.acompanhar(playlist)
+            objetos[chave] = playlist
+            return 0
+        mudou = False
+        if playlist.nome != nome:
+            # nome faz parte da chave do placar e do índice: retira antes, recoloca depois
+            antiga = (normalizar(u.nome), normalizar(playlist.nome))
+            if objetos.get(antiga) is playlist:
+                del objetos[antiga]
+            no_topo = self.app.PLACAR_PLAYLISTS.remover(playlist)
+            playlist.nome = nome
+            if no_topo:
+                self.app.PLACAR_PLAYLISTS.remontar(self.app.PLAYLISTS)
+            else:
+                self.app.PLACAR_PLAYLISTS.acompanhar(playlist)
+            mudou = True
+        objetos[chave] = playlist
+        if list(map(id, playlist.itens)) != list(map(id, midias)):
+            playlist.itens = midias
+            mudou = True
+        return 1 if mudou else None
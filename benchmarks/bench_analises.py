@@ -0,0 +1,91 @@
+# benchmarks/bench_analises.py
+"""
+Compara Analises (getattr por objeto) com AnalisesVetoriais (colunas) e confere
+que os resultados são idênticos. Mede os dois backends de AnalisesVetoriais
+(NumPy, se instalado, e laços em Python) sobre músicas normais e colunares,
+recebendo a lista (ponta a ponta) e um ColunasDeMusicas reaproveitado.
+Uso: python -m benchmarks.bench_analises [n_musicas]
+"""
+import argparse
+import random
+import time
+
+from Streaming.analises import Analises
+from Streaming.analises_vetoriais import AnalisesVetoriais, ColunasDeMusicas, np
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.colunas import MusicaColunar, limpar_lojas
+from Streaming.musica import Musica
+
+GENEROS = ["Rock", "Pop", "Rap", "Classico", "Sertanejo", "Jazz", "MPB", "Samba"]
+
+
+def gerar_musicas(classe, n: int, semente: int = 7) -> list:
+    """Cria 'n' músicas com reproduções e notas aleatórias (com empates)."""
+    rnd = random.Random(semente)
+    musicas = []
+    for i in range(n):
+        m = classe(f"Musica {i}", rnd.randint(60, 600), f"Artista {i % 500}",
+                   GENEROS[i % len(GENEROS)], rnd.randint(0, 50))
+        for _ in range(rnd.randint(0, 3)):
+            m.avaliar(rnd.randint(0, 5))
+        musicas.append(m)
+    return musicas
+
+
+def cronometrar(func, *args):
+    ini = time.perf_counter()
+    resultado = func(*args)
+    return resultado, time.perf_counter() - ini
+
+
+def conferir(musicas) -> None:
+    """Falha (AssertionError) se AnalisesVetoriais divergir de Analises."""
+    esperado_top = Analises.top_musicas_reproduzidas(musicas, 5)
+    esperado_medias = Analises.media_avaliacoes(musicas)
+    esperado_total = sum(m.reproducoes for m in ArquivoDeMidia.registroMidia)
+    for usar_numpy in ([True, False] if np is not None else [False]):
+        AnalisesVetoriais.usar_numpy = usar_numpy
+        assert AnalisesVetoriais.top_musicas_reproduzidas(musicas, 5) == esperado_top
+        assert AnalisesVetoriais.media_avaliacoes(musicas) == esperado_medias
+        assert AnalisesVetoriais.total_reproducoes() == esperado_total
+        assert AnalisesVetoriais.total_reproducoes() == Analises.total_reproducoes([])
+    AnalisesVetoriais.usar_numpy = np is not None
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_musicas", nargs="?", type=int, default=200_000)
+    args = parser.parse_args()
+
+    backends = ["numpy", "python"] if np is not None else ["python"]
+    for classe in (Musica, MusicaColunar):
+        ArquivoDeMidia.limpar_registro()
+        limpar_lojas()
+        musicas = gerar_musicas(classe, args.n_musicas)
+        conferir(musicas)
+        print(f"\n{classe.__name__} x {args.n_musicas} (resultados idênticos a Analises)")
+
+        _, t = cronometrar(Analises.top_musicas_reproduzidas, musicas, 5)
+        print(f"  Analises.top_musicas_reproduzidas      {t:8.4f}s")
+        _, t = cronometrar(Analises.media_avaliacoes, musicas)
+        print(f"  Analises.media_avaliacoes              {t:8.4f}s")
+
+        col = ColunasDeMusicas(musicas)
+        for backend in backends:
+            AnalisesVetoriais.usar_numpy = backend == "numpy"
+            for nome, args_ in (("top_musicas_reproduzidas", (5,)),
+                                ("media_avaliacoes", ()),
+                                ("total_reproducoes", ()),
+                                ("reproducoes_por_genero", ()),
+                                ("reproducoes_por_artista", ()),
+                                ("percentis_duracao", ()),
+                                ("distribuicao_avaliacoes", ())):
+                func = getattr(AnalisesVetoriais, nome)
+                _, t_lista = cronometrar(func, list(musicas), *args_)   # lista nova: sem reaproveitar nada
+                _, t_col = cronometrar(func, col, *args_)
+                print(f"  [{backend:>6}] {nome:<28} {t_lista:8.4f}s (lista) {t_col:8.4f}s (colunas)")
+        AnalisesVetoriais.usar_numpy = np is not None
+
+
+if __name__ == "__main__":
+    main_bench()
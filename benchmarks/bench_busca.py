@@ -0,0 +1,97 @@
+# benchmarks/bench_busca.py
+"""
+Latência de ArquivoDeMidia.sugerir() em um catálogo grande: consultas por prefixo,
+com erros de digitação (troca, remoção ou inserção de uma letra) e por artista.
+Mede também a indexação inicial (preparar(); main a faz em segundo plano após a carga)
+e a incremental (mídias criadas entre buscas).
+Uso: python -m benchmarks.bench_busca [n_midias] [--consultas 2000] [--titulos sinteticos|palavras]
+"""
+import argparse
+import random
+import time
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from benchmarks.carga_servidor import percentil
+
+CONSOANTES = "bcdfghjklmnprstvz"
+VOGAIS = "aeiou"
+SILABAS = [c + v for c in CONSOANTES for v in VOGAIS] + [v + c for v in VOGAIS for c in "lmnrs"]
+
+
+def _palavras(rnd: random.Random, n: int) -> list[str]:
+    return ["".join(rnd.choice(SILABAS) for _ in range(rnd.randint(2, 4))) for _ in range(n)]
+
+
+def _erro_de_digitacao(rnd: random.Random, texto: str) -> str:
+    i = rnd.randrange(len(texto))
+    letra = rnd.choice("abcdefghijklmnopqrstuvwxyz")
+    tipo = rnd.randrange(3)
+    if tipo == 0:
+        return texto[:i] + letra + texto[i + 1:]
+    if tipo == 1:
+        return texto[:i] + texto[i + 1:]
+    return texto[:i] + letra + texto[i:]
+
+
+def _medir(rotulo: str, consultas: list[str]) -> None:
+    tempos = []
+    for q in consultas:
+        ini = time.perf_counter()
+        ArquivoDeMidia.sugerir(q)
+        tempos.append(time.perf_counter() - ini)
+    tempos.sort()
+    print(f"{rotulo:>12} {len(tempos):>8} {percentil(tempos, 50) * 1000:>9.3f} "
+          f"{percentil(tempos, 99) * 1000:>9.3f} {tempos[-1] * 1000:>9.3f}")
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_midias", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--consultas", type=int, default=2000, help="consultas por tipo")
+    parser.add_argument("--titulos", choices=["sinteticos", "palavras"], default="palavras",
+                        help="'Musica i' (como benchmarks.gerador) ou 2-4 palavras aleatórias")
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    vocabulario = _palavras(rnd, 20_000)
+    artistas = [" ".join(rnd.sample(vocabulario, 2)).title() for _ in range(max(1, args.n_midias // 10))]
+    ini = time.perf_counter()
+    midias = []
+    for i in range(args.n_midias):
+        if args.titulos == "sinteticos":
+            titulo = f"Musica {i}"
+        else:
+            titulo = " ".join(rnd.sample(vocabulario, rnd.randint(2, 4))).title()
+        midias.append(Musica(titulo, 200, rnd.choice(artistas), "Pop"))
+    print(f"{args.n_midias} mídias criadas em {time.perf_counter() - ini:.1f}s")
+
+    ini = time.perf_counter()
+    ArquivoDeMidia.catalogo.busca.preparar()
+    print(f"indexação inicial (preparar): {time.perf_counter() - ini:.1f}s")
+
+    amostra = [rnd.choice(midias) for _ in range(args.consultas)]
+    acertos = sum(ArquivoDeMidia.sugerir(_erro_de_digitacao(rnd, m.titulo))[:1] == [m] for m in amostra)
+
+    print(f"{'consulta':>12} {'qtd':>8} {'p50(ms)':>9} {'p99(ms)':>9} {'máx(ms)':>9}")
+    _medir("prefixo", [m.titulo[:rnd.randint(3, len(m.titulo))] for m in amostra])
+    _medir("digitação", [_erro_de_digitacao(rnd, m.titulo) for m in amostra])
+    _medir("artista", [_erro_de_digitacao(rnd, m.artista) for m in amostra])
+    _medir("inexistente", [" ".join(_palavras(rnd, 2)) for _ in amostra])
+
+    # Incremental: uma mídia nova entre cada busca
+    tempos = []
+    for i in range(args.consultas):
+        nova = Musica(f"Novidade {i} {rnd.choice(vocabulario)}", 200, "Artista Novo", "Pop")
+        ini = time.perf_counter()
+        achou = ArquivoDeMidia.sugerir(nova.titulo[:-1])[:1] == [nova]
+        tempos.append(time.perf_counter() - ini)
+        assert achou, nova.titulo
+    tempos.sort()
+    print(f"{'incremental':>12} {len(tempos):>8} {percentil(tempos, 50) * 1000:>9.3f} "
+          f"{percentil(tempos, 99) * 1000:>9.3f} {tempos[-1] * 1000:>9.3f}")
+    print(f"erro de digitação com a mídia certa em 1º lugar: {acertos / len(amostra):.1%}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,56 @@
+# benchmarks/bench_carga_paralela.py
+"""
+Mede carregar_dados com 1, 2, 4, ... processos sobre o mesmo arquivo sintético.
+O snapshot é apagado antes de cada medição para forçar a leitura do .md.
+Uso: python -m benchmarks.bench_carga_paralela [n_itens] [--bloco BYTES]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from Streaming import carga_paralela
+from Streaming.snapshot import caminho_snapshot
+from benchmarks.gerador import gerar_arquivo
+
+
+def contagens_de_processos() -> list[int]:
+    """1, 2, 4, ... até a quantidade de núcleos (inclusive)."""
+    total = os.cpu_count() or 1
+    valores, n = [], 1
+    while n < total:
+        valores.append(n)
+        n *= 2
+    valores.append(total)
+    return valores
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_itens", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--bloco", type=int, default=carga_paralela.TAM_BLOCO_PARALELO)
+    args = parser.parse_args()
+    carga_paralela.TAM_BLOCO_PARALELO = args.bloco
+
+    with tempfile.TemporaryDirectory() as tmp:
+        arq = Path(tmp) / "dados.md"
+        gerar_arquivo(arq, args.n_itens, taxa_invalidos=0.01, taxa_duplicados=0.05)
+        main.ARQ_DADOS = arq
+        main.ARQ_LOG = Path(tmp) / "erros.log"
+        print(f"arquivo: {arq.stat().st_size / 1e6:.1f} MB, {args.n_itens} itens")
+
+        base = None
+        print(f"{'processos':>10} {'tempo(s)':>10} {'speedup':>8}")
+        for proc in contagens_de_processos():
+            caminho_snapshot(arq).unlink(missing_ok=True)
+            ini = time.perf_counter()
+            main.carregar_dados(processos=proc)
+            dt = time.perf_counter() - ini
+            base = base or dt
+            print(f"{proc:>10} {dt:>10.3f} {base / dt:>8.2f}")
+
+
+if __name__ == "__main__":
+    main_bench()
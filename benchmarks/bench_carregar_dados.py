@@ -0,0 +1,104 @@
+# benchmarks/bench_carregar_dados.py
+"""
+Compara, de ponta a ponta, carregar_dados() da versão de referência (por padrão o primeiro
+commit do repositório, com a deduplicação por any(...) sobre as listas) com a atual, no
+mesmo arquivo sintético (10k/100k/1M itens).
+- Cada carga roda em um processo novo, com o main.py e o pacote Streaming da versão medida
+  (a referência é extraída com 'git archive').
+- 'atual' é a primeira carga (lê o .md e grava o snapshot); 'snapshot' é a carga seguinte.
+- A referência cresce de forma quadrática: só é medida até --limite-legado itens.
+- As quantidades carregadas (músicas, podcasts, usuários, playlists) das duas versões são
+  comparadas; diferenças aparecem na última coluna.
+Uso: python -m benchmarks.bench_carregar_dados [tamanhos...] [--limite-legado N] [--referencia REV]
+"""
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+from benchmarks.gerador import gerar_arquivo
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Executado em um processo novo: argv = [raiz do código, arquivo de dados, cargas]
+_CARGA = """
+import json, sys, time
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+import main
+main.ARQ_DADOS = Path(sys.argv[2])
+main.ARQ_LOG = Path("erros.log")
+tempos = []
+for _ in range(int(sys.argv[3])):
+    ini = time.perf_counter()
+    main.carregar_dados()
+    tempos.append(time.perf_counter() - ini)
+qtd = [len(main.MUSICAS), len(main.PODCASTS), len(main.USUARIOS), len(main.PLAYLISTS)]
+print(json.dumps({"tempos": tempos, "qtd": qtd}))
+"""
+
+
+def extrair_versao(rev: str, destino: Path) -> Path:
+    """Extrai main.py e Streaming/ da revisão 'rev' para 'destino'."""
+    tar = subprocess.run(["git", "archive", "--format=tar", rev, "main.py", "Streaming"],
+                         cwd=RAIZ, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(tar)) as t:
+        t.extractall(destino, filter="data")
+    return destino
+
+
+def carregar(codigo: Path, arq: Path, cargas: int = 1) -> dict:
+    """Roda carregar_dados() 'cargas' vezes em um processo novo, na pasta do arquivo."""
+    proc = subprocess.run([sys.executable, "-c", _CARGA, str(codigo), str(arq), str(cargas)],
+                          cwd=arq.parent, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def medir(n_itens: int, pasta: Path, referencia: Path, limite_legado: int) -> dict:
+    """Gera o arquivo e mede a carga atual (fria e via snapshot) e, no limite, a de referência."""
+    arq = pasta / f"n{n_itens}" / "dados.md"
+    gerar_arquivo(arq, n_itens, taxa_duplicados=0.05)
+
+    atual = carregar(RAIZ, arq, cargas=2)
+    legado = carregar(referencia, arq) if n_itens <= limite_legado else None
+    return {"itens": n_itens, "atual": atual["tempos"][0], "snapshot": atual["tempos"][1],
+            "referencia": legado and legado["tempos"][0],
+            "iguais": None if legado is None else legado["qtd"] == atual["qtd"],
+            "qtd": atual["qtd"]}
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("tamanhos", nargs="*", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--limite-legado", type=int, default=10_000)
+    parser.add_argument("--referencia", default=None,
+                        help="revisão git de referência (padrão: primeiro commit)")
+    args = parser.parse_args()
+
+    rev = args.referencia or subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"], cwd=RAIZ,
+        capture_output=True, text=True, check=True).stdout.split()[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        referencia = extrair_versao(rev, Path(tmp) / "referencia")
+        print(f"referência: {rev[:10]}")
+        print(f"{'itens':>10} {'ref.(s)':>10} {'atual(s)':>10} {'snapshot(s)':>12} "
+              f"{'ganho':>8} {'mesmas qtd.':>12}")
+        for n in args.tamanhos:
+            r = medir(n, Path(tmp), referencia, args.limite_legado)
+            if r["referencia"] is None:
+                ref, ganho, iguais = "-", "-", "-"
+            else:
+                ref = f"{r['referencia']:.3f}"
+                ganho = f"{r['referencia'] / r['atual']:.0f}x"
+                iguais = "sim" if r["iguais"] else "NÃO"
+            print(f"{r['itens']:>10} {ref:>10} {r['atual']:>10.3f} {r['snapshot']:>12.3f} "
+                  f"{ganho:>8} {iguais:>12}")
+
+
+if __name__ == "__main__":
+    main_bench()
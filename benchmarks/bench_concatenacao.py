@@ -0,0 +1,69 @@
+# benchmarks/bench_concatenacao.py
+"""
+Encadeia centenas de concatenações (acumulada = acumulada + base) e compara
+a concatenação preguiçosa de Playlist com a cópia completa das listas de itens.
+Também mede a primeira iteração, uma edição (copy-on-write) e a reprodução.
+Uso: python -m benchmarks.bench_concatenacao [n_concatenacoes] [itens_por_playlist]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.usuario import Usuario
+
+
+def _copia_completa(a: Playlist, b: Playlist) -> Playlist:
+    """Concatenação como era antes: copia as duas listas de itens."""
+    nova = Playlist(a.nome, a.usuario)
+    nova.itens = list(a.itens) + list(b.itens)
+    nova.reproducoes = a.reproducoes + b.reproducoes
+    return nova
+
+
+def medir(concatenar, base: Playlist, n: int) -> dict:
+    ini = time.perf_counter()
+    acumulada = base
+    for _ in range(n):
+        acumulada = concatenar(acumulada, base)
+    t_concat = time.perf_counter() - ini
+
+    ini = time.perf_counter()
+    total = sum(1 for _ in acumulada)
+    t_iter = time.perf_counter() - ini
+
+    ini = time.perf_counter()
+    acumulada.adicionar_midia(base[0])
+    t_edicao = time.perf_counter() - ini
+
+    ini = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        acumulada.reproduzir()
+    t_play = time.perf_counter() - ini
+    return {"concat": t_concat, "iteracao": t_iter, "edicao": t_edicao,
+            "reproducao": t_play, "itens": total}
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_concatenacoes", nargs="?", type=int, default=500)
+    parser.add_argument("itens_por_playlist", nargs="?", type=int, default=1000)
+    args = parser.parse_args()
+
+    usuario = Usuario("Bench")
+    base = Playlist("Base", usuario)
+    for i in range(args.itens_por_playlist):
+        base.adicionar_midia(Musica(f"Musica {i}", 200, "Artista", "Pop"))
+
+    print(f"{args.n_concatenacoes} concatenações de {args.itens_por_playlist} itens")
+    print(f"{'modo':>12} {'concat(s)':>10} {'1a iter(s)':>11} {'edição(s)':>10} {'reprod.(s)':>11} {'itens':>9}")
+    for nome, func in (("preguiçosa", Playlist.__add__), ("cópia", _copia_completa)):
+        r = medir(func, base, args.n_concatenacoes)
+        print(f"{nome:>12} {r['concat']:>10.4f} {r['iteracao']:>11.4f} {r['edicao']:>10.4f} "
+              f"{r['reproducao']:>11.4f} {r['itens']:>9}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,69 @@
+# benchmarks/bench_formato_linha.py
+"""
+Vazão do formato em linha ('- valor | valor | ...', um split por item) contra o formato
+'chave: valor' para usuários, músicas e podcasts, com os mesmos dados nos dois arquivos.
+- 'leitura': divisão em itens + validação (leitor.registros_sequenciais) das três seções;
+- 'carga': carregar_dados completo, sequencial e sem snapshot.
+Vazão em linhas (itens de usuários, músicas e podcasts) por segundo.
+Uso: python -m benchmarks.bench_formato_linha [tamanhos...]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from Streaming.leitor import registros_sequenciais
+from Streaming.snapshot import caminho_snapshot
+from benchmarks.gerador import gerar_arquivo
+
+TIPOS = ("usuarios", "musicas", "podcasts")
+
+
+def _leitura(arq: Path) -> float:
+    ini = time.perf_counter()
+    for tipo in TIPOS:
+        for _ in registros_sequenciais(arq, tipo):
+            pass
+    return time.perf_counter() - ini
+
+
+def _carga(arq: Path) -> float:
+    main.ARQ_DADOS = arq
+    caminho_snapshot(arq).unlink(missing_ok=True)
+    ini = time.perf_counter()
+    main.carregar_dados(processos=1)
+    return time.perf_counter() - ini
+
+
+def medir(n_itens: int, pasta: Path) -> None:
+    main.ARQ_LOG = pasta / "erros.log"
+    resultados = {}
+    for nome, em_linha in (("chave/valor", False), ("em linha", True)):
+        arq = pasta / f"dados_{n_itens}_{'linha' if em_linha else 'kv'}.md"
+        qtd = gerar_arquivo(arq, n_itens, taxa_invalidos=0.02, taxa_duplicados=0.05, em_linha=em_linha)
+        linhas = sum(qtd[t] for t in TIPOS)
+        t_leitura, t_carga = _leitura(arq), _carga(arq)
+        resultados[nome] = t_leitura, t_carga
+        print(f"{n_itens:>9} {nome:>12} {arq.stat().st_size / 2**20:>9.1f} {linhas:>9} "
+              f"{t_leitura:>10.2f} {linhas / t_leitura:>11,.0f} {t_carga:>9.2f} {linhas / t_carga:>11,.0f}")
+        caminho_snapshot(arq).unlink(missing_ok=True)
+    (l_kv, c_kv), (l_ln, c_ln) = resultados.values()
+    print(f"{'':>9} {'ganho':>12} {'':>9} {'':>9} {l_kv / l_ln:>10.2f}x {'':>11} {c_kv / c_ln:>8.2f}x")
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("tamanhos", nargs="*", type=int, default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'itens':>9} {'formato':>12} {'MiB':>9} {'linhas':>9} {'leitura(s)':>10} "
+          f"{'linhas/s':>11} {'carga(s)':>9} {'linhas/s':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.tamanhos:
+            medir(n, Path(tmp))
+    main.REGISTRO_ERROS.fechar()
+
+
+if __name__ == "__main__":
+    main_bench()
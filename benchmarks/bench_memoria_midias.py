@@ -0,0 +1,82 @@
+# benchmarks/bench_memoria_midias.py
+"""
+Memória por música: objetos com __dict__ (layout anterior), Musica (__slots__)
+e MusicaColunar (visão sobre colunas 'array'). Cada medição roda em um processo
+separado e usa o pico de RSS; todas as variantes entram no catálogo de mídias e no
+índice de busca, já montado (como main faz depois de cada carga).
+Uso: python -m benchmarks.bench_memoria_midias [tamanhos...]
+"""
+import argparse
+import resource
+import subprocess
+import sys
+
+GENEROS = ["Rock", "Pop", "Rap", "Classico", "Sertanejo", "Jazz", "MPB", "Samba"]
+MODOS = ("dict", "slots", "colunar")
+
+
+class _MusicaLegada:
+    """Réplica do layout anterior de Musica (atributos em __dict__ e lista de notas)."""
+
+    def __init__(self, titulo, duracao, artista, genero, reproducoes=0):
+        self.titulo = titulo.strip()
+        self.artista = artista.strip()
+        self.duracao = duracao
+        self.reproducoes = reproducoes
+        self.genero = genero.strip()
+        self.avaliacoes = []
+
+
+def _rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def medir_modo(modo: str, n: int) -> int:
+    """Cria 'n' músicas no modo indicado e devolve o acréscimo de RSS em KB."""
+    from Streaming.arquivo_de_midia import ArquivoDeMidia
+    from Streaming.musica import Musica
+    from Streaming.colunas import MusicaColunar
+
+    antes = _rss_kb()
+    musicas = []
+    for i in range(n):
+        # strings novas por linha, como as produzidas pelo leitor do arquivo
+        titulo = f" Musica {i} "
+        artista = f" Artista {i % 1000} "
+        genero = (" " + GENEROS[i % len(GENEROS)]).strip()
+        duracao = 120 + i % 480
+        if modo == "dict":
+            m = _MusicaLegada(titulo, duracao, artista, genero)
+            ArquivoDeMidia.catalogo.registrar(m)
+        elif modo == "slots":
+            m = Musica(titulo, duracao, artista, genero)
+        else:
+            m = MusicaColunar(titulo, duracao, artista, genero)
+        musicas.append(m)
+    ArquivoDeMidia.catalogo.busca.preparar()
+    return _rss_kb() - antes
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("tamanhos", nargs="*", type=int, default=[1_000_000, 10_000_000])
+    parser.add_argument("--modo", choices=MODOS)       # uso interno (subprocesso)
+    args = parser.parse_args()
+
+    if args.modo:
+        print(medir_modo(args.modo, args.tamanhos[0]))
+        return
+
+    print(f"{'itens':>11} {'modo':>8} {'RSS (MB)':>10} {'bytes/item':>11}")
+    for n in args.tamanhos:
+        for modo in MODOS:
+            saida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_memoria_midias", str(n), "--modo", modo],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            kb = int(saida.strip())
+            print(f"{n:>11} {modo:>8} {kb / 1024:>10.1f} {kb * 1024 / n:>11.0f}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,101 @@
+# benchmarks/bench_recarga.py
+"""
+Recarga incremental (VigiaDeDados, modo --vigiar) contra carregar_dados completo.
+Para cada tamanho: carga completa sem snapshot, impressão inicial do arquivo e, para
+cada quantidade k de mudanças, uma edição com k músicas alteradas (duração), k removidas
+e k novas, aplicada por recarregar(). Confere o resultado contra uma carga completa do
+arquivo final e mostra que reproduções feitas antes da recarga continuam lá.
+Uso: python -m benchmarks.bench_recarga [tamanhos...] [--mudancas 1 100 10000]
+"""
+import argparse
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from Streaming.snapshot import caminho_snapshot
+from Streaming.vigia import VigiaDeDados, resumo_recarga
+from benchmarks.gerador import gerar_arquivo
+
+
+def _editar(texto: str, rnd: random.Random, k: int, rodada: int) -> str:
+    """Altera a duração de k músicas, remove outras k e acrescenta k novas."""
+    partes = texto.split("\n- ")
+    musicas = [i for i, p in enumerate(partes) if p.startswith("titulo: Musica ")]
+    escolhidas = rnd.sample(musicas, 2 * k)
+    for i in escolhidas[:k]:
+        partes[i] = re.sub(r"duracao: (\d+)", lambda m: f"duracao: {int(m.group(1)) + 1}", partes[i])
+    for i in escolhidas[k:]:
+        partes[i] = None
+    novas = [f"titulo: Nova {rodada}-{j}  \n    artista: Artista Novo  \n"
+             f"    genero: Pop  \n    duracao: 200\n    \n" for j in range(k)]
+    partes[musicas[0]:musicas[0]] = novas
+    return "\n- ".join(p for p in partes if p is not None)
+
+
+def _estado() -> tuple:
+    return (sorted((m.titulo, m.duracao, m.artista, m.genero) for m in main.MUSICAS),
+            len(main.PODCASTS), len(main.USUARIOS),
+            sorted((pl.usuario.nome, pl.nome, tuple(m.titulo for m in pl.itens)) for pl in main.PLAYLISTS))
+
+
+def _carga_completa(arq: Path) -> float:
+    caminho_snapshot(arq).unlink(missing_ok=True)
+    ini = time.perf_counter()
+    main.carregar_dados(processos=1)
+    return time.perf_counter() - ini
+
+
+def medir(n_itens: int, pasta: Path, mudancas: list[int]) -> None:
+    arq = pasta / f"dados_{n_itens}.md"
+    gerar_arquivo(arq, n_itens)
+    main.ARQ_DADOS = arq
+    main.ARQ_LOG = pasta / "erros.log"
+    main.VIGIA = None
+    t_carga = _carga_completa(arq)
+
+    vigia = VigiaDeDados(intervalo=0)
+    ini = time.perf_counter()
+    vigia.iniciar()
+    t_impressao = time.perf_counter() - ini
+    print(f"{n_itens} itens: carga completa {t_carga:.2f}s, impressão inicial (--vigiar) {t_impressao:.2f}s")
+
+    rnd = random.Random(n_itens)
+    ouvinte = main.USUARIOS[0]
+    for rodada, k in enumerate(mudancas):
+        midia = rnd.choice(main.MUSICAS)
+        ouvinte.ouvir_midia(midia, None)
+        arq.write_text(_editar(arq.read_text(encoding="utf-8"), rnd, k, rodada), encoding="utf-8")
+
+        ini = time.perf_counter()
+        plano = vigia.planejar()
+        t_plano = time.perf_counter() - ini
+        ini = time.perf_counter()
+        contagem = vigia.aplicar(plano)
+        t_aplicar = time.perf_counter() - ini
+        preservada = midia.reproducoes >= 1 or midia not in main.MUSICAS
+        print(f"{'':>10} k={k:<7} planejar {t_plano:>7.3f}s  aplicar {t_aplicar:>7.3f}s  "
+              f"total {t_plano + t_aplicar:>7.3f}s  ({t_carga / (t_plano + t_aplicar):>6.1f}x)  "
+              f"{resumo_recarga(contagem)}  reproduções mantidas: {preservada}")
+
+    incremental = _estado()
+    _carga_completa(arq)
+    print(f"{'':>10} igual à carga completa do arquivo final: {_estado() == incremental}")
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("tamanhos", nargs="*", type=int, default=[100_000, 1_000_000])
+    parser.add_argument("--mudancas", nargs="+", type=int, default=[1, 100, 10_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.tamanhos:
+            medir(n, Path(tmp), args.mudancas)
+    main.REGISTRO_ERROS.fechar()
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,92 @@
+# benchmarks/bench_recomendacao.py
+"""
+Custo de atualização e de consulta do Recomendador conforme cresce o número de usuários.
+Para cada quantidade de usuários: cada um cria uma playlist e ouve mídias com
+popularidade concentrada (poucas mídias muito ouvidas e uma cauda longa).
+Mede o custo extra por reprodução/adição (comparado ao mesmo trabalho sem recomendador),
+a latência de para_usuario() e similares(), o tamanho do modelo e as podas.
+Uso: python -m benchmarks.bench_recomendacao [--usuarios 1000 10000 100000] [--midias 50000]
+                                             [--reproducoes 50] [--max-pares 2000000]
+"""
+import argparse
+import random
+import time
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.historico import HistoricoDeReproducao
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.recomendacao import Recomendador
+from Streaming.usuario import Usuario
+from benchmarks.carga_servidor import percentil
+
+
+def _popular(rnd: random.Random, midias: list):
+    """Mídia sorteada: metade das vezes com popularidade decrescente (aprox. Zipf), metade ao acaso."""
+    if rnd.random() < 0.5:
+        return rnd.choice(midias)
+    return midias[min(len(midias) - 1, int(rnd.paretovariate(1.0)) - 1)]
+
+
+def _simular(usuarios: list, midias: list, reproducoes: int, semente: int) -> float:
+    rnd = random.Random(semente)
+    ini = time.perf_counter()
+    for u in usuarios:
+        pl = u.criar_playlist("Favoritas")
+        for _ in range(10):
+            midia = _popular(rnd, midias)
+            if midia not in pl:
+                pl.adicionar_midia(midia)
+        for _ in range(reproducoes):
+            u.ouvir_midia(_popular(rnd, midias), None)
+    return time.perf_counter() - ini
+
+
+def _latencias(funcao, argumentos: list) -> tuple[float, float]:
+    tempos = []
+    for a in argumentos:
+        ini = time.perf_counter()
+        funcao(a)
+        tempos.append(time.perf_counter() - ini)
+    tempos.sort()
+    return percentil(tempos, 50) * 1000, percentil(tempos, 99) * 1000
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--usuarios", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--midias", type=int, default=50_000)
+    parser.add_argument("--reproducoes", type=int, default=50, help="reproduções por usuário")
+    parser.add_argument("--max-pares", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(1)
+    midias = [Musica(f"Musica {i}", 200, f"Artista {i % 997}", "Pop") for i in range(args.midias)]
+    rnd.shuffle(midias)
+
+    print(f"{'usuários':>9} {'eventos':>9} {'us/evento':>10} {'extra(us)':>10} {'pares':>10} "
+          f"{'podas':>6} {'para_usuario p50/p99(ms)':>26} {'similares p50/p99(ms)':>23}")
+    for n in args.usuarios:
+        eventos = n * (args.reproducoes + 10)
+        HistoricoDeReproducao.limpar_codigos()
+        Usuario.recomendador = Playlist.recomendador = None
+        base = _simular([Usuario(f"U{i}") for i in range(n)], midias, args.reproducoes, n)
+
+        HistoricoDeReproducao.limpar_codigos()
+        recomendador = Recomendador(max_pares=args.max_pares)
+        Usuario.recomendador = Playlist.recomendador = recomendador
+        usuarios = [Usuario(f"U{i}") for i in range(n)]
+        seg = _simular(usuarios, midias, args.reproducoes, n)
+        Usuario.recomendador = Playlist.recomendador = None
+
+        amostra = [rnd.choice(usuarios) for _ in range(1000)]
+        pu50, pu99 = _latencias(recomendador.para_usuario, amostra)
+        si50, si99 = _latencias(recomendador.similares, [_popular(rnd, midias) for _ in range(1000)])
+        print(f"{n:>9} {eventos:>9} {seg / eventos * 1e6:>10.2f} {(seg - base) / eventos * 1e6:>10.2f} "
+              f"{recomendador.pares:>10} {recomendador.podas:>6} {pu50:>12.3f} / {pu99:>9.3f} "
+              f"{si50:>10.3f} / {si99:>9.3f}")
+    ArquivoDeMidia.limpar_registro()
+
+
+if __name__ == "__main__":
+    main_bench()
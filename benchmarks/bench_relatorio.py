@@ -0,0 +1,51 @@
+# benchmarks/bench_relatorio.py
+"""
+Gera relatórios seguidos sobre um catálogo grande (todas as músicas avaliadas):
+primeiro relatório, relatório sem mudanças, após uma reprodução e após uma avaliação.
+Uso: python -m benchmarks.bench_relatorio [n_musicas]
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from Streaming.musica import Musica
+
+
+def _medir(rotulo: str, caminho: Path) -> None:
+    antes = main.RELATORIO.recalculos
+    ini = time.perf_counter()
+    main.RELATORIO.escrever(caminho)
+    seg = time.perf_counter() - ini
+    print(f"{rotulo:>22} {seg:>9.3f}s  seções refeitas: {main.RELATORIO.recalculos - antes}")
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_musicas", nargs="?", type=int, default=300_000)
+    args = parser.parse_args()
+
+    for i in range(args.n_musicas):
+        m = Musica(f"Musica {i}", 200, f"Artista {i % 1000}", "Pop")
+        m.avaliar(i % 6)
+        main.MUSICAS.append(m)
+        main.PLACAR_MUSICAS.acompanhar(m)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = Path(tmp) / "relatorio.txt"
+        print(f"{args.n_musicas} músicas avaliadas")
+        _medir("primeiro", caminho)
+        _medir("sem mudanças", caminho)
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.MUSICAS[0].reproduzir()
+        _medir("após 1 reprodução", caminho)
+        main.MUSICAS[0].avaliar(5)
+        _medir("após 1 avaliação", caminho)
+        print(f"{'tamanho do arquivo':>22} {caminho.stat().st_size / 1e6:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main_bench()
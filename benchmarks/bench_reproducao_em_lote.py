@@ -0,0 +1,65 @@
+# benchmarks/bench_reproducao_em_lote.py
+"""
+Reproduz um log de tráfego sintético (usuario, midia) de duas formas:
+ouvir_midia() um a um (linhas descartadas em um StringIO) e ReproducaoEmLote.
+Confere que os contadores e históricos finais são idênticos.
+Uso: python -m benchmarks.bench_reproducao_em_lote [n_eventos] [n_midias] [n_usuarios]
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.reproducao_em_lote import ReproducaoEmLote
+from Streaming.usuario import Usuario
+
+
+def _cenario(n_midias: int, n_usuarios: int):
+    ArquivoDeMidia.limpar_registro()
+    midias = [Musica(f"Musica {i}", 200, f"Artista {i % 50}", "Pop") for i in range(n_midias)]
+    usuarios = [Usuario(f"Usuario {i}") for i in range(n_usuarios)]
+    return midias, usuarios
+
+
+def _eventos(midias, usuarios, n: int, semente: int = 42) -> list[tuple[int, int]]:
+    rnd = random.Random(semente)
+    return [(rnd.randrange(len(usuarios)), rnd.randrange(len(midias))) for _ in range(n)]
+
+
+def _estado(midias, usuarios):
+    return ([m.reproducoes for m in midias],
+            [[m.titulo for m in u.historico] for u in usuarios],
+            ArquivoDeMidia.contadores.reproducoes)
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_eventos", nargs="?", type=int, default=500_000)
+    parser.add_argument("n_midias", nargs="?", type=int, default=10_000)
+    parser.add_argument("n_usuarios", nargs="?", type=int, default=1_000)
+    args = parser.parse_args()
+
+    midias, usuarios = _cenario(args.n_midias, args.n_usuarios)
+    indices = _eventos(midias, usuarios, args.n_eventos)
+    ini = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for u, m in indices:
+            usuarios[u].ouvir_midia(midias[m])
+    t_um_a_um = time.perf_counter() - ini
+    esperado = _estado(midias, usuarios)
+
+    midias, usuarios = _cenario(args.n_midias, args.n_usuarios)
+    lote = ReproducaoEmLote()
+    lote.executar((usuarios[u], midias[m]) for u, m in indices)
+    assert _estado(midias, usuarios) == esperado, "resultado diferente de ouvir_midia()"
+
+    print(f"{args.n_eventos} eventos, {args.n_midias} mídias, {args.n_usuarios} usuários")
+    print(f"  ouvir_midia(): {t_um_a_um:.3f}s ({args.n_eventos / t_um_a_um:,.0f} reproduções/s)")
+    print(f"  em lote:       {lote}")
+
+
+if __name__ == "__main__":
+    main_bench()
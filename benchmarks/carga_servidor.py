@@ -0,0 +1,132 @@
+# benchmarks/carga_servidor.py
+"""
+Gerador de carga para servidor.py: vários clientes TCP simultâneos enviando
+uma mistura de comandos (reproduções, listagens, playlists e relatórios).
+Mede a latência de cada requisição e mostra p50/p99 por comando e no total.
+Sem --porta, gera um catálogo sintético e sobe o servidor em um subprocesso.
+Uso: python -m benchmarks.carga_servidor [--clientes 50] [--comandos 200] [--itens 5000]
+                                         [--host 127.0.0.1 --porta 8765]
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.gerador import gerar_arquivo, proporcoes
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil pelo posto mais próximo (valores já ordenados)."""
+    if not valores:
+        return 0.0
+    k = max(0, min(len(valores) - 1, round(p / 100 * len(valores) + 0.5) - 1))
+    return valores[k]
+
+
+async def _pedir(reader, writer, comando: str) -> list[str]:
+    writer.write((comando + "\n").encode("utf-8"))
+    await writer.drain()
+    primeira = (await reader.readline()).decode("utf-8").rstrip("\n")
+    if not primeira.startswith("OK "):
+        return [primeira]
+    return [primeira] + [(await reader.readline()).decode("utf-8").rstrip("\n")
+                         for _ in range(int(primeira[3:]))]
+
+
+async def _cliente(n: int, host: str, porta: int, comandos: int, qtd: dict, latencias: dict, erros: list):
+    rnd = random.Random(n)
+    reader, writer = await asyncio.open_connection(host, porta)
+    nome = f"Carga {n}"
+
+    async def medir(tipo: str, comando: str):
+        ini = time.perf_counter()
+        resposta = await _pedir(reader, writer, comando)
+        latencias.setdefault(tipo, []).append(time.perf_counter() - ini)
+        if resposta[0].startswith("ERRO"):
+            erros.append(f"{comando} -> {resposta[0]}")
+
+    await medir("CRIAR_USUARIO", f"CRIAR_USUARIO {nome}")
+    await medir("ENTRAR", f"ENTRAR {nome}")
+    playlists = 0
+    for _ in range(comandos):
+        r = rnd.random()
+        if r < 0.80:
+            await medir("REPRODUZIR", f"REPRODUZIR Musica {rnd.randrange(qtd['musicas'])}")
+        elif r < 0.90 or playlists < 2:
+            playlists += 1
+            titulos = " | ".join(f"Musica {rnd.randrange(qtd['musicas'])}" for _ in range(5))
+            await medir("CRIAR_PLAYLIST", f"CRIAR_PLAYLIST Lista {playlists} | {titulos}")
+        elif r < 0.95:
+            await medir("REPRODUZIR_PLAYLIST", f"REPRODUZIR_PLAYLIST Lista {rnd.randint(1, playlists)}")
+        elif r < 0.99:
+            await medir("CONCATENAR", f"CONCATENAR Lista 1 | Lista {rnd.randint(1, playlists)}")
+        else:
+            await medir("RELATORIO", "RELATORIO")
+    await _pedir(reader, writer, "SAIR")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _rodar(args, qtd: dict) -> tuple[dict, list, float]:
+    latencias, erros = {}, []
+    ini = time.perf_counter()
+    await asyncio.gather(*(_cliente(n, args.host, args.porta, args.comandos, qtd, latencias, erros)
+                           for n in range(args.clientes)))
+    return latencias, erros, time.perf_counter() - ini
+
+
+def _subir_servidor(pasta: Path, itens: int) -> tuple[subprocess.Popen, int]:
+    """Gera config/dados.md em 'pasta' e sobe servidor.py nela (porta livre)."""
+    gerar_arquivo(pasta / "config" / "dados.md", itens)
+    env = dict(os.environ, PYTHONPATH=str(RAIZ))
+    proc = subprocess.Popen([sys.executable, str(RAIZ / "servidor.py"), "--porta", "0"],
+                            cwd=pasta, env=env, stdout=subprocess.PIPE, text=True)
+    linha = proc.stdout.readline()            # "Servindo em host:porta"
+    if not linha.startswith("Servindo em"):
+        proc.kill()
+        raise RuntimeError("O servidor não iniciou.")
+    return proc, int(linha.rsplit(":", 1)[1])
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clientes", type=int, default=50)
+    parser.add_argument("--comandos", type=int, default=200, help="comandos por cliente")
+    parser.add_argument("--itens", type=int, default=5000, help="tamanho do catálogo sintético")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=None, help="usa um servidor já em execução")
+    args = parser.parse_args()
+
+    qtd = proporcoes(args.itens)
+    proc = None
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.porta is None:
+            proc, args.porta = _subir_servidor(Path(tmp), args.itens)
+        try:
+            latencias, erros, seg = asyncio.run(_rodar(args, qtd))
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+
+    todas = sorted(x for v in latencias.values() for x in v)
+    print(f"{args.clientes} clientes x {args.comandos} comandos: {len(todas)} requisições "
+          f"em {seg:.2f}s ({len(todas) / seg:,.0f} req/s), {len(erros)} erros")
+    print(f"{'comando':>20} {'qtd':>7} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for tipo, valores in sorted(latencias.items()) + [("TOTAL", todas)]:
+        valores = sorted(valores)
+        print(f"{tipo:>20} {len(valores):>7} {percentil(valores, 50) * 1000:>9.2f} "
+              f"{percentil(valores, 99) * 1000:>9.2f}")
+    for e in erros[:5]:
+        print("  erro:", e)
+
+
+if __name__ == "__main__":
+    main_bench()
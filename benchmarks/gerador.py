@@ -0,0 +1,99 @@
+# benchmarks/gerador.py
+"""
+Gera arquivos sintéticos no formato de config/ExemploDeEntrada1 (ou, com --em-linha,
+usuários, músicas e podcasts no formato em linha de config/dados.md).
+Uso: python -m benchmarks.gerador <caminho> <n_itens> [--em-linha]
+"""
+import random
+import sys
+from pathlib import Path
+
+GENEROS = ["Rock", "Pop", "Rap", "Classico", "Sertanejo", "Jazz", "MPB", "Samba"]
+
+
+def proporcoes(n_itens: int) -> dict[str, int]:
+    """Divide 'n_itens' entre as seções (60% músicas, 20% podcasts, 10% usuários, 10% playlists)."""
+    n_musicas = max(1, n_itens * 6 // 10)
+    n_podcasts = max(1, n_itens * 2 // 10)
+    n_usuarios = max(1, n_itens // 10)
+    n_playlists = max(1, n_itens - n_musicas - n_podcasts - n_usuarios)
+    return {"musicas": n_musicas, "podcasts": n_podcasts,
+            "usuarios": n_usuarios, "playlists": n_playlists}
+
+
+def gerar_arquivo(caminho: Path, n_itens: int, taxa_invalidos: float = 0.0,
+                  taxa_duplicados: float = 0.0, semente: int = 42,
+                  em_linha: bool = False) -> dict[str, int]:
+    """
+    Escreve um arquivo de dados com aproximadamente 'n_itens' itens.
+    - taxa_invalidos: fração de linhas inválidas (duração negativa, episódio não numérico,
+      usuário inexistente, item inexistente), como em ExemploDeEntrada2.
+    - taxa_duplicados: fração de títulos/nomes repetidos.
+    - em_linha: usuários, músicas e podcasts como '- valor | valor | ...' (playlists
+      seguem em 'chave: valor'); com a mesma semente, os dados são os mesmos.
+    Retorna a quantidade gerada por seção.
+    """
+    rnd = random.Random(semente)
+    qtd = proporcoes(n_itens)
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+
+    def invalido() -> bool:
+        return rnd.random() < taxa_invalidos
+
+    def duplicado(i: int) -> int:
+        return rnd.randrange(i) if i and rnd.random() < taxa_duplicados else i
+
+    with caminho.open("w", encoding="utf-8") as f:
+        f.write("\n---\n\n# Usuários\n\n")
+        for i in range(qtd["usuarios"]):
+            if em_linha:
+                f.write(f"- Usuario {duplicado(i)}\n")
+            else:
+                f.write(f"- nome: Usuario {duplicado(i)}  \n    playlists: []\n    \n")
+
+        f.write("\n---\n\n# Músicas\n\n")
+        for i in range(qtd["musicas"]):
+            dur = -rnd.randint(1, 600) if invalido() else rnd.randint(60, 600)
+            titulo = f"Musica {duplicado(i)}"
+            artista = f"Artista {rnd.randrange(max(1, qtd['musicas'] // 10))}"
+            genero = rnd.choice(GENEROS)
+            if em_linha:
+                f.write(f"- {titulo} | {dur} | {artista} | {genero}\n")
+            else:
+                f.write(f"- titulo: {titulo}  \n    artista: {artista}  \n"
+                        f"    genero: {genero}  \n    duracao: {dur}\n    \n")
+
+        f.write("\n---\n\n# Podcasts\n\n")
+        for i in range(qtd["podcasts"]):
+            ep = "quinze" if invalido() else str(rnd.randint(1, 200))
+            titulo = f"Podcast {duplicado(i)}"
+            temporada = f"Temporada {rnd.randint(1, 10)}"
+            host = f"Host {rnd.randrange(max(1, qtd['podcasts'] // 10))}"
+            dur = rnd.randint(600, 7200)
+            if em_linha:
+                f.write(f"- {titulo} | {dur} | {host} | {temporada} | {ep}\n")
+            else:
+                f.write(f"- titulo: {titulo}  \n    temporada: {temporada}  \n"
+                        f"    episodio: {ep}  \n    host: {host}  \n    duracao: {dur}\n    \n")
+
+        f.write("\n---\n\n# Playlists\n\n")
+        for i in range(qtd["playlists"]):
+            dono = rnd.randrange(qtd["usuarios"])
+            if invalido():
+                dono = qtd["usuarios"] + i
+            itens = [f"Musica {rnd.randrange(qtd['musicas'])}" for _ in range(rnd.randint(1, 8))]
+            if invalido():
+                itens.append("Música Inexistente")
+            f.write(f"- nome: Playlist {duplicado(i)}  \n"
+                    f"    usuario: Usuario {dono}  \n"
+                    f"    itens: [{', '.join(itens)}]\n    \n")
+    return qtd
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--em-linha"]
+    if len(args) != 2:
+        print("Uso: python -m benchmarks.gerador <caminho> <n_itens> [--em-linha]")
+        sys.exit(1)
+    print(gerar_arquivo(Path(args[0]), int(args[1]), em_linha="--em-linha" in sys.argv))
@@ -0,0 +1,98 @@
+# benchmarks/stress_contadores.py
+"""
+Teste de estresse do modo concorrente: milhões de reproduções disparadas por
+várias threads (com mídias "quentes" disputadas por todas) e conferência exata
+dos totais por mídia, por playlist, por usuário e do sistema. Também cria
+usuários em paralelo para conferir Usuario.qntd_instancias.
+Consolidações são feitas durante a carga, como faria um relatório ao vivo.
+Uso: python -m benchmarks.stress_contadores [n_reproducoes] [n_threads]
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.reproducao_concorrente import ReproducaoConcorrente
+from Streaming.usuario import Usuario
+
+
+def _trabalho(eventos, usuarios, midias, playlists):
+    for u, m in eventos:
+        if m < 0:
+            playlists[-m - 1].reproduzir(None)
+        else:
+            usuarios[u].ouvir_midia(midias[m], None)
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_reproducoes", nargs="?", type=int, default=2_000_000)
+    parser.add_argument("n_threads", nargs="?", type=int, default=8)
+    args = parser.parse_args()
+    sys.setswitchinterval(1e-5)   # troca de thread frequente: expõe condições de corrida
+
+    ArquivoDeMidia.limpar_registro()
+    midias = [Musica(f"Musica {i}", 200, f"Artista {i % 20}", "Pop") for i in range(1_000)]
+    usuarios = [Usuario(f"Usuario {i}") for i in range(100)]
+    playlists = []
+    for i in range(10):
+        p = Playlist(f"Playlist {i}", usuarios[i])
+        for m in midias[i * 10:(i + 1) * 10]:
+            p.adicionar_midia(m)
+        playlists.append(p)
+
+    rnd = random.Random(7)
+    esperado_midia = [0] * len(midias)
+    esperado_usuario = [0] * len(usuarios)
+    esperado_playlist = [0] * len(playlists)
+    eventos = []
+    n_ev = 0
+    while n_ev < args.n_reproducoes:
+        if rnd.random() < 0.001:
+            p = rnd.randrange(len(playlists))
+            eventos.append((0, -p - 1))
+            esperado_playlist[p] += 1
+            for m in playlists[p]:
+                esperado_midia[midias.index(m)] += 1
+            n_ev += len(playlists[p])
+        else:
+            m = rnd.randrange(5) if rnd.random() < 0.5 else rnd.randrange(len(midias))  # 5 mídias quentes
+            u = rnd.randrange(len(usuarios))
+            eventos.append((u, m))
+            esperado_midia[m] += 1
+            esperado_usuario[u] += 1
+            n_ev += 1
+    fatias = [eventos[i::args.n_threads] for i in range(args.n_threads)]
+
+    instancias_antes = Usuario.qntd_instancias
+    ini = time.perf_counter()
+    parciais = []
+    with ReproducaoConcorrente() as rc:
+        with ThreadPoolExecutor(args.n_threads) as pool:
+            tarefas = [pool.submit(_trabalho, f, usuarios, midias, playlists) for f in fatias]
+            tarefas += [pool.submit(lambda: [Usuario("x") for _ in range(10_000)])
+                        for _ in range(args.n_threads)]
+            while not all(t.done() for t in tarefas):
+                parciais.append(rc.consolidar())
+                time.sleep(0.05)
+            for t in tarefas:
+                t.result()
+    seg = time.perf_counter() - ini
+
+    assert [m.reproducoes for m in midias] == esperado_midia, "reproduções por mídia"
+    assert [p.reproducoes for p in playlists] == esperado_playlist, "reproduções por playlist"
+    assert [len(u.historico) for u in usuarios] == esperado_usuario, "históricos"
+    assert ArquivoDeMidia.contadores.reproducoes == n_ev, "total do sistema"
+    assert Usuario.qntd_instancias - instancias_antes == 10_000 * args.n_threads, "qntd_instancias"
+    print(f"{n_ev} reproduções em {args.n_threads} threads: {seg:.2f}s "
+          f"({n_ev / seg:,.0f} reproduções/s), {len(parciais)} consolidações durante a carga")
+    print("totais exatos: OK")
+
+
+if __name__ == "__main__":
+    main_bench()
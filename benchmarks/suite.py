@@ -0,0 +1,160 @@
+# benchmarks/suite.py
+"""
+Suíte de benchmarks em escala sintética (só biblioteca padrão).
+Para cada tamanho gera um arquivo no formato de ExemploDeEntrada1, com duplicados e
+linhas inválidas como em ExemploDeEntrada2, e mede as fases:
+  carga_fria, carga_snapshot, busca_titulo, avaliar, ouvir_midia, playlist_reproduzir,
+  analises_* (cada método de Analises) e relatorio.
+Os resultados vão para um JSON (--saida); --comparar mostra a razão contra um JSON
+anterior e termina com código 1 se alguma fase ficar mais lenta que --limite.
+Uso: python -m benchmarks.suite [--tamanhos 1000 100000 1000000] [--operacoes 100000]
+                                [--saida resultados.json] [--comparar base.json]
+"""
+import argparse
+import datetime
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import main
+from Streaming.analises import Analises
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.snapshot import caminho_snapshot
+from benchmarks.gerador import gerar_arquivo
+
+VERSAO_RESULTADOS = 1
+
+
+def _commit() -> str | None:
+    """Commit atual do git (None fora de um repositório)."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cronometrar(funcao, repeticoes: int = 1) -> float:
+    """Menor tempo entre 'repeticoes' execuções de funcao()."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        ini = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - ini)
+    return melhor
+
+
+def medir_tamanho(n_itens: int, pasta: Path, operacoes: int, repeticoes: int) -> dict:
+    """Gera o arquivo de 'n_itens' itens e mede todas as fases."""
+    arq = pasta / f"dados_{n_itens}.md"
+    gerar_arquivo(arq, n_itens, taxa_invalidos=0.02, taxa_duplicados=0.05)
+    main.ARQ_DADOS = arq
+    main.ARQ_LOG = pasta / "erros.log"
+    main.ARQ_REL = pasta / "relatorio.txt"
+    fases = {}
+
+    def fase(nome: str, funcao, ops: int = 1, rep: int = 1) -> None:
+        fases[nome] = {"segundos": _cronometrar(funcao, rep), "operacoes": ops}
+
+    caminho_snapshot(arq).unlink(missing_ok=True)
+    fase("carga_fria", lambda: main.carregar_dados(processos=1), n_itens)
+    fase("carga_snapshot", main.carregar_dados, n_itens)
+
+    rnd = random.Random(n_itens)
+    musicas, usuarios, playlists = main.MUSICAS, main.USUARIOS, main.PLAYLISTS
+    titulos = [rnd.choice(musicas).titulo if rnd.random() < 0.9 else f"Inexistente {i}"
+               for i in range(operacoes)]
+    fase("busca_titulo", lambda: [ArquivoDeMidia.buscar_por_titulo(t) for t in titulos],
+         operacoes, repeticoes)
+
+    notas = [(rnd.choice(musicas), rnd.randint(0, 5)) for _ in range(operacoes)]
+    fase("avaliar", lambda: [m.avaliar(n) for m, n in notas], operacoes)
+
+    eventos = [(rnd.choice(usuarios), rnd.choice(musicas)) for _ in range(operacoes)]
+    fase("ouvir_midia", lambda: [u.ouvir_midia(m, None) for u, m in eventos], operacoes)
+
+    fase("playlist_reproduzir", lambda: [p.reproduzir(None) for p in playlists],
+         sum(len(p) for p in playlists))
+
+    for nome, funcao in (
+            ("top_musicas_reproduzidas", lambda: Analises.top_musicas_reproduzidas(musicas, 10)),
+            ("playlist_mais_popular", lambda: Analises.playlist_mais_popular(playlists)),
+            ("usuario_mais_ativo", lambda: Analises.usuario_mais_ativo(usuarios)),
+            ("media_avaliacoes", lambda: Analises.media_avaliacoes(musicas)),
+            ("total_reproducoes", lambda: Analises.total_reproducoes(usuarios))):
+        fase(f"analises_{nome}", funcao, len(musicas), repeticoes)
+
+    def relatorio():
+        main.RELATORIO.invalidar()
+        main.RELATORIO.escrever(main.ARQ_REL)
+    fase("relatorio", relatorio, len(musicas), repeticoes)
+
+    return {"itens": n_itens,
+            "contagens": {"usuarios": len(usuarios), "musicas": len(musicas),
+                          "podcasts": len(main.PODCASTS), "playlists": len(playlists)},
+            "fases": fases}
+
+
+def comparar(atual: dict, anterior: dict, limite: float) -> list[str]:
+    """Mostra atual/anterior por fase; retorna as fases acima do limite."""
+    regressoes = []
+    print(f"\n{'itens':>9} {'fase':>38} {'antes(s)':>10} {'agora(s)':>10} {'razão':>7}")
+    for n, dados in atual["tamanhos"].items():
+        base = anterior.get("tamanhos", {}).get(n)
+        if base is None:
+            continue
+        for nome, r in dados["fases"].items():
+            b = base["fases"].get(nome)
+            if b is None or not b["segundos"]:
+                continue
+            razao = r["segundos"] / b["segundos"]
+            marca = "  <-- regressão" if razao > limite else ""
+            print(f"{n:>9} {nome:>38} {b['segundos']:>10.4f} {r['segundos']:>10.4f} {razao:>7.2f}{marca}")
+            if marca:
+                regressoes.append(f"{n}:{nome}")
+    return regressoes
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tamanhos", nargs="+", type=int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--operacoes", type=int, default=100_000,
+                        help="buscas, avaliações e reproduções por tamanho")
+    parser.add_argument("--repeticoes", type=int, default=3, help="fases sem efeito colateral: menor tempo")
+    parser.add_argument("--saida", type=Path, default=Path("resultados_benchmark.json"))
+    parser.add_argument("--comparar", type=Path, help="JSON de uma execução anterior")
+    parser.add_argument("--limite", type=float, default=1.25, help="razão que conta como regressão")
+    args = parser.parse_args()
+
+    resultado = {"versao": VERSAO_RESULTADOS, "commit": _commit(),
+                 "python": platform.python_version(), "plataforma": platform.platform(),
+                 "data": datetime.datetime.now().isoformat(timespec="seconds"),
+                 "operacoes": args.operacoes, "tamanhos": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'itens':>9} {'fase':>38} {'segundos':>10} {'us/op':>10}")
+        for n in args.tamanhos:
+            r = medir_tamanho(n, Path(tmp), args.operacoes, args.repeticoes)
+            resultado["tamanhos"][str(n)] = r
+            for nome, f in r["fases"].items():
+                por_op = f["segundos"] / f["operacoes"] * 1e6 if f["operacoes"] else 0.0
+                print(f"{n:>9} {nome:>38} {f['segundos']:>10.4f} {por_op:>10.2f}")
+        main.REGISTRO_ERROS.fechar()
+
+    args.saida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        anterior = json.loads(args.comparar.read_text(encoding="utf-8"))
+        regressoes = comparar(resultado, anterior, args.limite)
+        if regressoes:
+            print(f"{len(regressoes)} fase(s) acima de {args.limite:.2f}x: {', '.join(regressoes)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_bench()
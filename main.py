@@ -1,6 +1,7 @@
 # main.py
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
 
 # Imports do pacote Streaming
 from Streaming.menu import Menu
@@ -10,6 +11,18 @@ from Streaming.podcast import Podcast
 from Streaming.playlist import Playlist
 from Streaming.analises import Analises
 from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.placar import Placar
+from Streaming.colunas import MusicaColunar, PodcastColunar, limpar_lojas
+from Streaming.historico import HistoricoDeReproducao
+from Streaming.registro_erros import RegistroDeErros
+from Streaming.relatorio import RelatorioIncremental
+from Streaming.instrumentacao import Instrumentacao
+from Streaming.recomendacao import Recomendador
+from Streaming.leitor import SECOES_CARGA, normalizar, registros_sequenciais
+from Streaming.carga_paralela import processos_para, registros_paralelos
+from Streaming.snapshot import caminho_snapshot, carregar_snapshot, gravar_snapshot
+from Streaming.vigia import VigiaDeDados, resumo_recarga
+from Streaming.sessao import SessaoDeComandos, executar_script
 
 # --------------------------------- Coleções -----------------------------------
 USUARIOS = []
@@ -17,220 +30,311 @@ MUSICAS = []
 PODCASTS = []
 PLAYLISTS = []
 
+# ------------------------------ Placares ao vivo ------------------------------
+# Mesmos critérios e desempates de Analises, mantidos a cada reprodução:
+# o relatório consulta o topo em O(k) em vez de percorrer as coleções.
+PLACAR_MUSICAS = Placar(lambda m: (-m.reproducoes, m.titulo.lower()), capacidade=10)
+PLACAR_PLAYLISTS = Placar(lambda p: (p.reproducoes, p.nome.lower()), capacidade=1, maior_melhor=True)
+PLACAR_USUARIOS = Placar(lambda u: (len(u.historico), u.nome.lower()), capacidade=1, maior_melhor=True)
+ArquivoDeMidia.placares.append(PLACAR_MUSICAS)
+Playlist.placares.append(PLACAR_PLAYLISTS)
+Usuario.placares.append(PLACAR_USUARIOS)
+
+# Relatório com seções em cache: as mesmas listas de placares avisam o que ficou sujo
+RELATORIO = RelatorioIncremental((USUARIOS, MUSICAS, PODCASTS, PLAYLISTS))
+ArquivoDeMidia.placares.append(RELATORIO)
+Playlist.placares.append(RELATORIO)
+Usuario.placares.append(RELATORIO)
+
+# Co-ocorrências de playlists e históricos, atualizadas a cada adição/reprodução
+RECOMENDADOR = Recomendador()
+Playlist.recomendador = RECOMENDADOR
+Usuario.recomendador = RECOMENDADOR
+
 # ---------------------------------- Caminhos ----------------------------------
 ARQ_DADOS = Path("config/dados.md")
 ARQ_LOG = Path("logs/erros.log")
 ARQ_REL = Path("relatorios/relatorio.txt")
+ARQ_ESTATISTICAS = Path("relatorios/estatisticas.json")
 
-# --------------------------------- Utilidades ---------------------------------
-def _norm(s):
-    return " ".join((s or "").strip().split()).lower()
+# Log com buffer e gravação em segundo plano (ver Streaming/registro_erros.py)
+REGISTRO_ERROS = RegistroDeErros(ARQ_LOG)
+
+# True -> músicas/podcasts carregados em colunas compactas (Streaming/colunas.py)
+ARMAZENAMENTO_COLUNAR = False
+
+# VigiaDeDados no modo --vigiar (alterações de ARQ_DADOS aplicadas sem recarregar tudo)
+VIGIA = None
+
+# Recarga (--vigiar) e comandos de texto leem as coleções, os placares e os caminhos daqui
+VigiaDeDados.app = SessaoDeComandos.app = sys.modules[__name__]
 
+# --------------------------------- Utilidades ---------------------------------
 def log_erro(msg):
-    ARQ_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with ARQ_LOG.open("a", encoding="utf-8") as f:
-        f.write(f"[{datetime.now().strftime('%d/%m/%Y %H:%M:%S')}] {msg}\n")
+    # ARQ_LOG pode ser trocado em tempo de execução (ex.: benchmarks)
+    REGISTRO_ERROS.redirecionar(ARQ_LOG)
+    REGISTRO_ERROS.registrar(msg)
 
-def escrever_relatorio(texto):
-    ARQ_REL.parent.mkdir(parents=True, exist_ok=True)
-    ARQ_REL.write_text(texto, encoding="utf-8")
+def classes_midia():
+    """(classe de música, classe de podcast) conforme o modo de armazenamento."""
+    if ARMAZENAMENTO_COLUNAR:
+        return MusicaColunar, PodcastColunar
+    return Musica, Podcast
 
 def encontrar_usuario(nome):
-    alvo = _norm(nome)
+    alvo = normalizar(nome)
     for u in USUARIOS:
-        if _norm(u.nome) == alvo:
+        if normalizar(u.nome) == alvo:
             return u
     return None
 
-def _parse_inline_list(value):
-    v = (value or "").strip()
-    if v.startswith("[") and v.endswith("]"):
-        inner = v[1:-1]
-        return [x.strip() for x in inner.split(",") if x.strip()]
-    return []
-
-def _split_sections_md(text):
-    """
-    Divide por '---' e mapeia '# Título' -> bloco de linhas seguintes.
-    Suporta: Usuários, Músicas, Podcasts, Playlists (variações de caixa/acentos).
-    """
-    parts = [b.strip() for b in text.split("---") if b.strip()]
-    out = {}
-    for block in parts:
-        lines = [ln.rstrip() for ln in block.splitlines() if ln.strip()]
-        if lines and lines[0].startswith("# "):
-            title = lines[0][2:].strip()
-            out[title] = "\n".join(lines[1:])
-    return out
-
-def _parse_items_block_md(block):
-    """
-    Lê itens no formato:
-      - chave: valor
-        outra: valor
-    Retorna lista de dicts.
-    """
-    items = []
-    current = None
-    for line in (block or "").splitlines():
-        if line.lstrip().startswith("- "):
-            if current:
-                items.append(current)
-            current = {}
-            body = line.strip()[2:]
-            if body and ":" in body:
-                k, v = body.split(":", 1)
-                current[k.strip()] = v.strip()
-        elif line.startswith("  "):
-            ln = line.strip()
-            if ":" in ln and current is not None:
-                k, v = ln.split(":", 1)
-                current[k.strip()] = v.strip()
-    if current:
-        items.append(current)
-    return items
+def encontrar_playlist(usuario, nome):
+    alvo = normalizar(nome)
+    for p in usuario.playlists:
+        if normalizar(p.nome) == alvo:
+            return p
+    return None
 
 # ------------------------------- Carga de dados -------------------------------
-def carregar_dados():
+def carregar_dados(processos=None):
     """
     Lê config/dados.md no padrão do professor e preenche:
     USUARIOS, MUSICAS, PODCASTS, PLAYLISTS.
     Idempotente; registra erros sem interromper a execução.
+    'processos': None decide pelo tamanho do arquivo; 1 força a carga sequencial.
     """
     if not ARQ_DADOS.exists():
         log_erro("Arquivo de dados não encontrado.")
         return
 
+    ini = time.perf_counter()
     # Idempotência
     USUARIOS[:] = []
     MUSICAS[:] = []
     PODCASTS[:] = []
     PLAYLISTS[:] = []
-    ArquivoDeMidia.registroMidia[:] = []
-
-    try:
-        raw = ARQ_DADOS.read_text(encoding="utf-8")
-    except Exception as e:
-        log_erro(f"Falha ao ler {ARQ_DADOS}: {e}")
-        return
+    ArquivoDeMidia.limpar_registro()
+    limpar_lojas()
+    HistoricoDeReproducao.limpar_codigos()
+    RECOMENDADOR.limpar()
+
+    # Partida rápida: snapshot compilado ainda válido dispensa leitura e validação
+    with Instrumentacao.medir("carregar_dados.snapshot"):
+        rapido = _carregar_snapshot(ARQ_DADOS)
+    if not rapido:
+        try:
+            _carregar_secoes(ARQ_DADOS, processos_para(ARQ_DADOS, processos))
+        except (OSError, UnicodeDecodeError) as e:
+            log_erro(f"Falha ao ler {ARQ_DADOS}: {e}")
+        else:
+            compilar_snapshot(ARQ_DADOS)
+    _montar_placares()
+    RELATORIO.invalidar()
+    if VIGIA is not None:
+        VIGIA.iniciar()
+    ArquivoDeMidia.catalogo.busca.preparar_em_segundo_plano()   # a 1ª busca não paga a indexação
+    Instrumentacao.registrar("carregar_dados", time.perf_counter() - ini)
+
+def _montar_placares():
+    """Reinicia os placares ao vivo com as coleções carregadas."""
+    for placar, colecao in ((PLACAR_MUSICAS, MUSICAS), (PLACAR_PLAYLISTS, PLAYLISTS),
+                            (PLACAR_USUARIOS, USUARIOS)):
+        placar.remontar(colecao)
+
+def _carregar_secoes(caminho, processos=1):
+    """
+    Preenche as coleções a partir dos registros validados de cada seção.
+    - processos == 1: uma passada por seção no próprio processo.
+    - processos > 1: blocos validados em paralelo (ver registros_paralelos).
+    """
+    if processos > 1:
+        registros = registros_paralelos(caminho, processos)
+    else:
+        registros = {tipo: registros_sequenciais(caminho, tipo) for tipo in SECOES_CARGA}
 
-    sections = _split_sections_md(raw)
-    sections_ci = { _norm(k): v for k, v in sections.items() }
-    def sec(name):
-        return sections_ci.get(_norm(name), "")
+    # Índices por chave normalizada (mantidos durante a carga -> O(n))
+    idx_musicas  = {}   # titulo -> Musica
+    idx_podcasts = {}   # titulo -> Podcast
+    idx_usuarios = {}   # nome -> Usuario
+    idx_playlists = set()  # (nome do usuário, nome da playlist)
+    ClasseMusica, ClassePodcast = classes_midia()
 
     # ------------------------ MÚSICAS ------------------------
-    for m in _parse_items_block_md(sec("Músicas")) + _parse_items_block_md(sec("Musicas")):
+    ini = time.perf_counter()
+    for reg in registros["musicas"]:
+        if reg[0] == "erro":
+            log_erro(reg[1])
+            continue
+        _, chave, campos = reg
+        if chave in idx_musicas:
+            continue
         try:
-            titulo  = (m.get("titulo", "")).strip()
-            artista = (m.get("artista", "")).strip()
-            genero  = (m.get("genero", "")).strip()
-            duracao = int(m.get("duracao", "0"))
-            if duracao <= 0:
-                log_erro(f"Música '{titulo}': duração inválida ({duracao}).")
-                continue
-            if any(_norm(x.titulo) == _norm(titulo) for x in MUSICAS):
-                continue
-            MUSICAS.append(Musica(titulo, duracao, artista, genero))
+            musica = ClasseMusica(*campos)
         except Exception as e:
-            log_erro(f"Erro ao criar música {m}: {e}")
+            log_erro(f"Erro ao criar música {campos}: {e}")
+            continue
+        MUSICAS.append(musica)
+        idx_musicas[chave] = musica
+    Instrumentacao.registrar("carregar_dados.musicas", time.perf_counter() - ini)
 
     # ------------------------ PODCASTS -----------------------
-    for p in _parse_items_block_md(sec("Podcasts")):
-        try:
-            titulo    = (p.get("titulo", "")).strip()
-            temporada = (p.get("temporada", "")).strip()
-            host      = (p.get("host", "")).strip()
-            duracao   = int(p.get("duracao", "0"))
-            episodio  = int(p.get("episodio", "0"))
-            if duracao <= 0 or episodio <= 0:
-                log_erro(f"Podcast '{titulo}': duração/episódio inválido (dur={duracao}, ep={episodio}).")
-                continue
-            if any(_norm(x.titulo) == _norm(titulo) for x in PODCASTS):
-                continue
-
-            # Compatível com duas possíveis assinaturas do Podcast:
-            # 1) Podcast(titulo, duracao, host, temporada, episodio)
-            # 2) Podcast(titulo, duracao, artista, temporada, episodio, host)
-            ok = False
-            try:
-                PODCASTS.append(Podcast(titulo, duracao, host, temporada, episodio))
-                ok = True
-            except TypeError:
-                pass
-            if not ok:
-                try:
-                    PODCASTS.append(Podcast(titulo, duracao, host, temporada, episodio, host))
-                    ok = True
-                except Exception as e2:
-                    log_erro(f"Assinatura incompatível para Podcast '{titulo}': {e2}")
-            if not ok:
-                log_erro(f"Falha ao criar podcast '{titulo}'.")
-        except ValueError:
-            log_erro(f"Podcast '{p.get('titulo','')}': episódio inválido '{p.get('episodio','')}'.")
-        except Exception as e:
-            log_erro(f"Erro ao criar podcast {p}: {e}")
+    ini = time.perf_counter()
+    for reg in registros["podcasts"]:
+        if reg[0] == "erro":
+            log_erro(reg[1])
+            continue
+        _, chave, campos, msg_invalido = reg
+        if chave in idx_podcasts:
+            continue
+        podcast = criar_podcast(ClassePodcast, campos, msg_invalido)
+        if podcast is not None:
+            PODCASTS.append(podcast)
+            idx_podcasts[chave] = podcast
+    Instrumentacao.registrar("carregar_dados.podcasts", time.perf_counter() - ini)
 
     # ------------------------ USUÁRIOS -----------------------
-    for u in _parse_items_block_md(sec("Usuários")) + _parse_items_block_md(sec("Usuarios")):
+    ini = time.perf_counter()
+    for reg in registros["usuarios"]:
+        if reg[0] == "erro":
+            log_erro(reg[1])
+            continue
+        _, chave, nome = reg
+        if chave in idx_usuarios:
+            continue
         try:
-            nome = (u.get("nome", "")).strip()
-            if not nome:
-                continue
-            if encontrar_usuario(nome) is None:
-                USUARIOS.append(Usuario(nome))
+            usuario = Usuario(nome)
         except Exception as e:
-            log_erro(f"Erro ao criar usuário {u}: {e}")
-
-    # Índices para resolver itens por título (case-insensitive)
-    idx_musicas  = { _norm(m.titulo): m for m in MUSICAS }
-    idx_podcasts = { _norm(p.titulo): p for p in PODCASTS }
+            log_erro(f"Erro ao criar usuário {nome}: {e}")
+            continue
+        USUARIOS.append(usuario)
+        idx_usuarios[chave] = usuario
+    Instrumentacao.registrar("carregar_dados.usuarios", time.perf_counter() - ini)
 
     # ------------------------ PLAYLISTS ----------------------
-    for pl in _parse_items_block_md(sec("Playlists")):
-        try:
-            nome   = (pl.get("nome", "")).strip()
-            dono   = (pl.get("usuario", "")).strip()
-            itens  = _parse_inline_list(pl.get("itens", "[]"))
-            if not nome:
-                log_erro("Playlist sem nome ignorada.")
-                continue
-            u = encontrar_usuario(dono)
-            if not u:
-                log_erro(f"Playlist '{nome}': usuário inexistente '{dono}'.")
+    ini = time.perf_counter()
+    for reg in registros["playlists"]:
+        if reg[0] == "erro":
+            log_erro(reg[1])
+            continue
+        _, chave_nome, (nome, dono, chave_dono, itens) = reg
+        u = idx_usuarios.get(chave_dono)
+        if not u:
+            log_erro(f"Playlist '{nome}': usuário inexistente '{dono}'.")
+            continue
+        chave_pl = (chave_dono, chave_nome)
+        if chave_pl in idx_playlists:
+            log_erro(f"Playlist duplicada para '{dono}': '{nome}'.")
+            continue
+
+        # duplicidade já verificada pelo índice: evita a varredura de criar_playlist
+        playlist = Playlist(nome, u)
+        u.playlists.append(playlist)
+        PLAYLISTS.append(playlist)
+        idx_playlists.add(chave_pl)
+
+        vistos = set()
+        for titulo_item, key in itens:
+            if key in vistos:
+                log_erro(f"Item repetido na playlist '{nome}': '{titulo_item}'.")
                 continue
-            if any(_norm(p.nome) == _norm(nome) for p in u.playlists):
-                log_erro(f"Playlist duplicada para '{dono}': '{nome}'.")
+            vistos.add(key)
+            midia = idx_musicas.get(key) or idx_podcasts.get(key)
+            if not midia:
+                log_erro(f"Item inexistente na playlist '{nome}': '{titulo_item}'.")
                 continue
+            playlist.adicionar_midia(midia)
+    Instrumentacao.registrar("carregar_dados.playlists", time.perf_counter() - ini)
 
-            playlist = u.criar_playlist(nome)
-            PLAYLISTS.append(playlist)
-
-            vistos = set()
-            for titulo_item in itens:
-                key = _norm(titulo_item)
-                if key in vistos:
-                    log_erro(f"Item repetido na playlist '{nome}': '{titulo_item}'.")
-                    continue
-                vistos.add(key)
-                midia = idx_musicas.get(key) or idx_podcasts.get(key)
-                if not midia:
-                    log_erro(f"Item inexistente na playlist '{nome}': '{titulo_item}'.")
-                    continue
-                playlist.adicionar_midia(midia)
-        except Exception as e:
-            log_erro(f"Erro ao criar playlist {pl}: {e}")
+def criar_podcast(ClassePodcast, campos, msg_invalido):
+    """Cria o podcast de um registro validado; registra o erro e retorna None se falhar."""
+    titulo, duracao, host, temporada, episodio = campos
+    try:
+        # Compatível com duas possíveis assinaturas do Podcast:
+        # 1) Podcast(titulo, duracao, host, temporada, episodio)
+        # 2) Podcast(titulo, duracao, artista, temporada, episodio, host)
+        podcast = None
+        try:
+            podcast = ClassePodcast(titulo, duracao, host, temporada, episodio)
+        except TypeError:
+            pass
+        if podcast is None:
+            try:
+                podcast = ClassePodcast(titulo, duracao, host, temporada, episodio, host)
+            except Exception as e2:
+                log_erro(f"Assinatura incompatível para Podcast '{titulo}': {e2}")
+        if podcast is None:
+            log_erro(f"Falha ao criar podcast '{titulo}'.")
+        return podcast
+    except ValueError:
+        log_erro(msg_invalido)
+    except Exception as e:
+        log_erro(f"Erro ao criar podcast {campos}: {e}")
+    return None
+
+# ----------------------------- Snapshot compilado -----------------------------
+# Formato, chave de origem e versão em Streaming/snapshot.py
+def compilar_snapshot(caminho=None):
+    """
+    Grava as coleções carregadas em um snapshot binário ao lado de 'caminho'.
+    Falhas são registradas no log e não interrompem a execução.
+    """
+    caminho = Path(caminho or ARQ_DADOS)
+    try:
+        gravar_snapshot(caminho, MUSICAS, PODCASTS, USUARIOS, PLAYLISTS)
+    except (OSError, ValueError) as e:
+        log_erro(f"Falha ao gravar snapshot {caminho_snapshot(caminho)}: {e}")
+
+def _carregar_snapshot(caminho):
+    """
+    Recria as coleções a partir do snapshot, se existir e ainda for válido.
+    Retorna True se carregou; False para cair na leitura do arquivo .md.
+    """
+    try:
+        return carregar_snapshot(caminho, MUSICAS, PODCASTS, USUARIOS, PLAYLISTS, *classes_midia())
+    except Exception as e:
+        log_erro(f"Snapshot inválido {caminho_snapshot(caminho)}, relendo {caminho}: {e}")
+        USUARIOS[:] = []
+        MUSICAS[:] = []
+        PODCASTS[:] = []
+        PLAYLISTS[:] = []
+        ArquivoDeMidia.limpar_registro()
+        limpar_lojas()
+        return False
+
+def _verificar_dados(saida=print):
+    """Modo --vigiar: aplica as alterações de ARQ_DADOS, se houver, e avisa em 'saida'."""
+    if VIGIA is None:
+        return
+    contagem = VIGIA.verificar()
+    resumo = resumo_recarga(contagem) if contagem else ""
+    if resumo and saida is not None:
+        saida(f"Dados recarregados: {resumo}")
 
 # -------------------------------- Ações de menu -------------------------------
 def acao_reproduzir(usuario):
     titulo = input("Título da mídia (música/podcast): ").strip()
     midia = ArquivoDeMidia.buscar_por_titulo(titulo)
+    if midia is None:
+        midia = escolher_sugestao(titulo)
     if midia:
         usuario.ouvir_midia(midia)
     else:
         print("Mídia não encontrada.")
         log_erro(f"Tentativa de reprodução inválida: {titulo}")
 
+def escolher_sugestao(titulo):
+    """Mostra as mídias parecidas com 'titulo' e retorna a escolhida (None se nenhuma)."""
+    sugestoes = ArquivoDeMidia.sugerir(titulo) if titulo else []
+    if not sugestoes:
+        return None
+    print("Título não encontrado. Você quis dizer:")
+    for i, m in enumerate(sugestoes, 1):
+        print(f"  {i} - {m}")
+    escolha = input("Número da mídia (Enter para cancelar): ").strip()
+    if escolha.isdigit() and 1 <= int(escolha) <= len(sugestoes):
+        return sugestoes[int(escolha) - 1]
+    return None
+
 def acao_criar_playlist(usuario):
     """
     Cria playlist e obriga adicionar pelo menos 1 música.
@@ -245,6 +349,7 @@ def acao_criar_playlist(usuario):
     try:
         pl = usuario.criar_playlist(nome)
         PLAYLISTS.append(pl)
+        PLACAR_PLAYLISTS.acompanhar(pl)
         print(f"Playlist '{pl.nome}' criada.")
 
         def _perguntar_e_adicionar_musica(dest):
@@ -297,61 +402,106 @@ def acao_criar_playlist(usuario):
 def acao_concatenar_playlists(usuario):
     a = input("Nome da playlist A: ").strip()
     b = input("Nome da playlist B: ").strip()
-    pa = pb = None
-    for p in usuario.playlists:
-        if _norm(p.nome) == _norm(a):
-            pa = p
-        if _norm(p.nome) == _norm(b):
-            pb = p
+    pa = encontrar_playlist(usuario, a)
+    pb = encontrar_playlist(usuario, b)
     if not pa or not pb:
         print("Playlist A ou B não encontrada.")
         log_erro(f"Concatenação inválida para {usuario.nome}: A='{a}' B='{b}'")
         return
 
-    nova = pa + pb
+    nova = concatenar_playlists(usuario, pa, pb)
+    print(f"Playlist concatenada criada: {nova.nome}")
+
+def concatenar_playlists(usuario, pa, pb):
+    """Cria e registra pa + pb para o usuário (sufixo ' (n)' se o nome já existir)."""
+    nova = pa + pb  # O(1): os itens só são copiados se alguma playlist for editada
     base = nova.nome
     suf = 1
-    while any(_norm(p.nome) == _norm(nova.nome) for p in usuario.playlists):
+    nomes = {normalizar(p.nome) for p in usuario.playlists}
+    while normalizar(nova.nome) in nomes:
         suf += 1
         nova.nome = f"{base} ({suf})"
     usuario.playlists.append(nova)
     PLAYLISTS.append(nova)
-    print(f"Playlist concatenada criada: {nova.nome}")
+    PLACAR_PLAYLISTS.acompanhar(nova)
+    return nova
 
 def acao_relatorio():
-    linhas = []
-    linhas.append("=== RELATÓRIO DO SISTEMA ===")
-    linhas.append(f"Usuários: {len(USUARIOS)} | Músicas: {len(MUSICAS)} | Podcasts: {len(PODCASTS)} | Playlists: {len(PLAYLISTS)}")
+    RELATORIO.escrever(ARQ_REL)
+    print(f"Relatório salvo em {ARQ_REL}")
+
+def montar_relatorio():
+    return RELATORIO.texto()
 
-    top = Analises.top_musicas_reproduzidas(MUSICAS, 5)
-    linhas.append("\nTop 5 músicas mais reproduzidas:")
+def acao_recomendar(usuario):
+    """Sugestões "porque você ouviu X" a partir das últimas mídias ouvidas."""
+    sugestoes = RECOMENDADOR.para_usuario(usuario)
+    if not sugestoes:
+        print("Ouça algumas mídias para receber recomendações.")
+        return
+    for sugestao, motivo in sugestoes:
+        print(f"{sugestao} (porque você ouviu '{motivo.titulo}')")
+
+def acao_estatisticas():
+    """Mostra e grava as medições; na primeira escolha também liga a instrumentação."""
+    if not Instrumentacao.ativa:
+        Instrumentacao.ativar()
+        print("Instrumentação ativada agora: só as operações a partir daqui são medidas.")
+    for linha in Instrumentacao.tabela():
+        print(linha)
+    Instrumentacao.salvar_json(ARQ_ESTATISTICAS)
+    print(f"Estatísticas salvas em {ARQ_ESTATISTICAS}")
+
+# Seções do relatório e os eventos que as sujam (ver Streaming/relatorio.py)
+def _secao_resumo():
+    return ["=== RELATÓRIO DO SISTEMA ===",
+            f"Usuários: {len(USUARIOS)} | Músicas: {len(MUSICAS)} | Podcasts: {len(PODCASTS)} | Playlists: {len(PLAYLISTS)}"]
+
+def _secao_top_musicas():
+    linhas = ["\nTop 5 músicas mais reproduzidas:"]
+    top = PLACAR_MUSICAS.top(5)
     if top:
         for i, m in enumerate(top, start=1):
             linhas.append(f"{i}. {m.titulo} - {m.artista} ({m.reproducoes})")
     else:
         linhas.append("- (vazio)")
-
-    pop = Analises.playlist_mais_popular(PLAYLISTS)
-    linhas.append("\nPlaylist mais popular:")
-    linhas.append("- (vazio)" if pop is None else f"- {pop.nome} ({pop.reproducoes} execuções)")
-
-    ativo = Analises.usuario_mais_ativo(USUARIOS)
-    linhas.append("\nUsuário mais ativo:")
-    linhas.append("- (vazio)" if ativo is None else f"- {ativo.nome} ({len(ativo.historico)} reproduções)")
-
-    medias = Analises.media_avaliacoes(MUSICAS)
-    linhas.append("\nMédias de avaliação por música:")
-    if medias:
-        for t, m in medias.items():
-            linhas.append(f"- {t}: {m:.2f}")
-    else:
-        linhas.append("- (vazio)")
-
-    total = Analises.total_reproducoes(USUARIOS)
-    linhas.append(f"\nTotal de reproduções no sistema: {total}")
-
-    escrever_relatorio("\n".join(linhas))
-    print(f"Relatório salvo em {ARQ_REL}")
+    return linhas
+
+def _secao_playlist_popular():
+    pop = PLACAR_PLAYLISTS.melhor()
+    return ["\nPlaylist mais popular:",
+            "- (vazio)" if pop is None else f"- {pop.nome} ({pop.reproducoes} execuções)"]
+
+def _secao_usuario_ativo():
+    ativo = PLACAR_USUARIOS.melhor()
+    return ["\nUsuário mais ativo:",
+            "- (vazio)" if ativo is None else f"- {ativo.nome} ({len(ativo.historico)} reproduções)"]
+
+def _linhas_medias(medias):
+    # gerador: com centenas de milhares de títulos as linhas vão direto para o arquivo
+    yield "\nMédias de avaliação por música:"
+    if not medias:
+        yield "- (vazio)"
+    for t, m in medias.items():
+        yield f"- {t}: {m:.2f}"
+
+def _secao_total():
+    return [f"\nTotal de reproduções no sistema: {Analises.total_reproducoes(USUARIOS)}"]
+
+RELATORIO.secao("resumo", _secao_resumo, ("colecoes",))
+RELATORIO.secao("top_musicas", _secao_top_musicas, ("reproducao", "colecoes"))
+RELATORIO.secao("playlist_popular", _secao_playlist_popular, ("playlist", "colecoes"))
+RELATORIO.secao("usuario_ativo", _secao_usuario_ativo, ("usuario", "colecoes"))
+RELATORIO.secao("medias", lambda: Analises.media_avaliacoes(MUSICAS), ("avaliacao", "colecoes"),
+                formatar=_linhas_medias)
+RELATORIO.secao("total", _secao_total, ("reproducao", "colecoes"))
+
+def _imprimir_tempos(tempos, segundos):
+    total = sum(t[0] for t in tempos.values())
+    print(f"{total} comandos em {segundos:.3f}s ({total / segundos if segundos else 0:,.0f} comandos/s)")
+    print(f"{'comando':>20} {'qtd':>10} {'erros':>8} {'total(s)':>10} {'média(us)':>10} {'máx(ms)':>9}")
+    for cmd, (qtd, erros, seg, maior) in sorted(tempos.items()):
+        print(f"{cmd:>20} {qtd:>10} {erros:>8} {seg:>10.3f} {seg / qtd * 1e6:>10.1f} {maior * 1000:>9.2f}")
 
 # --------------------------------- Fluxo main ---------------------------------
 def main():
@@ -359,6 +509,7 @@ def main():
     menu = Menu()
 
     while True:
+        _verificar_dados()
         op = menu.exibir_menu_inicial()
 
         if op == "1":
@@ -369,6 +520,7 @@ def main():
                 continue
 
             while True:
+                _verificar_dados()
                 opu = menu.exibir_menu_usuario(u.nome)
 
                 if opu == "1":
@@ -387,11 +539,7 @@ def main():
                         for pl in PLAYLISTS: print(pl)
                 elif opu == "5":
                     nome_pl = input("Nome da playlist: ").strip()
-                    alvo = None
-                    for p in u.playlists:
-                        if _norm(p.nome) == _norm(nome_pl):
-                            alvo = p
-                            break
+                    alvo = encontrar_playlist(u, nome_pl)
                     if not alvo:
                         print("Playlist não encontrada para este usuário.")
                         log_erro(f"Playlist inexistente para {u.nome}: {nome_pl}")
@@ -405,6 +553,10 @@ def main():
                     acao_relatorio()
                 elif opu == "9":
                     break
+                elif opu == "10" or opu.lower() == "stats":
+                    acao_estatisticas()
+                elif opu == "11":
+                    acao_recomendar(u)
                 else:
                     print("Opção inválida.")
 
@@ -415,7 +567,9 @@ def main():
                 log_erro(f"Tentativa de criar usuário duplicado: {nome}")
             else:
                 try:
-                    USUARIOS.append(Usuario(nome))
+                    novo = Usuario(nome)
+                    USUARIOS.append(novo)
+                    PLACAR_USUARIOS.acompanhar(novo)
                     print("Usuário criado com sucesso.")
                 except ValueError as e:
                     print("Nome inválido.")
@@ -434,9 +588,57 @@ def main():
             print("Opção inválida.")
 
 # --------------------------------- Execução -----------------------------------
+def _argumentos():
+    import argparse
+    parser = argparse.ArgumentParser(description="Sistema de streaming (menu interativo ou script).")
+    parser.add_argument("--script", metavar="ARQUIVO",
+                        help="executa os comandos do arquivo ('-' = entrada padrão) sem menu")
+    parser.add_argument("--respostas", metavar="ARQUIVO",
+                        help="grava as respostas do script ('-' = saída padrão)")
+    parser.add_argument("--dados", type=Path, default=ARQ_DADOS)
+    parser.add_argument("--stats", action="store_true",
+                        help="liga a instrumentação desde a carga (ver relatorios/estatisticas.json)")
+    parser.add_argument("--vigiar", type=float, nargs="?", const=2.0, metavar="SEGUNDOS",
+                        help="aplica as alterações do arquivo de dados sem recarregar tudo "
+                             "(verifica a cada SEGUNDOS, padrão 2)")
+    return parser.parse_args()
+
+def main_script(caminho, respostas=None):
+    carregar_dados()
+    entrada = sys.stdin if caminho == "-" else open(caminho, encoding="utf-8")
+    destino = None
+    if respostas == "-":
+        destino = sys.stdout
+    elif respostas:
+        destino = open(respostas, "w", encoding="utf-8")
+    try:
+        saida = None if destino is None else (lambda r: destino.write(r + "\n"))
+        ini = time.perf_counter()
+        tempos = executar_script(entrada, saida, antes=lambda: _verificar_dados(None))
+        segundos = time.perf_counter() - ini
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if destino not in (None, sys.stdout):
+            destino.close()
+    _imprimir_tempos(tempos, segundos)
+
 if __name__ == "__main__":
+    args = _argumentos()
+    ARQ_DADOS = args.dados
+    if args.stats:
+        Instrumentacao.ativar()
+    if args.vigiar is not None:
+        VIGIA = VigiaDeDados(args.vigiar)
     try:
-        main()
+        if args.script:
+            main_script(args.script, args.respostas)
+        else:
+            main()
+        if Instrumentacao.ativa:
+            Instrumentacao.salvar_json(ARQ_ESTATISTICAS)
     except Exception as e:
         log_erro(f"Erro crítico: {e}")
         print("Erro crítico. Verifique logs/erros.log.")
+    finally:
+        REGISTRO_ERROS.fechar()
@@ -0,0 +1,107 @@
+# servidor.py
+"""
+Servidor TCP (asyncio) com as mesmas operações do menu, para vários clientes ao mesmo tempo.
+Todos os clientes compartilham o catálogo em memória carregado por main.carregar_dados().
+
+Protocolo de linhas (UTF-8): os comandos de SessaoDeComandos (envie AJUDA para a lista),
+um por linha. Resposta: "OK <n>" seguida de n linhas, ou uma linha "ERRO <mensagem>".
+O relatório é montado no laço de eventos, que é a única thread a ler e alterar placares e
+contadores (só as seções sujas são refeitas); a gravação do arquivo, lenta em catálogos
+grandes, roda em uma thread sobre as linhas já copiadas (ver SessaoDeComandos.preparar).
+Com --vigiar, alterações no arquivo de dados são lidas em uma thread e aplicadas no laço
+de eventos entre comandos, sem recarregar tudo (ver Streaming/vigia.py).
+Uso: python servidor.py [--host 127.0.0.1] [--porta 8765] [--dados config/dados.md]
+                        [--vigiar [segundos]]
+"""
+import argparse
+import asyncio
+import contextlib
+from pathlib import Path
+
+import main
+from Streaming.sessao import SessaoDeComandos
+from Streaming.vigia import VigiaDeDados, resumo_recarga
+
+
+async def _atender(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Atende um cliente até SAIR ou a conexão fechar."""
+    sessao = SessaoDeComandos()
+    loop = asyncio.get_running_loop()
+    try:
+        while not sessao.encerrada:
+            linha = await reader.readline()
+            if not linha:
+                break
+            texto = linha.decode("utf-8", "replace").strip()
+            if not texto:
+                continue
+            if sessao.lento(texto):
+                resposta = await loop.run_in_executor(None, sessao.preparar(texto))
+            else:
+                resposta = sessao.executar(texto)
+            writer.write(("\n".join(resposta) + "\n").encode("utf-8"))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def _vigiar(vigia: VigiaDeDados) -> None:
+    """Verifica o arquivo de dados a cada 'vigia.intervalo' segundos e aplica as alterações."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(vigia.intervalo)
+        if not vigia.mudou():
+            continue
+        try:
+            plano = await loop.run_in_executor(None, vigia.planejar)
+        except (OSError, UnicodeDecodeError) as e:
+            main.log_erro(f"Falha ao ler {main.ARQ_DADOS}: {e}")
+            continue
+        resumo = resumo_recarga(vigia.aplicar(plano))
+        if resumo:
+            print(f"Dados recarregados: {resumo}", flush=True)
+
+
+async def servir(host: str = "127.0.0.1", porta: int = 8765) -> None:
+    """Abre o servidor e atende até ser cancelado."""
+    servidor = await asyncio.start_server(_atender, host, porta)
+    endereco = servidor.sockets[0].getsockname()
+    print(f"Servindo em {endereco[0]}:{endereco[1]}", flush=True)
+    vigia = None
+    if main.VIGIA is not None:
+        vigia = asyncio.create_task(_vigiar(main.VIGIA))
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        if vigia is not None:
+            vigia.cancel()
+
+
+def main_servidor():
+    parser = argparse.ArgumentParser(description="Servidor TCP do sistema de streaming.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765, help="0 escolhe uma porta livre")
+    parser.add_argument("--dados", type=Path, default=main.ARQ_DADOS)
+    parser.add_argument("--vigiar", type=float, nargs="?", const=2.0, metavar="SEGUNDOS",
+                        help="aplica as alterações do arquivo de dados sem recarregar tudo")
+    args = parser.parse_args()
+
+    main.ARQ_DADOS = args.dados
+    if args.vigiar is not None:
+        main.VIGIA = VigiaDeDados(args.vigiar)
+    main.carregar_dados()
+    try:
+        asyncio.run(servir(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        main.REGISTRO_ERROS.fechar()
+
+
+if __name__ == "__main__":
+    main_servidor()
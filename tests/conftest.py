@@ -0,0 +1,19 @@
+# tests/conftest.py
+import pytest
+
+import main
+
+
+@pytest.fixture
+def dados(tmp_path, monkeypatch):
+    """Aponta main para um dados.md temporário; devolve uma função que escreve o arquivo."""
+    arq = tmp_path / "dados.md"
+    monkeypatch.setattr(main, "ARQ_DADOS", arq)
+    monkeypatch.setattr(main, "ARQ_LOG", tmp_path / "erros.log")
+    monkeypatch.setattr(main, "VIGIA", None)
+
+    def escrever(texto: str):
+        arq.write_text(texto, encoding="utf-8")
+        return arq
+    yield escrever
+    main.REGISTRO_ERROS.fechar()
@@ -0,0 +1,59 @@
+# tests/test_analises.py
+import pytest
+
+from Streaming.analises import Analises
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.placar import Placar
+from Streaming.playlist import Playlist
+from Streaming.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+def _por_ordenacao(musicas, n):
+    return sorted(musicas, key=lambda m: (-m.reproducoes, m.titulo.lower()))[:n]
+
+
+def test_top_com_empates_igual_a_ordenacao_completa():
+    musicas = [Musica(t, 100, "X", "Rock", r) for t, r in
+               [("b", 3), ("A", 3), ("c", 5), ("a", 3), ("D", 0), ("B", 3)]]
+    for n in range(8):
+        assert list(map(id, Analises.top_musicas_reproduzidas(musicas, n))) == \
+            list(map(id, _por_ordenacao(musicas, n)))
+    # mesmo título (sem caixa): fica a ordem da lista (posição por identidade: "A" == "a")
+    posicao = {id(m): i for i, m in enumerate(musicas)}
+    assert [posicao[id(m)] for m in Analises.top_musicas_reproduzidas(musicas, 5)] == [2, 1, 3, 0, 5]
+
+
+def test_placar_ao_vivo_acompanha_reproducoes_com_empates(monkeypatch):
+    placar = Placar(lambda m: (-m.reproducoes, m.titulo.lower()), capacidade=3)
+    monkeypatch.setattr(ArquivoDeMidia, "placares", [placar])
+    musicas = [Musica(t, 100, "X", "Rock") for t in ("d", "C", "b", "A", "e")]
+    for m in musicas:
+        placar.acompanhar(m)
+    assert placar.top(3) == _por_ordenacao(musicas, 3)
+
+    for i in (4, 4, 0, 2, 0, 4, 2, 1, 1):
+        musicas[i].reproduzir(None)
+        assert list(map(id, placar.top(3))) == list(map(id, _por_ordenacao(musicas, 3)))
+    assert len(placar) == 5 and placar.top(10) == placar.top(3)
+
+
+def test_mais_popular_e_mais_ativo_desempatam_pelo_nome():
+    u1, u2 = Usuario("bia"), Usuario("Ana")
+    p1, p2, p3 = Playlist("b", u1), Playlist("C", u1), Playlist("a", u2)
+    p1.reproducoes = p2.reproducoes = p3.reproducoes = 2
+    assert Analises.playlist_mais_popular([p1, p2, p3]) is p2
+
+    placar = Placar(lambda p: (p.reproducoes, p.nome.lower()), capacidade=1, maior_melhor=True)
+    for p in (p3, p1, p2):
+        placar.acompanhar(p)
+    assert placar.melhor() is p2
+    assert Analises.usuario_mais_ativo([u2, u1]) is u1
+    assert Analises.playlist_mais_popular([]) is None and Analises.top_musicas_reproduzidas([], 3) == []
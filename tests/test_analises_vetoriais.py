@@ -0,0 +1,100 @@
+# tests/test_analises_vetoriais.py
+import pytest
+
+from Streaming.analises import Analises
+from Streaming.analises_vetoriais import AnalisesVetoriais, ColunasDeMusicas, np
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.colunas import MusicaColunar, limpar_lojas
+from Streaming.musica import Musica
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="NumPy não instalado"))]
+
+# (título, duração, artista, gênero, reproduções, notas): empates de reproduções,
+# títulos que só diferem na caixa e um título repetido (desempate pela posição)
+DADOS = [
+    ("beta", 300, "Ana", "Rock", 5, [5, 3]),
+    ("Alfa", 100, "Bia", "Pop", 5, []),
+    ("Gama", 400, "Ana", "Rock", 9, [0]),
+    ("alfa", 200, "Caio", "Jazz", 5, [4, 4, 1]),
+    ("Delta", 250, "Bia", "Pop", 0, []),
+    ("Alfa", 150, "Duda", "Rock", 5, [2]),
+]
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    limpar_lojas()
+    AnalisesVetoriais._ultima = None
+    yield
+    ArquivoDeMidia.limpar_registro()
+    limpar_lojas()
+    AnalisesVetoriais._ultima = None
+    AnalisesVetoriais.usar_numpy = np is not None
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda b: "numpy" if b else "python")
+def backend(request):
+    AnalisesVetoriais.usar_numpy = request.param
+
+
+@pytest.fixture(params=[Musica, MusicaColunar], ids=lambda c: c.__name__)
+def musicas(request):
+    lista = []
+    for titulo, duracao, artista, genero, rep, notas in DADOS:
+        m = request.param(titulo, duracao, artista, genero, rep)
+        for n in notas:
+            m.avaliar(n)
+        lista.append(m)
+    return lista
+
+
+@pytest.mark.parametrize("top_n", [0, 1, 3, 5, 6, 10])
+def test_top_igual_a_analises(backend, musicas, top_n):
+    esperado = Analises.top_musicas_reproduzidas(musicas, top_n)
+    # compara por identidade: músicas de mesmo título e artista seriam iguais por ==
+    assert list(map(id, AnalisesVetoriais.top_musicas_reproduzidas(musicas, top_n))) == list(map(id, esperado))
+
+
+def test_empates_seguem_titulo_e_posicao(backend, musicas):
+    top = AnalisesVetoriais.top_musicas_reproduzidas(musicas, 5)
+    assert [musicas.index(m) for m in top] == [2, 1, 3, 5, 0]
+
+
+def test_medias_e_total_iguais_a_analises(backend, musicas):
+    assert AnalisesVetoriais.media_avaliacoes(musicas) == Analises.media_avaliacoes(musicas)
+    assert AnalisesVetoriais.total_reproducoes(musicas) == 29
+    assert AnalisesVetoriais.total_reproducoes() == Analises.total_reproducoes([]) == 29
+
+
+def test_relatorios_extras(backend, musicas):
+    assert AnalisesVetoriais.reproducoes_por_genero(musicas) == {"Rock": 19, "Pop": 5, "Jazz": 5}
+    assert AnalisesVetoriais.reproducoes_por_artista(musicas) == {"Ana": 14, "Bia": 5, "Caio": 5, "Duda": 5}
+    assert AnalisesVetoriais.percentis_duracao(musicas, (0, 50, 90, 100)) == \
+        {0: 100.0, 50: 225.0, 90: 350.0, 100: 400.0}
+    assert AnalisesVetoriais.distribuicao_avaliacoes(musicas) == [1, 1, 1, 1, 2, 1]
+
+
+def test_lista_vazia(backend):
+    for vazia in ([], None, ColunasDeMusicas([])):
+        assert AnalisesVetoriais.top_musicas_reproduzidas(vazia, 3) == Analises.top_musicas_reproduzidas([], 3) == []
+        assert AnalisesVetoriais.media_avaliacoes(vazia) == Analises.media_avaliacoes([]) == {}
+        assert AnalisesVetoriais.total_reproducoes(vazia or []) == 0
+        assert AnalisesVetoriais.reproducoes_por_genero(vazia) == {}
+        assert AnalisesVetoriais.reproducoes_por_artista(vazia) == {}
+        assert AnalisesVetoriais.percentis_duracao(vazia) == {}
+        assert AnalisesVetoriais.distribuicao_avaliacoes(vazia) == [0] * 6
+
+
+def test_colunas_colunares_reaproveitadas_e_atuais(backend):
+    musicas = [MusicaColunar(f"M{i}", 100 + i, "X", "Rock", i) for i in range(3)]
+    col = AnalisesVetoriais.colunas(musicas)
+    assert AnalisesVetoriais.colunas(list(musicas)) is col
+    assert AnalisesVetoriais.colunas(musicas[::-1]) is not col
+
+    musicas[0].reproducoes += 10
+    assert AnalisesVetoriais.top_musicas_reproduzidas(musicas, 1) == [musicas[0]]
+    assert AnalisesVetoriais.total_reproducoes(col) == 13
+
+    limpar_lojas()
+    assert AnalisesVetoriais.colunas(musicas) is not col
@@ -0,0 +1,86 @@
+# tests/test_busca.py
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+def test_erro_de_digitacao_em_titulo_com_varias_palavras():
+    br = Musica("Bohemian Rhapsody", 354, "Queen", "Rock")
+    Musica("Imagine", 183, "John Lennon", "Rock")
+    assert ArquivoDeMidia.sugerir("bohemain") == [br]
+    assert ArquivoDeMidia.sugerir("rapsody") == [br]
+    assert ArquivoDeMidia.sugerir("bohemain rapsody")[0] is br
+
+
+def test_empate_prefere_titulo_mais_curto():
+    longa = Musica("Love Song Extended Remix", 300, "A", "Pop")
+    curta = Musica("Love Song", 200, "B", "Pop")
+    assert ArquivoDeMidia.sugerir("lvoe song")[:2] == [curta, longa]
+
+
+def test_remocoes_compactam_o_indice():
+    busca = ArquivoDeMidia.catalogo.busca
+    musicas = [Musica(f"Faixa {i}", 100, f"Banda {i}", "Rock") for i in range(3000)]
+    busca.preparar()
+    assert len(busca._titulos) == 3000
+
+    ArquivoDeMidia.remover_do_registro(musicas[:2000])
+    busca.preparar()
+    assert len(busca._titulos) < 2000 and len(busca) == 1000
+    assert not set(map(id, ArquivoDeMidia.sugerir("faixa 10"))) & set(map(id, musicas[:2000]))
+    assert ArquivoDeMidia.sugerir("faixa 2999") == [musicas[2999]]
+    assert ArquivoDeMidia.sugerir("bnada 2500")[0] is musicas[2500]
+
+
+def test_indexacao_em_segundo_plano():
+    busca = ArquivoDeMidia.catalogo.busca
+    imagine = Musica("Imagine", 183, "John Lennon", "Rock")
+    thread = busca.preparar_em_segundo_plano()
+    thread.join()
+    assert not busca._fila and busca.preparar_em_segundo_plano() is None
+    assert ArquivoDeMidia.sugerir("imagine") == [imagine]
+
+
+def test_titulos_iguais_e_palavras_de_um_so_titulo():
+    primeira = Musica("Yesterday", 125, "The Beatles", "Rock")
+    Musica("Imagine", 183, "John Lennon", "Rock")
+    segunda = Musica("Yesterday", 150, "Boyz II Men", "Pop")
+    assert ArquivoDeMidia.sugerir("yesterday") == [primeira, segunda]
+    assert ArquivoDeMidia.sugerir("imgaine")[0].titulo == "Imagine"   # palavra de um só título
+
+    terceira = Musica("Yesterday Once More", 230, "Carpenters", "Pop")  # "yesterday" passa a ter 3
+    assert ArquivoDeMidia.sugerir("yesterdya once")[0] is terceira
+    assert ArquivoDeMidia.sugerir("yesterday")[:2] == [primeira, segunda]
+
+
+def test_prefixo_de_titulo_vem_antes_de_prefixo_de_artista():
+    exata = Musica("Queen", 200, "Tributo", "Rock")
+    titulo = Musica("Queens", 300, "Banda", "Rock")
+    artista = Musica("Bohemian Rhapsody", 354, "Queen", "Rock")
+    Musica("Imagine", 183, "John Lennon", "Rock")
+    assert ArquivoDeMidia.sugerir("queen") == [exata, titulo, artista]
+    assert ArquivoDeMidia.sugerir("  QUE ", limite=2) == [exata, titulo]
+    assert ArquivoDeMidia.sugerir("") == [] and ArquivoDeMidia.sugerir("queen", limite=0) == []
+
+
+def test_empate_de_pontuacao_prefere_a_mais_reproduzida():
+    a = Musica("Song A", 100, "X", "Pop")
+    b = Musica("Song B", 100, "Y", "Pop", reproducoes=7)
+    assert ArquivoDeMidia.sugerir("song") == [b, a]
+
+
+def test_midia_renomeada_e_reindexada_pelo_catalogo():
+    m = Musica("Imagine", 183, "John Lennon", "Rock")
+    ArquivoDeMidia.catalogo.remover([m])
+    m.renomear("Imagine (Remaster)", "Lennon")
+    ArquivoDeMidia.catalogo.registrar(m)
+    assert ArquivoDeMidia.sugerir("imagine (rem") == [m] and ArquivoDeMidia.sugerir("remastr") == [m]
+    assert ArquivoDeMidia.sugerir("john") == [] and ArquivoDeMidia.sugerir("lennon") == [m]
@@ -0,0 +1,107 @@
+# tests/test_carga.py
+import marshal
+
+import main
+from Streaming import carga_paralela
+from Streaming.carga_paralela import registros_paralelos
+from Streaming.leitor import registros_sequenciais
+from Streaming.snapshot import VERSAO_SNAPSHOT, caminho_snapshot
+
+LINHAS = """
+# MÚSICAS
+- Imagine | 183 | John Lennon | Rock
+- As It Was | 168 | Harry Styles | Pop
+
+# PODCASTS
+- DevTalk | 3600 | Canal X | T1 | 1 | Ana
+
+# USUÁRIOS
+- Sofia
+"""
+
+
+def test_snapshot_de_outra_versao_e_ignorado(dados):
+    arq = dados(LINHAS)
+    main.carregar_dados(processos=1)
+    snap = caminho_snapshot(arq)
+    salvo = marshal.loads(snap.read_bytes())
+    assert salvo["versao"] == VERSAO_SNAPSHOT
+
+    # snapshot gravado por um leitor anterior, que não entendia o formato em linha
+    salvo.update(versao=VERSAO_SNAPSHOT - 1, musicas=[], podcasts=[], usuarios=[])
+    snap.write_bytes(marshal.dumps(salvo))
+    main.carregar_dados(processos=1)
+
+    assert [m.titulo for m in main.MUSICAS] == ["Imagine", "As It Was"]
+    assert [(p.titulo, p.host) for p in main.PODCASTS] == [("DevTalk", "Ana")]
+    assert [u.nome for u in main.USUARIOS] == ["Sofia"]
+
+
+def test_barra_vertical_em_valor_chave_valor(dados):
+    dados("""
+# Músicas
+- titulo: A | B
+    artista: Banda
+    genero: Rock
+    duracao: 200
+- titulo: C
+    artista: Banda
+    genero: Pop
+    duracao: 180
+""")
+    main.carregar_dados(processos=1)
+
+    assert [(m.titulo, m.duracao, m.artista, m.genero) for m in main.MUSICAS] == [
+        ("A | B", 200, "Banda", "Rock"), ("C", 180, "Banda", "Pop")]
+    assert list(registros_paralelos(main.ARQ_DADOS, 2, tam_bloco=16)["musicas"]) == \
+        list(registros_sequenciais(main.ARQ_DADOS, "musicas"))
+
+
+def _estado():
+    return ([(m.titulo, m.duracao, m.artista, m.genero) for m in main.MUSICAS],
+            [(p.titulo, p.duracao, p.host, p.temporada, p.episodio) for p in main.PODCASTS],
+            [u.nome for u in main.USUARIOS],
+            [(pl.usuario.nome, pl.nome, [m.titulo for m in pl.itens]) for pl in main.PLAYLISTS])
+
+
+def _mensagens(log):
+    # sem o carimbo de data/hora de cada linha
+    return [linha.partition("] ")[2] for linha in log.splitlines()]
+
+
+def test_carga_paralela_igual_a_sequencial(dados, monkeypatch):
+    musicas = "".join(f"- M{i % 40} | {100 + i} | Artista {i % 7} | Rock\n" for i in range(120))
+    arq = dados(LINHAS.replace("- As It Was", musicas + "- Ruim | x | A | B\n- As It Was") + """
+---
+# Playlists
+- nome: Mix
+    usuario: Sofia
+    itens: [M1, Imagine, M1, Nada]
+- nome: mix
+    usuario: sofia
+    itens: [M2]
+""")
+    monkeypatch.setattr(carga_paralela, "TAM_BLOCO_PARALELO", 64)
+    assert len(carga_paralela.planejar_blocos(arq, 64)) > 10
+
+    main.carregar_dados(processos=1)
+    sequencial = _estado()
+    main.REGISTRO_ERROS.fechar()
+    erros = main.ARQ_LOG.read_text(encoding="utf-8")
+    caminho_snapshot(arq).unlink()
+    main.ARQ_LOG.unlink()
+
+    main.carregar_dados(processos=2)
+    main.REGISTRO_ERROS.fechar()
+    assert _estado() == sequencial and len(sequencial[0]) == 42
+    assert _mensagens(main.ARQ_LOG.read_text(encoding="utf-8")) == _mensagens(erros)
+    assert len(_mensagens(erros)) == 4
+
+
+def test_blocos_comecam_em_itens_e_cobrem_as_secoes(dados):
+    arq = dados(LINHAS)
+    tarefas = carga_paralela.planejar_blocos(arq, 8)
+    texto = arq.read_bytes()
+    assert [t for t, *_ in tarefas] == ["musicas", "musicas", "podcasts", "usuarios"]
+    for (_, ini, fim), (_, prox, _) in zip(tarefas, tarefas[1:]):
+        assert texto[ini:fim].lstrip().startswith(b"- ") and fim <= prox
@@ -0,0 +1,46 @@
+# tests/test_catalogo.py
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.podcast import Podcast
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+def test_busca_normaliza_caixa_e_espacos():
+    m = Musica("Bohemian  Rhapsody", 354, "Queen", "Rock")
+    p = Podcast("Dev Talk", 3600, "Ana", "T1", 1)
+    assert ArquivoDeMidia.buscar_por_titulo("  bohemian rhapsody ") is m
+    assert ArquivoDeMidia.buscar_por_titulo("DEV   TALK") is p
+    assert ArquivoDeMidia.buscar_por_titulo("Bohemian") is None
+    assert "dev talk" in ArquivoDeMidia.catalogo and "Imagine" not in ArquivoDeMidia.catalogo
+    assert ArquivoDeMidia.catalogo.buscar_por_artista("queen") == [m]
+    assert ArquivoDeMidia.catalogo.buscar_por_genero("ROCK") == [m]
+
+
+def test_titulo_repetido_fica_com_a_primeira_ate_ela_sair():
+    a = Musica("Imagine", 183, "John Lennon", "Rock")
+    b = Musica("imagine", 200, "Cover", "Pop")
+    c = Musica(" IMAGINE ", 190, "Outro", "Pop")
+    assert ArquivoDeMidia.buscar_por_titulo("Imagine") is a
+    assert list(ArquivoDeMidia.catalogo) == [a, b, c]
+
+    ArquivoDeMidia.remover_do_registro([a])
+    assert ArquivoDeMidia.buscar_por_titulo("Imagine") is b
+    assert ArquivoDeMidia.catalogo.buscar_por_genero("rock") == []
+    ArquivoDeMidia.remover_do_registro([b, c])
+    assert ArquivoDeMidia.buscar_por_titulo("Imagine") is None and len(ArquivoDeMidia.catalogo) == 0
+
+
+def test_remover_outra_midia_do_titulo_mantem_a_vencedora():
+    a = Musica("Imagine", 183, "John Lennon", "Rock")
+    b = Musica("Imagine", 200, "Cover", "Pop")
+    ArquivoDeMidia.remover_do_registro([b])
+    assert ArquivoDeMidia.buscar_por_titulo("imagine") is a
+    assert ArquivoDeMidia.catalogo.buscar_por_artista("cover") == []
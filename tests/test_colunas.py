@@ -0,0 +1,63 @@
+# tests/test_colunas.py
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.colunas import MusicaColunar, PodcastColunar, limpar_lojas
+from Streaming.musica import Musica
+from Streaming.podcast import Podcast
+
+
+@pytest.fixture(autouse=True)
+def lojas_vazias():
+    ArquivoDeMidia.limpar_registro()
+    limpar_lojas()
+    yield
+    ArquivoDeMidia.limpar_registro()
+    limpar_lojas()
+
+
+def _slots(classe) -> set[str]:
+    return {s for c in classe.__mro__ for s in getattr(c, "__slots__", ())}
+
+
+def test_visoes_guardam_so_a_linha():
+    assert _slots(MusicaColunar) == _slots(PodcastColunar) == {"_linha"}
+    m = MusicaColunar("Imagine", 183, "John Lennon", "Rock")
+    p = PodcastColunar("DevTalk", 3600, "Ana", "T1", 1)
+    assert isinstance(m, Musica) and isinstance(p, Podcast)
+    assert isinstance(m, ArquivoDeMidia) and isinstance(p, ArquivoDeMidia)
+    assert (m.titulo, m.duracao, m.artista, m.genero) == ("Imagine", 183, "John Lennon", "Rock")
+    assert (p.titulo, p.host, p.temporada, p.episodio) == ("DevTalk", "Ana", "T1", 1)
+    assert m == Musica("imagine", 1, "john  lennon", "Pop") and hash(m) == hash(m.chave)
+
+
+def test_linhas_liberadas_sao_reaproveitadas():
+    loja = MusicaColunar._loja
+    a = MusicaColunar("A", 100, "X", "Rock")
+    b = MusicaColunar("B", 100, "X", "Rock")
+    ArquivoDeMidia.remover_do_registro([a])
+    ArquivoDeMidia.sugerir("a")     # o índice de busca solta as mídias removidas da fila
+    linha = a._linha
+    del a
+    assert len(loja) == 1
+
+    c = MusicaColunar("C", 200, "Y", "Pop")
+    assert c._linha == linha and len(loja.titulos) == 2
+    assert (c.titulo, c.duracao, c.artista, c.reproducoes, c.nota_min, c.histograma) == \
+        ("C", 200, "Y", 0, None, None)
+    assert b.titulo == "B"
+
+    with pytest.raises(ValueError):
+        MusicaColunar("D", -1, "Y", "Pop")
+    assert len(loja) == 2 and len(loja.titulos) == 3
+    assert MusicaColunar("E", 1, "Y", "Pop")._linha == 2
+
+
+def test_visao_antiga_nao_libera_linha_da_loja_nova():
+    antiga = PodcastColunar("P", 100, "H", "T1", 1)
+    limpar_lojas()
+    nova = PodcastColunar("Q", 100, "H", "T1", 1)
+    assert nova._linha == antiga._linha
+    del antiga
+    assert PodcastColunar("R", 100, "H", "T1", 1)._linha != nova._linha
+    assert nova.titulo == "Q"
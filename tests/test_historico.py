@@ -0,0 +1,59 @@
+# tests/test_historico.py
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.historico import HistoricoDeReproducao
+from Streaming.musica import Musica
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    HistoricoDeReproducao.limpar_codigos()
+    yield
+    ArquivoDeMidia.limpar_registro()
+    HistoricoDeReproducao.limpar_codigos()
+
+
+@pytest.fixture
+def midias():
+    return [Musica(f"M{i}", 100, "X", "Rock") for i in range(5)]
+
+
+def test_buffer_circular_guarda_as_ultimas_e_conta_todas(midias):
+    h = HistoricoDeReproducao(capacidade=3)
+    ouvidas = [midias[i] for i in (0, 1, 0, 2, 3, 0, 4)]
+    for i, m in enumerate(ouvidas):
+        h.append(m, instante=float(i))
+
+    assert len(h) == h.total == 7
+    assert list(h) == ouvidas[-3:] and h.recentes(2) == [midias[4], midias[0]]
+    assert h.contagem(midias[0]) == 3 and h.contagem(midias[1]) == 1
+    assert h.contagens() == {midias[0]: 3, midias[1]: 1, midias[2]: 1, midias[3]: 1, midias[4]: 1}
+    assert h.reproducoes_desde(5.0) == 2 and h.reproducoes_desde(0.0) == 3   # só o que está guardado
+    assert [HistoricoDeReproducao.midia(c) for c in h.codigos_recentes(3)] == ouvidas[-3:]
+
+
+@pytest.mark.parametrize("partes", [[7], [2, 5], [3, 1, 3], [1] * 7])
+def test_extend_igual_a_append_um_a_um(midias, partes):
+    ouvidas = [midias[i] for i in (0, 1, 0, 2, 3, 0, 4)]
+    um_a_um, em_lotes = HistoricoDeReproducao(4), HistoricoDeReproducao(4)
+    for m in ouvidas:
+        um_a_um.append(m, instante=1.0)
+    ini = 0
+    for n in partes:
+        em_lotes.extend(ouvidas[ini:ini + n], instante=1.0)
+        ini += n
+
+    assert list(em_lotes) == list(um_a_um) == ouvidas[-4:]
+    assert em_lotes.contagens() == um_a_um.contagens() and len(em_lotes) == 7
+    assert em_lotes.codigos_recentes(4) == um_a_um.codigos_recentes(4)
+
+
+def test_capacidade_zero_so_conta(midias):
+    h = HistoricoDeReproducao(capacidade=0)
+    h.append(midias[0])
+    h.extend(midias)
+    assert len(h) == 6 and list(h) == [] and h.contagem(midias[0]) == 2
+    with pytest.raises(ValueError):
+        HistoricoDeReproducao(capacidade=-1)
@@ -0,0 +1,62 @@
+# tests/test_leitor.py
+from Streaming.leitor import itens_da_secao, iter_itens_md, validar_item
+
+MISTO = """\
+Texto fora de seção é ignorado
+---
+# Músicas
+- titulo: Imagine
+    artista: John Lennon
+    duracao: 183
+- titulo: Yesterday
+    duracao: 125
+---
+# Podcasts
+- DevTalk | 3600 | Canal X | T1 | 1 | Ana
+  linha solta dentro da seção em linha
+- DadosCast|2800|PUCRS|T2|3
+# Usuários
+- nome: Sofia
+"""
+
+
+def test_secoes_chave_valor_e_em_linha_no_mesmo_arquivo():
+    assert list(iter_itens_md(MISTO.splitlines())) == [
+        ("Músicas", {"titulo": "Imagine", "artista": "John Lennon", "duracao": "183"}),
+        ("Músicas", {"titulo": "Yesterday", "duracao": "125"}),
+        ("Podcasts", ["DevTalk ", " 3600 ", " Canal X ", " T1 ", " 1 ", " Ana"]),
+        ("Podcasts", ["DadosCast", "2800", "PUCRS", "T2", "3"]),
+        ("Usuários", {"nome": "Sofia"}),
+    ]
+
+
+def test_itens_saem_conforme_as_linhas_sao_lidas():
+    lidas = []
+
+    def linhas():
+        for linha in MISTO.splitlines():
+            lidas.append(linha)
+            yield linha
+
+    itens = iter_itens_md(linhas(), alvos={"podcasts"})
+    titulo, item = next(itens)
+    assert (titulo, item[0]) == ("Podcasts", "DevTalk ")
+    assert len(lidas) < len(MISTO.splitlines())   # o resto do arquivo ainda não foi lido
+    assert [t for t, _ in itens] == ["Podcasts"]
+
+
+def test_itens_da_secao_aceita_titulos_alternativos(tmp_path):
+    arq = tmp_path / "dados.md"
+    arq.write_text(MISTO.replace("# Usuários", "# USUARIOS"), encoding="utf-8")
+    assert list(itens_da_secao(arq, "Usuários", "Usuarios")) == [{"nome": "Sofia"}]
+    assert list(itens_da_secao(arq, "Playlists")) == []
+
+
+def test_validacao_dos_dois_formatos_gera_o_mesmo_registro():
+    chave_valor = {"titulo": " Imagine ", "duracao": "183", "artista": "John Lennon", "genero": "Rock"}
+    em_linha = " Imagine | 183 | John Lennon | Rock".split("|")
+    assert validar_item("musicas", chave_valor) == validar_item("musicas", em_linha) == \
+        ("ok", "imagine", ("Imagine", 183, "John Lennon", "Rock"))
+    assert validar_item("musicas", ["Imagine", "183", "John Lennon"])[0] == "erro"
+    assert validar_item("playlists", ["Mix", "Ana"])[0] == "erro"
+    assert validar_item("usuarios", [" "]) is None
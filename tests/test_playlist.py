@@ -0,0 +1,129 @@
+# tests/test_playlist.py
+import pytest
+
+from Streaming.analises import Analises
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+def test_playlists_iguais_tem_o_mesmo_hash():
+    u = Usuario("ana")
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    p1, p2 = Playlist("P", u), Playlist("p", u)
+    for m in (a, b):
+        p1.adicionar_midia(m)
+    for m in (b, a):
+        p2.adicionar_midia(m)
+    assert p1 == p2 and hash(p1) == hash(p2) and len({p1, p2}) == 1
+    p2.remover_midia(a)
+    assert p1 != p2 and len({p1, p2}) == 2
+
+
+def test_duplicadas_agrupam_pela_impressao():
+    u = Usuario("ana")
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    p1, p2, p3 = Playlist("P", u), Playlist(" p ", u), Playlist("P", u)
+    for m in (a, b):
+        p1.adicionar_midia(m)
+    for m in (b, a):
+        p2.adicionar_midia(m)
+    p3.adicionar_midia(a)
+    assert p1 == p2 and p1.impressao() == p2.impressao() != p3.impressao()
+    assert Analises.playlists_duplicadas([p3, p1, p2]) == [[p1, p2]]
+
+    p1.remover_midia(b)
+    assert Analises.playlists_duplicadas([p3, p1, p2]) == [[p3, p1]]
+
+
+def test_leituras_nao_copiam_itens_compartilhados():
+    u = Usuario("ana")
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    p, q = Playlist("P", u), Playlist("Q", u)
+    p.adicionar_midia(a)
+    q.adicionar_midia(b)
+    soma = p + q
+    itens_p = p._itens
+
+    assert a in p and b not in p and p.contar(a) == 1
+    assert a in soma and b in soma and soma.contar(Musica("a", 1, "x", "Pop")) == 1
+    assert p._itens is itens_p and soma._rope is not None   # nada foi copiado
+
+    p.adicionar_midia(b)   # escrita: só agora p ganha itens próprios
+    assert p._itens is not itens_p and soma.contar(b) == 1 and list(soma) == [a, b]
+    soma.remover_midia(a)
+    assert a not in soma and list(soma) == [b] and list(p) == [a, b]
+
+
+def test_chave_calculada_uma_vez_e_trocada_so_ao_renomear():
+    m = Musica("  Imagine ", 183, "John  Lennon", "Rock")
+    chave = m.chave
+    assert chave == ("imagine", "john lennon") and m.chave is chave
+    m.renomear("Imagine (Remaster)", "John Lennon")
+    assert m.chave == ("imagine (remaster)", "john lennon")
+    assert m == Musica("imagine (REMASTER)", 200, "john lennon", "Pop") and hash(m) == hash(m.chave)
+
+
+def test_remover_tira_a_primeira_ocorrencia_igual():
+    u = Usuario("ana")
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    copia = Musica("a", 300, "x", "Pop")   # igual a 'a' pela chave
+    p = Playlist("P", u)
+    for m in (a, b, copia, a):
+        p.adicionar_midia(m)
+
+    assert p.contar(a) == 3 and Musica("A", 1, "Y", "Rock") not in p
+    p.remover_midia(Musica("A", 1, "X", "Rock"))
+    assert p.itens == (b, copia, a) and p.itens[1] is copia
+    p.remover_midia(a)
+    p.remover_midia(a)
+    assert a not in p and list(p) == [b] and len(p) == 1
+    with pytest.raises(ValueError):
+        p.remover_midia(a)
+    with pytest.raises(ValueError):
+        p.remover_midia("A")
+
+
+def test_concatenacao_preguicosa_com_copia_na_escrita():
+    u = Usuario("ana")
+    a, b, c = (Musica(t, 100, "X", "Rock") for t in "ABC")
+    p, q, r = Playlist("P", u), Playlist("Q", u), Playlist("R", u)
+    p.adicionar_midia(a)
+    q.adicionar_midia(b)
+    r.adicionar_midia(c)
+    p.reproducoes, q.reproducoes = 2, 3
+
+    pq = p + q
+    pqr = pq + r
+    assert pq.nome == "P" and pq.reproducoes == 5 and pq.usuario is u
+    assert list(pqr) == [a, b, c] and len(pqr) == 3 and pqr[1] is b and pqr.itens[-1] is c
+
+    p.adicionar_midia(c)   # editar a origem não muda as concatenações
+    q.remover_midia(b)
+    assert list(pq) == [a, b] and list(pqr) == [a, b, c]
+    pq.adicionar_midia(a)  # nem editar a concatenação muda as origens
+    assert list(pq) == [a, b, a] and list(p) == [a, c] and list(q) == [] and list(pqr) == [a, b, c]
+    igual = Playlist("p", u)
+    for m in (c, a, b):
+        igual.adicionar_midia(m)
+    assert pqr == igual and hash(pqr) == hash(igual)
+
+
+def test_concatenacoes_encadeadas_sem_recursao():
+    u = Usuario("ana")
+    m = Musica("A", 100, "X", "Rock")
+    base = Playlist("P", u)
+    base.adicionar_midia(m)
+    soma = base
+    for _ in range(5000):
+        soma = soma + base
+    assert len(soma) == 5001 and soma.contar(m) == 5001
+    assert sum(1 for _ in soma) == 5001 and soma.ultimas(2) == [m, m]
@@ -0,0 +1,180 @@
+# tests/test_recarga.py
+import random
+
+import pytest
+
+import main
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.snapshot import caminho_snapshot
+from Streaming.vigia import VigiaDeDados, resumo_recarga
+
+DADOS = """
+# Usuários
+- nome: Ana
+
+# Músicas
+- titulo: Imagine
+    artista: John Lennon
+    genero: Rock
+    duracao: 183
+- titulo: Yesterday
+    artista: The Beatles
+    genero: Rock
+    duracao: 125
+"""
+
+
+@pytest.mark.parametrize("colunar", [False, True])
+def test_renomear_artista_mantem_historico_e_recomendacoes(dados, monkeypatch, colunar):
+    arq = dados(DADOS)
+    monkeypatch.setattr(main, "ARMAZENAMENTO_COLUNAR", colunar)
+    monkeypatch.setattr(main, "VIGIA", VigiaDeDados(0))
+    main.carregar_dados(processos=1)
+    imagine = ArquivoDeMidia.buscar_por_titulo("Imagine")
+    yesterday = ArquivoDeMidia.buscar_por_titulo("Yesterday")
+    ana = main.encontrar_usuario("Ana")
+    ana.ouvir_midia(imagine, None)
+    ana.ouvir_midia(yesterday, None)
+    similares = main.RECOMENDADOR.similares(imagine)
+
+    arq.write_text(DADOS.replace("John Lennon", "Lennon"), encoding="utf-8")
+    main.VIGIA.verificar()
+
+    assert ArquivoDeMidia.buscar_por_titulo("Imagine") is imagine
+    assert imagine.artista == "Lennon"
+    assert ana.historico.contagem(imagine) == 1
+    assert main.RECOMENDADOR.similares(imagine) == similares
+    assert [m for m, _ in main.RECOMENDADOR.similares(yesterday)] == [imagine]
+
+    ana.ouvir_midia(imagine, None)
+    assert ana.historico.contagem(imagine) == 2
+    assert imagine not in [m for m, _ in main.RECOMENDADOR.similares(imagine)]
+
+
+def test_renomear_playlist_atualiza_placar(dados, monkeypatch):
+    texto = DADOS + """
+# Playlists
+- nome: Mix  Z
+    usuario: Ana
+    itens: [Imagine]
+- nome: Mix Y
+    usuario: Ana
+    itens: [Yesterday]
+"""
+    arq = dados(texto)
+    monkeypatch.setattr(main, "VIGIA", VigiaDeDados(0))
+    main.carregar_dados(processos=1)
+    assert main.PLACAR_PLAYLISTS.melhor().nome == "Mix Y"   # empate: maior nome
+
+    # mesmo nome normalizado (mesma playlist), mas agora "Mix Z" > "Mix Y" no desempate
+    arq.write_text(texto.replace("Mix  Z", "Mix Z"), encoding="utf-8")
+    main.VIGIA.verificar()
+
+    assert sorted(pl.nome for pl in main.PLAYLISTS) == ["Mix Y", "Mix Z"]
+    assert main.PLACAR_PLAYLISTS.melhor().nome == "Mix Z"
+    assert "Mix Z" in main.montar_relatorio()
+
+
+def test_renomear_usuario_atualiza_placar(dados, monkeypatch):
+    texto = """
+# Usuários
+- Ana  Zeca
+- Ana Y
+"""
+    arq = dados(texto)
+    monkeypatch.setattr(main, "VIGIA", VigiaDeDados(0))
+    main.carregar_dados(processos=1)
+    assert main.PLACAR_USUARIOS.melhor().nome == "Ana Y"   # empate: maior nome
+
+    arq.write_text(texto.replace("Ana  Zeca", "Ana Zeca"), encoding="utf-8")
+    assert resumo_recarga(main.VIGIA.recarregar()) == "usuarios +0 ~1 -0"
+    assert main.PLACAR_USUARIOS.melhor().nome == "Ana Zeca"
+    assert "Ana Zeca" in main.montar_relatorio()
+
+
+DUPLICADAS = """
+# Músicas
+- Imagine | 183 | John Lennon | Rock
+- Imagine | 100 | Outro | Pop
+- Yesterday | 125 | The Beatles | Rock
+"""
+
+
+def _estado():
+    return (sorted((m.titulo, m.duracao, m.artista, m.genero) for m in main.MUSICAS),
+            sorted((p.titulo, p.duracao, p.host, p.temporada, p.episodio) for p in main.PODCASTS),
+            sorted(u.nome for u in main.USUARIOS),
+            sorted((pl.usuario.nome, pl.nome, tuple(m.titulo for m in pl.itens)) for pl in main.PLAYLISTS),
+            sorted((m.titulo, m.artista) for m in ArquivoDeMidia.registroMidia))
+
+
+def _carga_completa(arq):
+    main.VIGIA = None
+    caminho_snapshot(arq).unlink(missing_ok=True)
+    main.carregar_dados(processos=1)
+    return _estado()
+
+
+def test_remover_primeira_duplicada_promove_a_seguinte(dados, monkeypatch):
+    arq = dados(DUPLICADAS)
+    monkeypatch.setattr(main, "VIGIA", VigiaDeDados(0))
+    main.carregar_dados(processos=1)
+    imagine = ArquivoDeMidia.buscar_por_titulo("Imagine")
+    assert (imagine.artista, imagine.duracao) == ("John Lennon", 183)
+
+    arq.write_text(DUPLICADAS.replace("- Imagine | 183 | John Lennon | Rock\n", ""), encoding="utf-8")
+    assert resumo_recarga(main.VIGIA.recarregar()) == "musicas +0 ~1 -0"
+    assert ArquivoDeMidia.buscar_por_titulo("Imagine") is imagine
+    assert (imagine.artista, imagine.duracao, imagine.genero) == ("Outro", 100, "Pop")
+    recarga = _estado()
+    assert recarga == _carga_completa(arq)
+
+
+def _linhas_aleatorias(rnd):
+    titulos = ["Imagine", "imagine", "Help", "Hey  Jude", "Hey Jude", "Yesterday"]
+    return {
+        "Músicas": [f"- {rnd.choice(titulos)} | {rnd.randint(0, 300)} | {rnd.choice('ABC')} | Rock"
+                    for _ in range(8)],
+        "Podcasts": [f"- {rnd.choice(['Dev', 'dev', 'Pod'])} | {rnd.randint(1, 9)} | {rnd.choice('XY')} | T1 | 1"
+                     for _ in range(4)],
+        "Usuários": [f"- {rnd.choice(['Ana', 'ana', 'Bia', 'Ana  Maria'])}" for _ in range(4)],
+        "Playlists": [f"- nome: {rnd.choice(['Mix', 'mix', 'Top'])}\n    usuario: {rnd.choice(['Ana', 'Bia'])}\n"
+                      f"    itens: [{rnd.choice(titulos)}, {rnd.choice(titulos)}, Dev]" for _ in range(4)],
+    }
+
+
+def _texto(secoes):
+    return "".join(f"\n# {nome}\n" + "\n".join(linhas) + "\n" for nome, linhas in secoes.items())
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_recargas_com_duplicadas_igualam_a_carga_completa(dados, monkeypatch, semente):
+    rnd = random.Random(semente)
+    secoes = _linhas_aleatorias(rnd)
+    arq = dados(_texto(secoes))
+    monkeypatch.setattr(main, "VIGIA", VigiaDeDados(0))
+    main.carregar_dados(processos=1)
+    vigia = main.VIGIA
+
+    textos, estados = [], []
+    for _ in range(40):
+        novas = _linhas_aleatorias(rnd)
+        for nome, linhas in secoes.items():
+            op = rnd.choice(["remover", "inserir", "trocar", "mover"])
+            i = rnd.randrange(len(linhas)) if linhas else 0
+            if op == "remover" and linhas:
+                del linhas[i]
+            elif op == "inserir":
+                linhas.insert(i, novas[nome][0])
+            elif op == "trocar" and linhas:
+                linhas[i] = novas[nome][0]
+            elif linhas:
+                linhas.insert(rnd.randrange(len(linhas)), linhas.pop(i))
+        textos.append(_texto(secoes))
+        arq.write_text(textos[-1], encoding="utf-8")
+        vigia.recarregar()
+        estados.append(_estado())
+
+    for texto, estado in zip(textos, estados):
+        arq.write_text(texto, encoding="utf-8")
+        assert estado == _carga_completa(arq)
@@ -0,0 +1,109 @@
+# tests/test_recomendacao.py
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.historico import HistoricoDeReproducao
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.recomendacao import Recomendador
+from Streaming.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    HistoricoDeReproducao.limpar_codigos()
+    yield
+    ArquivoDeMidia.limpar_registro()
+    HistoricoDeReproducao.limpar_codigos()
+
+
+@pytest.fixture
+def instalar(monkeypatch):
+    def instalar(**opcoes):
+        r = Recomendador(**opcoes)
+        monkeypatch.setattr(Playlist, "recomendador", r)
+        monkeypatch.setattr(Usuario, "recomendador", r)
+        return r
+    return instalar
+
+
+@pytest.fixture
+def midias():
+    return [Musica(f"M{i}", 100, "X", "Rock") for i in range(6)]
+
+
+def test_playlist_e_historico_somam_pesos_dentro_da_janela(instalar, midias):
+    r = instalar(janela_historico=2, janela_playlist=2, peso_playlist=3)
+    p = Playlist("P", Usuario("ana"))
+    for i in (0, 1, 2):
+        p.adicionar_midia(midias[i])
+    # M2 co-ocorre com as 2 últimas da playlist (M1, M0), com o peso da playlist
+    assert r.similares(midias[1]) == [(midias[0], 3), (midias[2], 3)]
+    assert r.similares(midias[2], k=1) == [(midias[1], 3)]
+
+    u = Usuario("bia")
+    for i in (3, 4, 5, 0):
+        u.ouvir_midia(midias[i], None)
+    # M0 só co-ocorre com as 2 ouvidas antes dela (M4, M5), com peso 1
+    assert dict(r.similares(midias[0])) == {midias[1]: 3, midias[2]: 3, midias[4]: 1, midias[5]: 1}
+    assert dict(r.similares(midias[3])) == {midias[4]: 1, midias[5]: 1}
+    assert r.pares == 2 * 8 and len(r) == 6
+
+
+def test_para_usuario_explica_e_nao_repete_as_recentes(instalar, midias):
+    r = instalar(janela_historico=2)
+    p = Playlist("P", Usuario("ana"))
+    for i in (0, 1, 2):
+        p.adicionar_midia(midias[i])
+    p2 = Playlist("Q", Usuario("ana"))
+    for i in (3, 4):
+        p2.adicionar_midia(midias[i])
+
+    u = Usuario("bia")
+    u.ouvir_midia(midias[0], None)
+    u.ouvir_midia(midias[3], None)
+    # M3 (mais recente) pesa o dobro de M0; M0 e M3 já ouvidas não são sugeridas
+    assert r.para_usuario(u) == [(midias[4], midias[3]), (midias[1], midias[0]), (midias[2], midias[0])]
+    assert r.para_usuario(u, k=1) == [(midias[4], midias[3])]
+    assert r.para_usuario(Usuario("cid")) == []
+
+
+def _ouvir(usuario, *midias):
+    for m in midias:
+        usuario.ouvir_midia(m, None)
+
+
+def test_poda_por_midia_e_global_respeitam_o_orcamento(instalar):
+    centro = Musica("Centro", 100, "X", "Rock")
+    outras = [Musica(f"O{i}", 100, "X", "Rock") for i in range(5)]
+
+    # cada mídia guarda até 2 * max_vizinhos; ao passar disso ficam as 'max_vizinhos' de maior peso
+    r = instalar(max_vizinhos=2, janela_playlist=100)
+    _ouvir(Usuario("ana"), outras[0], centro)
+    p = Playlist("P", Usuario("ana"))
+    for m in (outras[0], outras[1], centro):
+        p.adicionar_midia(m)
+    assert r.similares(centro, k=10) == [(outras[0], 3), (outras[1], 2)]
+    p = Playlist("Q", Usuario("ana"))
+    for m in (*outras[2:], centro):
+        p.adicionar_midia(m)
+    assert r.similares(centro, k=10) == [(outras[0], 3), (outras[1], 2)]
+    todas = (centro, *outras)
+    assert r.pares == sum(len(r.similares(m, k=10)) for m in todas)
+
+    # acima de max_pares, o corte sobe e poda os pares leves até caber em 3/4 do orçamento
+    r = instalar(max_pares=10, janela_playlist=100, peso_playlist=1)
+    _ouvir(Usuario("bia"), centro, outras[0], centro)
+    p = Playlist("R", Usuario("bia"))
+    for m in outras[1:]:
+        p.adicionar_midia(m)
+    assert (r.podas, r.corte, r.pares) == (1, 1, 2)
+    assert r.similares(centro) == [(outras[0], 2)] and r.similares(outras[4]) == []
+
+    r.limpar()
+    assert len(r) == 0 and r.pares == r.corte == r.podas == 0
+    with pytest.raises(ValueError):
+        Recomendador(max_pares=0)
+    with pytest.raises(ValueError):
+        Recomendador(max_vizinhos=-1)
@@ -0,0 +1,97 @@
+# tests/test_relatorio.py
+from collections import Counter
+
+import pytest
+
+import main
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.playlist import Playlist
+from Streaming.relatorio import RelatorioIncremental
+from Streaming.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+@pytest.fixture
+def relatorio():
+    """Relatório com uma seção por evento; 'calculos' conta quantas vezes cada uma foi refeita."""
+    musicas = []
+    rel = RelatorioIncremental((musicas,))
+    calculos = Counter()
+
+    def secao(nome, eventos):
+        def calcular():
+            calculos[nome] += 1
+            return [f"{nome} {calculos[nome]}"]
+        rel.secao(nome, calcular, eventos)
+
+    for evento in ("reproducao", "playlist", "usuario", "avaliacao", "colecoes"):
+        secao(evento, (evento,))
+    rel.texto()
+    calculos.clear()
+    return rel, musicas, calculos
+
+
+def test_so_as_secoes_sujas_sao_refeitas(relatorio):
+    rel, musicas, calculos = relatorio
+    m = Musica("A", 100, "X", "Rock")
+    u = Usuario("ana")
+    rel.texto()
+    assert calculos == Counter()   # nada mudou desde a última montagem
+
+    rel.atualizar(m)
+    rel.atualizar(Playlist("P", u))
+    rel.texto()
+    assert calculos == Counter({"reproducao": 1, "playlist": 1})
+
+    m.avaliar(4)
+    musicas.append(m)
+    rel.atualizar(u)
+    assert rel.texto().splitlines() == ["reproducao 1", "playlist 1", "usuario 1", "avaliacao 1", "colecoes 1"]
+    assert calculos == Counter({"reproducao": 1, "playlist": 1, "usuario": 1, "avaliacao": 1, "colecoes": 1})
+
+    rel.invalidar()
+    rel.texto()
+    assert sum(calculos.values()) == 10 and rel.recalculos == 15
+
+
+def test_escrever_em_blocos_igual_ao_texto(relatorio, tmp_path):
+    rel, _, _ = relatorio
+    rel.linhas_por_bloco = 2
+    rel.escrever(tmp_path / "sub" / "rel.txt")
+    assert (tmp_path / "sub" / "rel.txt").read_text(encoding="utf-8") == rel.texto()
+
+
+def test_relatorio_em_cache_igual_ao_recalculado(dados):
+    dados("""
+# Usuários
+- Ana
+- Bia
+
+# Músicas
+- Imagine | 183 | John Lennon | Rock
+- Yesterday | 125 | The Beatles | Rock
+
+# Playlists
+- nome: Mix
+    usuario: Ana
+    itens: [Imagine, Yesterday]
+""")
+    main.carregar_dados(processos=1)
+    main.RELATORIO.texto()
+    ana = main.encontrar_usuario("Ana")
+    ana.ouvir_midia(ArquivoDeMidia.buscar_por_titulo("Yesterday"), None)
+    main.PLAYLISTS[0].reproduzir(lambda linha: None)
+    ArquivoDeMidia.buscar_por_titulo("Imagine").avaliar(5)
+    main.MUSICAS.append(Musica("Nova", 100, "X", "Pop"))
+
+    em_cache = main.RELATORIO.texto()
+    main.RELATORIO.invalidar()
+    assert em_cache == main.RELATORIO.texto()
+    assert "- Mix (1 execuções)" in em_cache and "- Ana (1 reproduções)" in em_cache
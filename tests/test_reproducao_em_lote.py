@@ -0,0 +1,68 @@
+# tests/test_reproducao_em_lote.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.musica import Musica
+from Streaming.reproducao_concorrente import ReproducaoConcorrente
+from Streaming.reproducao_em_lote import ReproducaoEmLote
+from Streaming.usuario import Usuario
+
+
+@pytest.fixture(autouse=True)
+def registro_vazio():
+    ArquivoDeMidia.limpar_registro()
+    yield
+    ArquivoDeMidia.limpar_registro()
+
+
+def test_lote_concorrente_usa_os_contadores_fragmentados():
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    usuarios = [Usuario(f"u{i}") for i in range(4)]
+    lotes = [[(u, a), (u, b), (u, a)] for u in usuarios for _ in range(50)]
+
+    with ReproducaoConcorrente() as rc:
+        with ThreadPoolExecutor(4) as pool:
+            assert sum(pool.map(ReproducaoEmLote().executar, lotes)) == 600
+        assert (a.reproducoes, b.reproducoes) == (0, 0)   # ainda nos fragmentos
+        assert rc.reproducoes(a) == 400 and rc.reproducoes(b) == 200
+    assert ArquivoDeMidia.contadores.reproducoes == 600
+    assert all(len(u.historico) == 150 for u in usuarios)
+
+
+def _estado(midias, usuarios):
+    return ([m.reproducoes for m in midias], [list(u.historico) for u in usuarios],
+            ArquivoDeMidia.contadores.reproducoes)
+
+
+def test_lote_igual_a_ouvir_um_a_um_sem_escrever_no_terminal(capsys):
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    ana, bia = Usuario("ana"), Usuario("bia")
+    eventos = [(ana, a), (bia, b), (ana, b), (None, a), (ana, a)]
+    for usuario, midia in eventos:
+        if usuario is None:
+            midia.reproduzir(None)
+        else:
+            usuario.ouvir_midia(midia, None)
+    um_a_um = _estado((a, b), (ana, bia))
+
+    ArquivoDeMidia.limpar_registro()
+    a, b = Musica("A", 100, "X", "Rock"), Musica("B", 100, "X", "Rock")
+    ana, bia = Usuario("ana"), Usuario("bia")
+    lote = ReproducaoEmLote()
+    assert lote.executar([(ana, a), (bia, b), (ana, b), (None, a), (ana, a)]) == 5
+    assert _estado((a, b), (ana, bia)) == um_a_um
+    assert capsys.readouterr().out == "" and lote.reproducoes == 5 and lote.por_segundo > 0
+
+
+def test_lote_invalido_nao_altera_nada_e_saida_recebe_as_linhas():
+    a = Musica("A", 100, "X", "Rock")
+    ana = Usuario("ana")
+    with pytest.raises(ValueError):
+        ReproducaoEmLote().executar([(ana, a), (ana, "B")])
+    assert a.reproducoes == 0 and len(ana.historico) == 0
+
+    linhas = []
+    ReproducaoEmLote(linhas.append).executar([(ana, a), (None, a)])
+    assert linhas == [a.linha_reproducao()] * 2 and a.reproducoes == 2
@@ -0,0 +1,54 @@
+# tests/test_sessao.py
+import threading
+
+import main
+from Streaming.arquivo_de_midia import ArquivoDeMidia
+from Streaming.sessao import SessaoDeComandos
+
+DADOS = """
+# Usuários
+- nome: Ana
+
+# Músicas
+- titulo: Imagine
+    artista: John Lennon
+    genero: Rock
+    duracao: 183
+- titulo: Yesterday
+    artista: The Beatles
+    genero: Rock
+    duracao: 125
+"""
+
+
+def test_relatorio_preparado_le_o_estado_so_na_thread_do_chamador(dados, tmp_path, monkeypatch):
+    dados(DADOS)
+    arq_rel = tmp_path / "relatorio.txt"
+    monkeypatch.setattr(main, "ARQ_REL", arq_rel)
+    main.carregar_dados(processos=1)
+    sessao = SessaoDeComandos()
+
+    concluir = sessao.preparar("RELATORIO")
+    recalculos = main.RELATORIO.recalculos
+    assert not arq_rel.exists()
+
+    # alterações feitas depois do preparo não entram no relatório já montado
+    ArquivoDeMidia.buscar_por_titulo("Yesterday").reproduzir(None)
+    resposta = []
+    t = threading.Thread(target=lambda: resposta.extend(concluir()))
+    t.start()
+    t.join()
+
+    assert main.RELATORIO.recalculos == recalculos
+    assert resposta[0] == f"OK {len(resposta) - 1}"
+    assert arq_rel.read_text(encoding="utf-8") == "\n".join(resposta[1:])
+    assert main.RELATORIO.texto() != "\n".join(resposta[1:])
+
+
+def test_preparar_comando_sem_gravacao_responde_igual_a_executar(dados):
+    dados(DADOS)
+    main.carregar_dados(processos=1)
+    sessao = SessaoDeComandos()
+    assert sessao.preparar("ENTRAR Ana")() == SessaoDeComandos().executar("ENTRAR Ana")
+    assert sessao.usuario is main.encontrar_usuario("Ana")
+    assert sessao.preparar("RELATORIO extra")() == ["ERRO Argumentos inválidos para RELATORIO."]